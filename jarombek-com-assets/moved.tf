@@ -0,0 +1,1737 @@
+/**
+ * Moves the state of the hand-written aws_s3_object resources to the generated for_each resource in main.tf, so
+ * objects are not deleted and reuploaded.  Generated from the resources recorded in handwritten.json with
+ * 'python3 -m tools.terraform --moved ../jarombek-com-assets/handwritten.json'.
+ * Author: Andrew Jarombek
+ * Date: 10/18/2026
+ */
+
+moved {
+  from = aws_s3_object.database-er-png
+  to   = aws_s3_object.asset["Database-ER.png"]
+}
+
+moved {
+  from = aws_s3_object.mean-stack-png
+  to   = aws_s3_object.asset["MEAN-Stack.png"]
+}
+
+moved {
+  from = aws_s3_object.blizzard-png
+  to   = aws_s3_object.asset["blizzard.png"]
+}
+
+moved {
+  from = aws_s3_object.bulk-insert-png
+  to   = aws_s3_object.asset["bulk-insert.png"]
+}
+
+moved {
+  from = aws_s3_object.common-user-png
+  to   = aws_s3_object.asset["common-user.png"]
+}
+
+moved {
+  from = aws_s3_object.computer-jpg
+  to   = aws_s3_object.asset["computer.jpg"]
+}
+
+moved {
+  from = aws_s3_object.diamond-uml-png
+  to   = aws_s3_object.asset["diamond-uml.png"]
+}
+
+moved {
+  from = aws_s3_object.down-black-png
+  to   = aws_s3_object.asset["down-black.png"]
+}
+
+moved {
+  from = aws_s3_object.down-png
+  to   = aws_s3_object.asset["down.png"]
+}
+
+moved {
+  from = aws_s3_object.dynamic-jsx-png
+  to   = aws_s3_object.asset["dynamic-jsx.png"]
+}
+
+moved {
+  from = aws_s3_object.error-message-png
+  to   = aws_s3_object.asset["error-message.png"]
+}
+
+moved {
+  from = aws_s3_object.flag-svg
+  to   = aws_s3_object.asset["flag.svg"]
+}
+
+moved {
+  from = aws_s3_object.elegant-icons-eot
+  to   = aws_s3_object.asset["fonts/ElegantIcons.eot"]
+}
+
+moved {
+  from = aws_s3_object.elegant-icons-ttf
+  to   = aws_s3_object.asset["fonts/ElegantIcons.ttf"]
+}
+
+moved {
+  from = aws_s3_object.elegant-icons-woff
+  to   = aws_s3_object.asset["fonts/ElegantIcons.woff"]
+}
+
+moved {
+  from = aws_s3_object.fantasque-sans-mono-bold-ttf
+  to   = aws_s3_object.asset["fonts/FantasqueSansMono-Bold.ttf"]
+}
+
+moved {
+  from = aws_s3_object.longway-regular-otf
+  to   = aws_s3_object.asset["fonts/Longway-Regular.otf"]
+}
+
+moved {
+  from = aws_s3_object.sylexiad-sans-thin-bold-ttf
+  to   = aws_s3_object.asset["fonts/SylexiadSansThin-Bold.ttf"]
+}
+
+moved {
+  from = aws_s3_object.sylexiad-sans-thin-ttf
+  to   = aws_s3_object.asset["fonts/SylexiadSansThin.ttf"]
+}
+
+moved {
+  from = aws_s3_object.dyslexie-bold-ttf
+  to   = aws_s3_object.asset["fonts/dyslexie-bold.ttf"]
+}
+
+moved {
+  from = aws_s3_object.home-png
+  to   = aws_s3_object.asset["home.png"]
+}
+
+moved {
+  from = aws_s3_object.jarombek-home-background-jpg
+  to   = aws_s3_object.asset["jarombek-home-background.jpg"]
+}
+
+moved {
+  from = aws_s3_object.jarombek-png
+  to   = aws_s3_object.asset["jarombek.png"]
+}
+
+moved {
+  from = aws_s3_object.kayak-jpg
+  to   = aws_s3_object.asset["kayak.jpg"]
+}
+
+moved {
+  from = aws_s3_object.login-component-png
+  to   = aws_s3_object.asset["login-component.png"]
+}
+
+moved {
+  from = aws_s3_object.airflow-png
+  to   = aws_s3_object.asset["logos/airflow.png"]
+}
+
+moved {
+  from = aws_s3_object.android-png
+  to   = aws_s3_object.asset["logos/android.png"]
+}
+
+moved {
+  from = aws_s3_object.angular-png
+  to   = aws_s3_object.asset["logos/angular.png"]
+}
+
+moved {
+  from = aws_s3_object.ansible-png
+  to   = aws_s3_object.asset["logos/ansible.png"]
+}
+
+moved {
+  from = aws_s3_object.apache-spark-png
+  to   = aws_s3_object.asset["logos/apache-spark.png"]
+}
+
+moved {
+  from = aws_s3_object.apigateway-svg
+  to   = aws_s3_object.asset["logos/apigateway.svg"]
+}
+
+moved {
+  from = aws_s3_object.assembly-png
+  to   = aws_s3_object.asset["logos/assembly.png"]
+}
+
+moved {
+  from = aws_s3_object.aws-cloudfront-svg
+  to   = aws_s3_object.asset["logos/aws-cloudfront.svg"]
+}
+
+moved {
+  from = aws_s3_object.aws-cloudwatch-png
+  to   = aws_s3_object.asset["logos/aws-cloudwatch.png"]
+}
+
+moved {
+  from = aws_s3_object.aws-efs-png
+  to   = aws_s3_object.asset["logos/aws-efs.png"]
+}
+
+moved {
+  from = aws_s3_object.aws-iam-svg
+  to   = aws_s3_object.asset["logos/aws-iam.svg"]
+}
+
+moved {
+  from = aws_s3_object.aws-secrets-manager-png
+  to   = aws_s3_object.asset["logos/aws-secrets-manager.png"]
+}
+
+moved {
+  from = aws_s3_object.aws-vpc-endpoint-png
+  to   = aws_s3_object.asset["logos/aws-vpc-endpoint.png"]
+}
+
+moved {
+  from = aws_s3_object.aws-png
+  to   = aws_s3_object.asset["logos/aws.png"]
+}
+
+moved {
+  from = aws_s3_object.awslambda-png
+  to   = aws_s3_object.asset["logos/awslambda.png"]
+}
+
+moved {
+  from = aws_s3_object.awsrds-png
+  to   = aws_s3_object.asset["logos/awsrds.png"]
+}
+
+moved {
+  from = aws_s3_object.awss3-svg
+  to   = aws_s3_object.asset["logos/awss3.svg"]
+}
+
+moved {
+  from = aws_s3_object.babel-png
+  to   = aws_s3_object.asset["logos/babel.png"]
+}
+
+moved {
+  from = aws_s3_object.bash-png
+  to   = aws_s3_object.asset["logos/bash.png"]
+}
+
+moved {
+  from = aws_s3_object.batch-png
+  to   = aws_s3_object.asset["logos/batch.png"]
+}
+
+moved {
+  from = aws_s3_object.bazel-svg
+  to   = aws_s3_object.asset["logos/bazel.svg"]
+}
+
+moved {
+  from = aws_s3_object.bootstrap-png
+  to   = aws_s3_object.asset["logos/bootstrap.png"]
+}
+
+moved {
+  from = aws_s3_object.c-png
+  to   = aws_s3_object.asset["logos/c.png"]
+}
+
+moved {
+  from = aws_s3_object.cloudformation-png
+  to   = aws_s3_object.asset["logos/cloudformation.png"]
+}
+
+moved {
+  from = aws_s3_object.cpp-png
+  to   = aws_s3_object.asset["logos/cpp.png"]
+}
+
+moved {
+  from = aws_s3_object.csharp-png
+  to   = aws_s3_object.asset["logos/csharp.png"]
+}
+
+moved {
+  from = aws_s3_object.css-png
+  to   = aws_s3_object.asset["logos/css.png"]
+}
+
+moved {
+  from = aws_s3_object.cypress-png
+  to   = aws_s3_object.asset["logos/cypress.png"]
+}
+
+moved {
+  from = aws_s3_object.d3-png
+  to   = aws_s3_object.asset["logos/d3.png"]
+}
+
+moved {
+  from = aws_s3_object.databricks-png
+  to   = aws_s3_object.asset["logos/databricks.png"]
+}
+
+moved {
+  from = aws_s3_object.docker-compose-png
+  to   = aws_s3_object.asset["logos/docker-compose.png"]
+}
+
+moved {
+  from = aws_s3_object.docker-png
+  to   = aws_s3_object.asset["logos/docker.png"]
+}
+
+moved {
+  from = aws_s3_object.dotnetcore-png
+  to   = aws_s3_object.asset["logos/dotnetcore.png"]
+}
+
+moved {
+  from = aws_s3_object.dynamodb-png
+  to   = aws_s3_object.asset["logos/dynamodb.png"]
+}
+
+moved {
+  from = aws_s3_object.ec2-png
+  to   = aws_s3_object.asset["logos/ec2.png"]
+}
+
+moved {
+  from = aws_s3_object.eks-png
+  to   = aws_s3_object.asset["logos/eks.png"]
+}
+
+moved {
+  from = aws_s3_object.elasticsearch-png
+  to   = aws_s3_object.asset["logos/elasticsearch.png"]
+}
+
+moved {
+  from = aws_s3_object.elk-png
+  to   = aws_s3_object.asset["logos/elk.png"]
+}
+
+moved {
+  from = aws_s3_object.enzyme-png
+  to   = aws_s3_object.asset["logos/enzyme.png"]
+}
+
+moved {
+  from = aws_s3_object.es2017-png
+  to   = aws_s3_object.asset["logos/es2017.png"]
+}
+
+moved {
+  from = aws_s3_object.es6-png
+  to   = aws_s3_object.asset["logos/es6.png"]
+}
+
+moved {
+  from = aws_s3_object.eslint-svg
+  to   = aws_s3_object.asset["logos/eslint.svg"]
+}
+
+moved {
+  from = aws_s3_object.express-png
+  to   = aws_s3_object.asset["logos/express.png"]
+}
+
+moved {
+  from = aws_s3_object.flask-png
+  to   = aws_s3_object.asset["logos/flask.png"]
+}
+
+moved {
+  from = aws_s3_object.flux-png
+  to   = aws_s3_object.asset["logos/flux.png"]
+}
+
+moved {
+  from = aws_s3_object.github-actions-png
+  to   = aws_s3_object.asset["logos/github-actions.png"]
+}
+
+moved {
+  from = aws_s3_object.github-png
+  to   = aws_s3_object.asset["logos/github.png"]
+}
+
+moved {
+  from = aws_s3_object.go-png
+  to   = aws_s3_object.asset["logos/go.png"]
+}
+
+moved {
+  from = aws_s3_object.goland-png
+  to   = aws_s3_object.asset["logos/goland.png"]
+}
+
+moved {
+  from = aws_s3_object.graphql-png
+  to   = aws_s3_object.asset["logos/graphql.png"]
+}
+
+moved {
+  from = aws_s3_object.groovy-png
+  to   = aws_s3_object.asset["logos/groovy.png"]
+}
+
+moved {
+  from = aws_s3_object.gulp-svg
+  to   = aws_s3_object.asset["logos/gulp.svg"]
+}
+
+moved {
+  from = aws_s3_object.haskell-png
+  to   = aws_s3_object.asset["logos/haskell.png"]
+}
+
+moved {
+  from = aws_s3_object.html-png
+  to   = aws_s3_object.asset["logos/html.png"]
+}
+
+moved {
+  from = aws_s3_object.ios-png
+  to   = aws_s3_object.asset["logos/ios.png"]
+}
+
+moved {
+  from = aws_s3_object.java-png
+  to   = aws_s3_object.asset["logos/java.png"]
+}
+
+moved {
+  from = aws_s3_object.java8-png
+  to   = aws_s3_object.asset["logos/java8.png"]
+}
+
+moved {
+  from = aws_s3_object.jenkins-png
+  to   = aws_s3_object.asset["logos/jenkins.png"]
+}
+
+moved {
+  from = aws_s3_object.jest-svg
+  to   = aws_s3_object.asset["logos/jest.svg"]
+}
+
+moved {
+  from = aws_s3_object.jquery-png
+  to   = aws_s3_object.asset["logos/jquery.png"]
+}
+
+moved {
+  from = aws_s3_object.js-png
+  to   = aws_s3_object.asset["logos/js.png"]
+}
+
+moved {
+  from = aws_s3_object.json-png
+  to   = aws_s3_object.asset["logos/json.png"]
+}
+
+moved {
+  from = aws_s3_object.jss-png
+  to   = aws_s3_object.asset["logos/jss.png"]
+}
+
+moved {
+  from = aws_s3_object.jwt-png
+  to   = aws_s3_object.asset["logos/jwt.png"]
+}
+
+moved {
+  from = aws_s3_object.k8s-png
+  to   = aws_s3_object.asset["logos/k8s.png"]
+}
+
+moved {
+  from = aws_s3_object.kibana-png
+  to   = aws_s3_object.asset["logos/kibana.png"]
+}
+
+moved {
+  from = aws_s3_object.less-png
+  to   = aws_s3_object.asset["logos/less.png"]
+}
+
+moved {
+  from = aws_s3_object.mongodb-png
+  to   = aws_s3_object.asset["logos/mongodb.png"]
+}
+
+moved {
+  from = aws_s3_object.mongoose-png
+  to   = aws_s3_object.asset["logos/mongoose.png"]
+}
+
+moved {
+  from = aws_s3_object.mysql-png
+  to   = aws_s3_object.asset["logos/mysql.png"]
+}
+
+moved {
+  from = aws_s3_object.neo4j-png
+  to   = aws_s3_object.asset["logos/neo4j.png"]
+}
+
+moved {
+  from = aws_s3_object.nginx-png
+  to   = aws_s3_object.asset["logos/nginx.png"]
+}
+
+moved {
+  from = aws_s3_object.nodejs-png
+  to   = aws_s3_object.asset["logos/nodejs.png"]
+}
+
+moved {
+  from = aws_s3_object.npm-png
+  to   = aws_s3_object.asset["logos/npm.png"]
+}
+
+moved {
+  from = aws_s3_object.numpy-png
+  to   = aws_s3_object.asset["logos/numpy.png"]
+}
+
+moved {
+  from = aws_s3_object.oracle-png
+  to   = aws_s3_object.asset["logos/oracle.png"]
+}
+
+moved {
+  from = aws_s3_object.packer-svg
+  to   = aws_s3_object.asset["logos/packer.svg"]
+}
+
+moved {
+  from = aws_s3_object.pandas-png
+  to   = aws_s3_object.asset["logos/pandas.png"]
+}
+
+moved {
+  from = aws_s3_object.php-svg
+  to   = aws_s3_object.asset["logos/php.svg"]
+}
+
+moved {
+  from = aws_s3_object.please-build-png
+  to   = aws_s3_object.asset["logos/please-build.png"]
+}
+
+moved {
+  from = aws_s3_object.powershell-png
+  to   = aws_s3_object.asset["logos/powershell.png"]
+}
+
+moved {
+  from = aws_s3_object.prettier-png
+  to   = aws_s3_object.asset["logos/prettier.png"]
+}
+
+moved {
+  from = aws_s3_object.puppeteer-png
+  to   = aws_s3_object.asset["logos/puppeteer.png"]
+}
+
+moved {
+  from = aws_s3_object.python-png
+  to   = aws_s3_object.asset["logos/python.png"]
+}
+
+moved {
+  from = aws_s3_object.r-png
+  to   = aws_s3_object.asset["logos/r.png"]
+}
+
+moved {
+  from = aws_s3_object.rabbitmq-png
+  to   = aws_s3_object.asset["logos/rabbitmq.png"]
+}
+
+moved {
+  from = aws_s3_object.react-png
+  to   = aws_s3_object.asset["logos/react.png"]
+}
+
+moved {
+  from = aws_s3_object.redux-png
+  to   = aws_s3_object.asset["logos/redux.png"]
+}
+
+moved {
+  from = aws_s3_object.sass-png
+  to   = aws_s3_object.asset["logos/sass.png"]
+}
+
+moved {
+  from = aws_s3_object.selenium-png
+  to   = aws_s3_object.asset["logos/selenium.png"]
+}
+
+moved {
+  from = aws_s3_object.splunk-png
+  to   = aws_s3_object.asset["logos/splunk.png"]
+}
+
+moved {
+  from = aws_s3_object.sql-server-svg
+  to   = aws_s3_object.asset["logos/sql-server.svg"]
+}
+
+moved {
+  from = aws_s3_object.sql-png
+  to   = aws_s3_object.asset["logos/sql.png"]
+}
+
+moved {
+  from = aws_s3_object.swift-png
+  to   = aws_s3_object.asset["logos/swift.png"]
+}
+
+moved {
+  from = aws_s3_object.swiftui-png
+  to   = aws_s3_object.asset["logos/swiftui.png"]
+}
+
+moved {
+  from = aws_s3_object.tech-logos-svg
+  to   = aws_s3_object.asset["logos/tech_logos.svg"]
+}
+
+moved {
+  from = aws_s3_object.tech-logos-white-svg
+  to   = aws_s3_object.asset["logos/tech_logos_white.svg"]
+}
+
+moved {
+  from = aws_s3_object.terraform-png
+  to   = aws_s3_object.asset["logos/terraform.png"]
+}
+
+moved {
+  from = aws_s3_object.travisci-png
+  to   = aws_s3_object.asset["logos/travisci.png"]
+}
+
+moved {
+  from = aws_s3_object.ts-png
+  to   = aws_s3_object.asset["logos/ts.png"]
+}
+
+moved {
+  from = aws_s3_object.unicode-png
+  to   = aws_s3_object.asset["logos/unicode.png"]
+}
+
+moved {
+  from = aws_s3_object.uwsgi-png
+  to   = aws_s3_object.asset["logos/uwsgi.png"]
+}
+
+moved {
+  from = aws_s3_object.vim-png
+  to   = aws_s3_object.asset["logos/vim.png"]
+}
+
+moved {
+  from = aws_s3_object.webassembly-png
+  to   = aws_s3_object.asset["logos/webassembly.png"]
+}
+
+moved {
+  from = aws_s3_object.webpack-png
+  to   = aws_s3_object.asset["logos/webpack.png"]
+}
+
+moved {
+  from = aws_s3_object.yaml-png
+  to   = aws_s3_object.asset["logos/yaml.png"]
+}
+
+moved {
+  from = aws_s3_object.main-component-png
+  to   = aws_s3_object.asset["main-component.png"]
+}
+
+moved {
+  from = aws_s3_object.meowcat-png
+  to   = aws_s3_object.asset["meowcat.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-14-18-html-png
+  to   = aws_s3_object.asset["posts/1-14-18-html.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-14-18-webresult-png
+  to   = aws_s3_object.asset["posts/1-14-18-webresult.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-branch-dag-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-branch-dag.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-dag-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-dag.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-graph-view-click-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-graph-view-click.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-graph-view-hover-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-graph-view-hover.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-graph-view-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-graph-view.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-hello-world-dag-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-hello-world-dag.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-home-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-home.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-log-view-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-log-view.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-tag-search-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-tag-search.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-17-22-airflow-tree-view-png
+  to   = aws_s3_object.asset["posts/1-17-22-airflow-tree-view.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-19-19-react-lifecycles-gif
+  to   = aws_s3_object.asset["posts/1-19-19-react-lifecycles.gif"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-2-22-block-public-access-on-png
+  to   = aws_s3_object.asset["posts/1-2-22-block-public-access-on.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-2-22-block-public-access-png
+  to   = aws_s3_object.asset["posts/1-2-22-block-public-access.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-2-22-private-buckets-png
+  to   = aws_s3_object.asset["posts/1-2-22-private-buckets.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-2-22-public-buckets-png
+  to   = aws_s3_object.asset["posts/1-2-22-public-buckets.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-2-22-static-website-png
+  to   = aws_s3_object.asset["posts/1-2-22-static-website.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-24-19-example-1-png
+  to   = aws_s3_object.asset["posts/1-24-19-example-1.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-24-19-example-2-png
+  to   = aws_s3_object.asset["posts/1-24-19-example-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-24-19-example-3-png
+  to   = aws_s3_object.asset["posts/1-24-19-example-3.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-27-17-postlazy-png
+  to   = aws_s3_object.asset["posts/1-27-17-postlazy.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-27-17-prelazy-png
+  to   = aws_s3_object.asset["posts/1-27-17-prelazy.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-29-19-horse-picture-1-jpg
+  to   = aws_s3_object.asset["posts/1-29-19-horse-picture-1.jpg"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-29-19-horse-picture-2-jpg
+  to   = aws_s3_object.asset["posts/1-29-19-horse-picture-2.jpg"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-31-20-react-16-3-png
+  to   = aws_s3_object.asset["posts/1-31-20-react-16-3.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-31-23-github-workflows-png
+  to   = aws_s3_object.asset["posts/1-31-23-github-workflows.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-31-23-integration-test-workflow-png
+  to   = aws_s3_object.asset["posts/1-31-23-integration-test-workflow.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-31-23-linting-formatting-workflow-png
+  to   = aws_s3_object.asset["posts/1-31-23-linting-formatting-workflow.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-1-31-23-saintsxctf-infrastructure-flask-api-png
+  to   = aws_s3_object.asset["posts/1-31-23-saintsxctf-infrastructure-flask-api.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-10-1-20-cost-detection-png
+  to   = aws_s3_object.asset["posts/10-1-20-cost-detection.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-10-10-21-jarombek-com-k8s-png
+  to   = aws_s3_object.asset["posts/10-10-21-jarombek-com-k8s.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-10-10-21-kubernetes-test-jenkins-png
+  to   = aws_s3_object.asset["posts/10-10-21-kubernetes-test-jenkins.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-10-18-19-kibana-analyzer-png
+  to   = aws_s3_object.asset["posts/10-18-19-kibana-analyzer.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-10-25-21-k8s-architecture-png
+  to   = aws_s3_object.asset["posts/10-25-21-k8s-architecture.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-admin-edit-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-admin-edit.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-admin-invite-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-admin-invite.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-admin-users-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-admin-users.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-admin-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-admin.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-dashboard-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-dashboard.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-group-leaderboard-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-group-leaderboard.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-group-logs-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-group-logs.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-group-members-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-group-members.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-group-stats-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-group-stats.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-log-1-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-log-1.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-log-2-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-log-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-profile-calendar-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-profile-calendar.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-profile-chart-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-profile-chart.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-profile-edit-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-profile-edit.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-profile-logs-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-profile-logs.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-profile-stats-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-profile-stats.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-register-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-register.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-sign-in-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-sign-in.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-1-21-saintsxctf-teams-png
+  to   = aws_s3_object.asset["posts/11-1-21-saintsxctf-teams.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-13-17-prompt-png
+  to   = aws_s3_object.asset["posts/11-13-17-prompt.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-15-21-checkbox-component-png
+  to   = aws_s3_object.asset["posts/11-15-21-checkbox-component.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-15-21-directory-structure-png
+  to   = aws_s3_object.asset["posts/11-15-21-directory-structure.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-15-22-actions-tab-png
+  to   = aws_s3_object.asset["posts/11-15-22-actions-tab.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-15-22-goland-run-config-png
+  to   = aws_s3_object.asset["posts/11-15-22-goland-run-config.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-15-22-job-result-logs-png
+  to   = aws_s3_object.asset["posts/11-15-22-job-result-logs.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-15-22-job-result-png
+  to   = aws_s3_object.asset["posts/11-15-22-job-result.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-15-22-workflow-result-png
+  to   = aws_s3_object.asset["posts/11-15-22-workflow-result.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-21-17-results-png
+  to   = aws_s3_object.asset["posts/11-21-17-results.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-24-18-angular-lifecycle-png
+  to   = aws_s3_object.asset["posts/11-24-18-angular-lifecycle.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-26-17-results-png
+  to   = aws_s3_object.asset["posts/11-26-17-results.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-5-20-aj-switch-gif
+  to   = aws_s3_object.asset["posts/11-5-20-aj-switch.gif"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-5-20-aj-switch-png
+  to   = aws_s3_object.asset["posts/11-5-20-aj-switch.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-6-17-graph-png
+  to   = aws_s3_object.asset["posts/11-6-17-FairfieldGraphImage.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-11-7-18-bar-chart-gif
+  to   = aws_s3_object.asset["posts/11-7-18-bar-chart.gif"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-11-22-databricks-workflow-png
+  to   = aws_s3_object.asset["posts/12-11-22-databricks-workflow.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-11-22-summit-main-stage-jpg
+  to   = aws_s3_object.asset["posts/12-11-22-summit-main-stage.jpg"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-22-18-hierarchy1-png
+  to   = aws_s3_object.asset["posts/12-22-18-hierarchy1.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-22-18-hierarchy2-png
+  to   = aws_s3_object.asset["posts/12-22-18-hierarchy2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-22-18-hierarchy3-png
+  to   = aws_s3_object.asset["posts/12-22-18-hierarchy3.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-24-21-api-file-structure-png
+  to   = aws_s3_object.asset["posts/12-24-21-api-file-structure.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-3-21-redux-components-png
+  to   = aws_s3_object.asset["posts/12-3-21-redux-components.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-3-21-teams-page-png
+  to   = aws_s3_object.asset["posts/12-3-21-teams-page.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-30-17-mongodb-png
+  to   = aws_s3_object.asset["posts/12-30-17-mongodb.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-30-17-restapi-png
+  to   = aws_s3_object.asset["posts/12-30-17-restapi.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-30-17-xmlresponse-png
+  to   = aws_s3_object.asset["posts/12-30-17-xmlresponse.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-12-30-17-xmlresponsetext-png
+  to   = aws_s3_object.asset["posts/12-30-17-xmlresponsetext.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-15-20-error-page-png
+  to   = aws_s3_object.asset["posts/2-15-20-error-page.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-15-20-infrastructure-png
+  to   = aws_s3_object.asset["posts/2-15-20-infrastructure.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-18-22-api-infrastructure-png
+  to   = aws_s3_object.asset["posts/2-18-22-api-infrastructure.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-26-22-edit-exercise-log-png
+  to   = aws_s3_object.asset["posts/2-26-22-edit-exercise-log.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-26-22-exercise-log-created-png
+  to   = aws_s3_object.asset["posts/2-26-22-exercise-log-created.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-26-22-exercise-log-editing-png
+  to   = aws_s3_object.asset["posts/2-26-22-exercise-log-editing.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-26-22-exercise-log-view-png
+  to   = aws_s3_object.asset["posts/2-26-22-exercise-log-view.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-26-22-exercise-logs-png
+  to   = aws_s3_object.asset["posts/2-26-22-exercise-logs.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-5-20-jest-output
+  to   = aws_s3_object.asset["posts/2-5-20-jest-output.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-5-22-api-infrastructure-png
+  to   = aws_s3_object.asset["posts/2-5-22-api-infrastructure.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-5-22-jenkins-job-png
+  to   = aws_s3_object.asset["posts/2-5-22-jenkins-job.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-2-5-22-welcome-email-png
+  to   = aws_s3_object.asset["posts/2-5-22-welcome-email.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-3-12-19-cd-project-gif
+  to   = aws_s3_object.asset["posts/3-12-19-cd-project.gif"]
+}
+
+moved {
+  from = aws_s3_object.posts-3-12-22-feel-slider-gif
+  to   = aws_s3_object.asset["posts/3-12-22-feel-slider.gif"]
+}
+
+moved {
+  from = aws_s3_object.posts-3-12-22-input-validation-gif
+  to   = aws_s3_object.asset["posts/3-12-22-input-validation.gif"]
+}
+
+moved {
+  from = aws_s3_object.posts-3-27-22-homepage-png
+  to   = aws_s3_object.asset["posts/3-27-22-homepage.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-3-27-22-infra-diagram-png
+  to   = aws_s3_object.asset["posts/3-27-22-infra-diagram.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-3-27-22-phpmyadmin-png
+  to   = aws_s3_object.asset["posts/3-27-22-phpmyadmin.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-3-27-22-query-result-png
+  to   = aws_s3_object.asset["posts/3-27-22-query-result.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-3-27-22-write-query-png
+  to   = aws_s3_object.asset["posts/3-27-22-write-query.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-4-28-19-app-png
+  to   = aws_s3_object.asset["posts/4-28-19-app.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-4-30-23-terraform-module-diagram-png
+  to   = aws_s3_object.asset["posts/4-30-23-terraform-module-diagram.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-13-19-k8s-cluster-png
+  to   = aws_s3_object.asset["posts/5-13-19-k8s-cluster.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-13-19-k8s-master-png
+  to   = aws_s3_object.asset["posts/5-13-19-k8s-master.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-13-19-k8s-worker-png
+  to   = aws_s3_object.asset["posts/5-13-19-k8s-worker.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-20-18-blockchain-png
+  to   = aws_s3_object.asset["posts/5-20-18-blockchain.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-20-18-exercise-png
+  to   = aws_s3_object.asset["posts/5-20-18-exercise.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-20-18-simpleblock-png
+  to   = aws_s3_object.asset["posts/5-20-18-simpleblock.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-20-19-aws-console
+  to   = aws_s3_object.asset["posts/5-20-19-aws-console.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-20-19-web-browser
+  to   = aws_s3_object.asset["posts/5-20-19-web-browser.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-5-31-18-seed-png
+  to   = aws_s3_object.asset["posts/5-31-18-seed.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-13-18-network-files-png
+  to   = aws_s3_object.asset["posts/6-13-18-network-files.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-13-18-writing-notes-gif
+  to   = aws_s3_object.asset["posts/6-13-18-writing-notes.gif"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-14-21-aws-lift-shift-architecture-png
+  to   = aws_s3_object.asset["posts/6-14-21-aws-lift-shift-architecture.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-14-21-initial-architecture-png
+  to   = aws_s3_object.asset["posts/6-14-21-initial-architecture.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-14-21-v2-architecture-png
+  to   = aws_s3_object.asset["posts/6-14-21-v2-architecture.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-17-19-repos
+  to   = aws_s3_object.asset["posts/6-17-19-repos.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-18-grid-0-png
+  to   = aws_s3_object.asset["posts/6-18-18-grid-0.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-18-grid-1-png
+  to   = aws_s3_object.asset["posts/6-18-18-grid-1.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-18-grid-2-png
+  to   = aws_s3_object.asset["posts/6-18-18-grid-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-21-aws-architecture-png
+  to   = aws_s3_object.asset["posts/6-18-21-aws-architecture.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-21-saints-xctf-com-asset-png
+  to   = aws_s3_object.asset["posts/6-18-21-saints-xctf-com-asset.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-21-saints-xctf-com-auth-png
+  to   = aws_s3_object.asset["posts/6-18-21-saints-xctf-com-auth.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-21-saints-xctf-com-fn-png
+  to   = aws_s3_object.asset["posts/6-18-21-saints-xctf-com-fn.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-21-saints-xctf-com-uasset-png
+  to   = aws_s3_object.asset["posts/6-18-21-saints-xctf-com-uasset.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-21-saints-xctf-database-png
+  to   = aws_s3_object.asset["posts/6-18-21-saints-xctf-database.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-18-21-terraform-module-png
+  to   = aws_s3_object.asset["posts/6-18-21-terraform-module.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-29-21-jss-class-names-png
+  to   = aws_s3_object.asset["posts/6-29-21-jss-class-names.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-29-21-jss-demo-png
+  to   = aws_s3_object.asset["posts/6-29-21-jss-demo.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-30-21-react-jss-alert-component-png
+  to   = aws_s3_object.asset["posts/6-30-21-react-jss-alert-component.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-9-18-array-chain-png
+  to   = aws_s3_object.asset["posts/6-9-18-array-chain.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-9-18-function-chain-png
+  to   = aws_s3_object.asset["posts/6-9-18-function-chain.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-9-18-object-chain-png
+  to   = aws_s3_object.asset["posts/6-9-18-object-chain.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-6-9-18-prototype-traverse-png
+  to   = aws_s3_object.asset["posts/6-9-18-prototype-traverse.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-26-21-aws-canaries-png
+  to   = aws_s3_object.asset["posts/7-26-21-aws-canaries.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-26-21-aws-sign-in-canary-png
+  to   = aws_s3_object.asset["posts/7-26-21-aws-sign-in-canary.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-26-21-synthetics-canary-architecture-png
+  to   = aws_s3_object.asset["posts/7-26-21-synthetics-canary-architecture.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-3-21-dynamodb-aws-console-png
+  to   = aws_s3_object.asset["posts/7-3-21-dynamodb-aws-console.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-dashboard-mobile-png
+  to   = aws_s3_object.asset["posts/7-31-21-dashboard-mobile.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-dashboard-png
+  to   = aws_s3_object.asset["posts/7-31-21-dashboard.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-graphql-query-2-png
+  to   = aws_s3_object.asset["posts/7-31-21-graphql-query-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-graphql-query-png
+  to   = aws_s3_object.asset["posts/7-31-21-graphql-query.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-infrastructure-png
+  to   = aws_s3_object.asset["posts/7-31-21-infrastructure.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-jenkins-pipelines-png
+  to   = aws_s3_object.asset["posts/7-31-21-jenkins-pipelines.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-jenkins-test-pipeline-png
+  to   = aws_s3_object.asset["posts/7-31-21-jenkins-test-pipeline.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-repository-count-component-png
+  to   = aws_s3_object.asset["posts/7-31-21-repository-count-component.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-31-21-total-commits-component-png
+  to   = aws_s3_object.asset["posts/7-31-21-total-commits-component.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-7-4-18-groovy-png
+  to   = aws_s3_object.asset["posts/7-4-18-groovy-strict-type-check.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-cypress-browser-png
+  to   = aws_s3_object.asset["posts/8-11-21-cypress-browser.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-cypress-directory-png
+  to   = aws_s3_object.asset["posts/8-11-21-cypress-directory.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-cypress-executed-test-png
+  to   = aws_s3_object.asset["posts/8-11-21-cypress-executed-test.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-cypress-test-runner-png
+  to   = aws_s3_object.asset["posts/8-11-21-cypress-test-runner.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-api-error-2-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-api-error-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-api-error-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-api-error.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-create-log-test-2-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-create-log-test-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-create-log-test-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-create-log-test.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-home-about-mobile-test-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-home-about-mobile-test.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-home-about-test-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-home-about-test.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-home-title-test-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-home-title-test.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-monthly-calendar-2-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-monthly-calendar-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-11-21-saintsxctf-monthly-calendar-png
+  to   = aws_s3_object.asset["posts/8-11-21-saintsxctf-monthly-calendar.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-24-19-flexbox-1-png
+  to   = aws_s3_object.asset["posts/8-24-19-flexbox-1.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-24-19-flexbox-2-gif
+  to   = aws_s3_object.asset["posts/8-24-19-flexbox-2.gif"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-24-19-flexbox-3-png
+  to   = aws_s3_object.asset["posts/8-24-19-flexbox-3.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-24-19-flexbox-4-png
+  to   = aws_s3_object.asset["posts/8-24-19-flexbox-4.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-24-19-flexbox-5-png
+  to   = aws_s3_object.asset["posts/8-24-19-flexbox-5.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-add-data-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-add-data.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-count-query-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-count-query.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-custom-index-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-custom-index.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-dashboard-create-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-dashboard-create.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-dashboard-source-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-dashboard-source.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-dashboards-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-dashboards.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-filter-query-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-filter-query.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-homepage-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-homepage.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-http-codes-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-http-codes.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-internal-dashboard-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-internal-dashboard.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-memory-chart-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-memory-chart.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-prior-queries-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-prior-queries.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-query-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-query.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-sign-in-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-sign-in.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-28-22-splunk-upload-files-png
+  to   = aws_s3_object.asset["posts/8-28-22-splunk-upload-files.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-5-18-graphql-png
+  to   = aws_s3_object.asset["posts/8-5-18-graphql.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-5-18-restapi-png
+  to   = aws_s3_object.asset["posts/8-5-18-restapi.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-8-8-18-graphiql-png
+  to   = aws_s3_object.asset["posts/8-8-18-graphiql.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-15-19-aws-console-png
+  to   = aws_s3_object.asset["posts/9-15-19-aws-console.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-15-19-kibana-create-doc-png
+  to   = aws_s3_object.asset["posts/9-15-19-kibana-create-doc.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-15-19-kibana-index-put-png
+  to   = aws_s3_object.asset["posts/9-15-19-kibana-index-put.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-15-19-kibana-search-png
+  to   = aws_s3_object.asset["posts/9-15-19-kibana-search.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-15-19-kibana-ui-png
+  to   = aws_s3_object.asset["posts/9-15-19-kibana-ui.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-21-18-jenkins01-png
+  to   = aws_s3_object.asset["posts/9-21-18-jenkins01.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-21-18-jenkins02-png
+  to   = aws_s3_object.asset["posts/9-21-18-jenkins02.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-21-18-jenkins03-png
+  to   = aws_s3_object.asset["posts/9-21-18-jenkins03.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-21-18-jenkins04-png
+  to   = aws_s3_object.asset["posts/9-21-18-jenkins04.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-21-18-jenkins05-png
+  to   = aws_s3_object.asset["posts/9-21-18-jenkins05.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-24-21-reverse-proxy-infrastructure-png
+  to   = aws_s3_object.asset["posts/9-24-21-reverse-proxy-infrastructure.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-24-21-shared-url-png
+  to   = aws_s3_object.asset["posts/9-24-21-shared-url.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-27-20-ec2-efs-architecture-png
+  to   = aws_s3_object.asset["posts/9-27-20-ec2-efs-architecture.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-29-20-k8s-architecture-png
+  to   = aws_s3_object.asset["posts/9-29-20-k8s-architecture.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-3-18-aws-png
+  to   = aws_s3_object.asset["posts/9-3-18-aws.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-3-18-web-png
+  to   = aws_s3_object.asset["posts/9-3-18-web.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-3-19-rds-snapshot-console-png
+  to   = aws_s3_object.asset["posts/9-3-19-rds-snapshot-console.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-3-19-saints-xctf-infra-diagram-1-png
+  to   = aws_s3_object.asset["posts/9-3-19-saints-xctf-infra-diagram-1.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-3-19-saints-xctf-infra-diagram-2-png
+  to   = aws_s3_object.asset["posts/9-3-19-saints-xctf-infra-diagram-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-3-19-saints-xctf-infra-diagram-3-png
+  to   = aws_s3_object.asset["posts/9-3-19-saints-xctf-infra-diagram-3.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-3-19-saints-xctf-infra-diagram-4-png
+  to   = aws_s3_object.asset["posts/9-3-19-saints-xctf-infra-diagram-4.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-5-19-rds-backup-lambda-1-png
+  to   = aws_s3_object.asset["posts/9-5-19-rds-backup-lambda-1.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-5-19-rds-backup-lambda-2-png
+  to   = aws_s3_object.asset["posts/9-5-19-rds-backup-lambda-2.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-5-19-rds-backup-lambda-3-png
+  to   = aws_s3_object.asset["posts/9-5-19-rds-backup-lambda-3.png"]
+}
+
+moved {
+  from = aws_s3_object.posts-9-7-18-serverless-png
+  to   = aws_s3_object.asset["posts/9-7-18-serverless.png"]
+}
+
+moved {
+  from = aws_s3_object.search-png
+  to   = aws_s3_object.asset["search.png"]
+}
+
+moved {
+  from = aws_s3_object.signup-component-png
+  to   = aws_s3_object.asset["signup-component.png"]
+}
+
+moved {
+  from = aws_s3_object.triangles-png
+  to   = aws_s3_object.asset["triangles.png"]
+}
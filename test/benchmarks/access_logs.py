@@ -0,0 +1,295 @@
+"""
+Benchmark of the CloudFront access log analyzer on synthetic logs.  Gzipped logs with Zipf distributed requests for
+the keys in the asset directory are generated, then analyzed by the columnar numpy analyzer and by a baseline which
+parses and aggregates one line at a time.  Each analysis runs in its own process so its peak memory is measured
+separately.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy
+
+from benchmarks.run_suite import peak_memory
+from tools.access_logs import (
+    FIELDS,
+    HIT_RESULTS,
+    MISS_RESULTS,
+    LogAnalyzer,
+    local_logs,
+    open_log,
+)
+from tools.histogram import Histogram
+from tools.manifest import ASSET_DIRECTORY
+
+FILE_BYTES = 256 * 2**20
+BLOCK_LINES = 50_000
+
+EDGE_LOCATIONS = ["IAD89-C1", "JFK50-P2", "ORD58-C3", "SFO5-P1", "LHR61-C2"]
+RESULT_TYPES = ["Hit", "RefreshHit", "Miss", "Error"]
+RESULT_WEIGHTS = [0.85, 0.04, 0.09, 0.02]
+
+
+def asset_keys(directory: str) -> List[str]:
+    """
+    The URL paths of the assets, as CloudFront logs them.
+    """
+    keys = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            relative = os.path.relpath(os.path.join(root, name), directory)
+            keys.append("/" + relative.replace(os.sep, "/").replace(" ", "%20"))
+
+    return sorted(keys)
+
+
+def generate_block(
+    keys: List[str], sizes: numpy.ndarray, rng: numpy.random.Generator
+) -> str:
+    """
+    Generate a block of log lines.  Keys are requested with Zipf popularity, and latencies are log-normal with
+    misses slower than hits.
+    """
+    ranks = numpy.arange(1, len(keys) + 1)
+    popularity = 1 / ranks**1.1
+    requested = rng.choice(len(keys), BLOCK_LINES, p=popularity / popularity.sum())
+    results = rng.choice(len(RESULT_TYPES), BLOCK_LINES, p=RESULT_WEIGHTS)
+    latency = rng.lognormal(-4.5, 0.6, BLOCK_LINES) * numpy.where(results == 2, 4, 1)
+    status = numpy.where(results == 3, 404, 200)
+    sent = numpy.where(results == 3, 420, sizes[requested])
+    edges = rng.integers(len(EDGE_LOCATIONS), size=BLOCK_LINES)
+
+    values = {name: "-" for name in FIELDS}
+    lines = []
+    for key, result, seconds, code, size, edge in zip(
+        requested.tolist(),
+        results.tolist(),
+        latency.tolist(),
+        status.tolist(),
+        sent.tolist(),
+        edges.tolist(),
+    ):
+        values.update(
+            {
+                "date": "2026-10-18",
+                "time": "12:00:00",
+                "x-edge-location": EDGE_LOCATIONS[edge],
+                "sc-bytes": str(size),
+                "c-ip": "192.0.2.1",
+                "cs-method": "GET",
+                "cs-uri-stem": keys[key],
+                "sc-status": str(code),
+                "x-edge-result-type": RESULT_TYPES[result],
+                "x-host-header": "asset.jarombek.com",
+                "cs-protocol": "https",
+                "time-taken": f"{seconds:.3f}",
+            }
+        )
+        lines.append("\t".join(values[name] for name in FIELDS))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate(directory: str, keys: List[str], gigabytes: float, seed: int) -> int:
+    """
+    Write gzipped log files until they hold the requested amount of uncompressed logs.
+    :return: The number of uncompressed bytes written.
+    """
+    rng = numpy.random.default_rng(seed)
+    sizes = rng.lognormal(10, 1.5, len(keys)).astype(numpy.int64) + 100
+    blocks = [generate_block(keys, sizes, rng).encode() for _ in range(8)]
+    header = f"#Version: 1.0\n#Fields: {' '.join(FIELDS)}\n".encode()
+
+    target = int(gigabytes * 2**30)
+    written = 0
+    index = 0
+    count = 0
+    while written < target:
+        path = os.path.join(directory, f"E2EXAMPLE.2026-10-18-{index:04d}.gz")
+        with gzip.open(path, "wb", compresslevel=1) as file:
+            file.write(header)
+            size = 0
+            while size < FILE_BYTES and written + size < target:
+                block = blocks[count % len(blocks)]
+                file.write(block)
+                size += len(block)
+                count += 1
+
+        written += size
+        index += 1
+
+    return written
+
+
+def analyze_rows(directory: str) -> int:
+    """
+    The baseline analysis, which parses and aggregates one log line at a time.
+    :return: The number of lines analyzed.
+    """
+    totals: Dict[str, List[int]] = {}
+    latency: Dict[str, Histogram] = {}
+    lines = 0
+
+    for path in sorted(os.listdir(directory)):
+        fields = FIELDS
+        with open_log(os.path.join(directory, path)) as file:
+            for line in file:
+                if line.startswith("#"):
+                    if line.startswith("#Fields:"):
+                        fields = line.split()[1:]
+                    continue
+
+                row = dict(zip(fields, line.rstrip("\n").split("\t")))
+                stats = totals.setdefault(row["cs-uri-stem"], [0, 0, 0, 0, 0])
+                stats[0] += 1
+                stats[1] += int(row["sc-bytes"])
+                stats[2] += row["x-edge-result-type"] in HIT_RESULTS
+                stats[3] += row["x-edge-result-type"] in MISS_RESULTS
+                stats[4] += int(row["sc-status"]) >= 400
+                latency.setdefault(row["cs-uri-stem"], Histogram()).record(
+                    float(row["time-taken"]) * 1e6
+                )
+                lines += 1
+
+    return lines
+
+
+def analyze_columns(directory: str) -> int:
+    """
+    Analyze the logs with the columnar analyzer.
+    :return: The number of lines analyzed.
+    """
+    analyzer = LogAnalyzer()
+    for file in local_logs(directory):
+        analyzer.add_file(file)
+
+    analyzer.stats()
+    return analyzer.lines
+
+
+ANALYSES = {"rows": analyze_rows, "columns": analyze_columns}
+
+
+def analysis_peak_memory() -> int:
+    """
+    The peak resident memory of an analysis process in bytes.  On Linux, the peak reported by getrusage() carries over
+    from the parent which generated the logs, while the high water mark in /proc starts over when a process execs.
+    """
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    return peak_memory()
+
+
+def measure(name: str, directory: str, megabytes: float) -> Dict[str, Any]:
+    """
+    Run an analysis in a child process.
+    :return: The analysis's throughput and peak memory.
+    """
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.access_logs", "--analyze", name, directory],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output)
+
+    return {
+        "name": name,
+        "lines": result["lines"],
+        "seconds": round(result["seconds"], 3),
+        "lines_per_second": round(result["lines"] / result["seconds"]),
+        "megabytes_per_second": round(megabytes / result["seconds"], 1),
+        "peak_memory_megabytes": round(result["peak_memory_bytes"] / 2**20, 1),
+    }
+
+
+def benchmark(gigabytes: float, analyses: List[str], seed: int) -> List[Dict[str, Any]]:
+    """
+    Generate logs in a temporary directory and time each analysis of them.
+    :return: One result per analysis.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        keys = asset_keys(ASSET_DIRECTORY)
+        megabytes = generate(directory, keys, gigabytes, seed) / 2**20
+        print(
+            f"Generated {megabytes:.0f}MiB of logs for {len(keys)} keys",
+            file=sys.stderr,
+        )
+        return [measure(name, directory, megabytes) for name in analyses]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--gigabytes",
+        type=float,
+        default=2.0,
+        help="Uncompressed size of the generated logs.",
+    )
+    parser.add_argument(
+        "--analyses",
+        nargs="+",
+        choices=list(ANALYSES),
+        default=["columns", "rows"],
+        help="Analyses to benchmark.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--analyze",
+        nargs=2,
+        metavar=("ANALYSIS", "DIRECTORY"),
+        help=argparse.SUPPRESS,
+    )
+    parser.add_argument("--output", help="File to write the results to as JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    if args.analyze:
+        name, directory = args.analyze
+        start = time.perf_counter()
+        lines = ANALYSES[name](directory)
+        json.dump(
+            {
+                "lines": lines,
+                "seconds": time.perf_counter() - start,
+                "peak_memory_bytes": analysis_peak_memory(),
+            },
+            sys.stdout,
+        )
+        return 0
+
+    results = benchmark(args.gigabytes, args.analyses, args.seed)
+    for result in results:
+        print(
+            f"{result['name']:<8} {result['lines']:>10} lines {result['seconds']:>8.3f}s "
+            f"{result['lines_per_second']:>9} lines/s {result['megabytes_per_second']:>7.1f} MiB/s "
+            f"{result['peak_memory_megabytes']:>7.1f}MiB peak"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
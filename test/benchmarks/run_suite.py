@@ -0,0 +1,493 @@
+"""
+Benchmark the test runner itself.  The full test suite is run against a cassette of AWS API responses, timing the
+runner end to end along with interpreter start, the boto3 import, client creation, test discovery, and each suite's
+tests, and recording the peak memory of the run.  Without --cassette, a stub cassette is first recorded from the
+AWS-facing suites against moto, seeded with the resources they test, so the benchmark needs no credentials or
+network access.  The benchmark fails if any test fails, since its timings would be meaningless.  Results are
+written as JSON with stable keys, so a regression shows up as a diff between commits.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.selection import REPOSITORY, TEST_DIRECTORY, dependencies, suite_names
+
+DEFAULT_OUTPUT = os.path.join(TEST_DIRECTORY, "benchmarks", "results", "runner.json")
+
+# Credentials for runs which never reach AWS, so boto3 doesn't go looking for real ones.
+OFFLINE_ENVIRONMENT = {
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "AWS_ACCESS_KEY_ID": "benchmark",
+    "AWS_SECRET_ACCESS_KEY": "benchmark",
+}
+
+
+def aws_suites() -> List[str]:
+    """
+    The suites which make API calls through the shared AWS fixtures, and so are served from the cassette.
+    """
+    return [
+        suite
+        for suite in suite_names()
+        if "test/utils/fixtures.py" in dependencies(f"test/suites/{suite}.py")
+    ]
+
+
+def suite_of(description: str) -> str:
+    """
+    The suite a test belongs to, from its ID.  Suites which failed to import are reported by unittest as tests of
+    'unittest.loader._FailedTest' named after the suite.
+    """
+    if description.startswith("unittest.loader."):
+        return description.split(".")[-1]
+    return description.split(".")[0]
+
+
+def child(*args: str) -> subprocess.CompletedProcess:
+    """
+    Run a Python process from the test directory with offline AWS credentials.
+    """
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=TEST_DIRECTORY,
+        env={**os.environ, **OFFLINE_ENVIRONMENT},
+        capture_output=True,
+        text=True,
+    )
+
+
+def timed(*args: str) -> float:
+    """
+    The wall clock seconds a Python process takes from launch to exit.
+    """
+    start = time.perf_counter()
+    child(*args)
+    return time.perf_counter() - start
+
+
+def self_signed_certificate(domain: str) -> Tuple[bytes, bytes]:
+    """
+    Create a self-signed certificate for a domain, which ACM reports as issued once it's imported.
+    :param domain: The domain name of the certificate, such as '*.jarombek.com'.
+    :return: The PEM encoded certificate and private key.
+    """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, domain)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=365))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName(domain)]), False)
+        .sign(key, hashes.SHA256())
+    )
+
+    return (
+        certificate.public_bytes(serialization.Encoding.PEM),
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        ),
+    )
+
+
+def seed() -> None:
+    """
+    Create the Terraform-managed resources the AWS-facing suites test in moto's in-process AWS account, so the stub
+    cassette is recorded from passing tests.  Must be called inside mock_aws().
+    """
+    import boto3
+
+    from tools.manifest import BUCKET
+    from tools.terraform import OBJECTS_FILE
+    from utils.route53 import terraform_records
+
+    certificate, private_key = self_signed_certificate("*.jarombek.com")
+    boto3.client("acm").import_certificate(
+        Certificate=certificate, PrivateKey=private_key
+    )
+
+    iam = boto3.client("iam")
+    iam.create_role(
+        RoleName="ecs-task-role",
+        Path="/admin/",
+        AssumeRolePolicyDocument=json.dumps(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Principal": {"Service": "ecs-tasks.amazonaws.com"},
+                        "Action": "sts:AssumeRole",
+                    }
+                ],
+            }
+        ),
+    )
+    policy = iam.create_policy(
+        PolicyName="ecs-task-policy",
+        PolicyDocument=json.dumps(
+            {
+                "Version": "2012-10-17",
+                "Statement": [{"Effect": "Allow", "Action": "ecs:*", "Resource": "*"}],
+            }
+        ),
+    )
+    iam.attach_role_policy(RoleName="ecs-task-role", PolicyArn=policy["Policy"]["Arn"])
+
+    with open(os.path.join(REPOSITORY, "route53", "main.tf")) as file:
+        records = terraform_records(file.read())
+
+    route53 = boto3.client("route53")
+    zone = route53.create_hosted_zone(Name="jarombek.com.", CallerReference="stub")
+    changes = [
+        {
+            "Action": "UPSERT",
+            "ResourceRecordSet": {
+                "Name": record.name,
+                "Type": record.type,
+                "TTL": record.ttl or 300,
+                "ResourceRecords": [{"Value": value} for value in record.values or []],
+            },
+        }
+        for record in records
+    ]
+    changes.append(
+        {
+            "Action": "UPSERT",
+            "ResourceRecordSet": {
+                "Name": "asset.jarombek.com.",
+                "Type": "A",
+                "AliasTarget": {
+                    "HostedZoneId": "Z2FDTNDATAQYW2",
+                    "DNSName": "d1.cloudfront.net.",
+                    "EvaluateTargetHealth": False,
+                },
+            },
+        }
+    )
+    route53.change_resource_record_sets(
+        HostedZoneId=zone["HostedZone"]["Id"], ChangeBatch={"Changes": changes}
+    )
+
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket=BUCKET)
+    s3.put_public_access_block(
+        Bucket=BUCKET,
+        PublicAccessBlockConfiguration={
+            "BlockPublicAcls": True,
+            "IgnorePublicAcls": True,
+            "BlockPublicPolicy": True,
+            "RestrictPublicBuckets": True,
+        },
+    )
+
+    # The objects are empty, since the suites only check their keys and headers.
+    with open(OBJECTS_FILE) as file:
+        for obj in json.load(file).values():
+            headers = {
+                "ContentType": obj["content_type"],
+                "CacheControl": obj["cache_control"],
+            }
+            if obj["content_encoding"]:
+                headers["ContentEncoding"] = obj["content_encoding"]
+
+            s3.put_object(Bucket=BUCKET, Key=obj["key"], Body=b"", **headers)
+
+
+def record_stub(path: str) -> None:
+    """
+    Record a cassette of the AWS-facing suites' API calls against moto, seeded with the resources they test.  Tests
+    which make requests outside of boto3 are skipped, since they can't be replayed.
+    :param path: The cassette file to write.
+    """
+    import io
+    import unittest
+
+    from moto import mock_aws
+
+    from utils.cassette import OFFLINE, Cassette, RECORD
+
+    os.environ.update(OFFLINE_ENVIRONMENT)
+    OFFLINE.set()
+    loader = unittest.TestLoader()
+    output = io.StringIO()
+
+    with mock_aws():
+        seed()
+
+        # moto replaces boto3's default session, so the cassette is installed inside the mock.
+        cassette = Cassette(path, RECORD)
+        cassette.install()
+
+        tests = unittest.TestSuite(
+            loader.discover("suites", pattern=f"{suite}.py") for suite in aws_suites()
+        )
+        result = unittest.TextTestRunner(output).run(tests)
+
+    if not result.wasSuccessful():
+        raise RuntimeError(f"The suites failed against moto:\n{output.getvalue()}")
+
+    cassette.save()
+
+
+def profile(cassette: str, workers: int) -> Dict[str, Any]:
+    """
+    Time each stage of a replayed test run inside one process, the same way runner.py runs the suites.
+    :param cassette: The cassette to replay.
+    :param workers: Number of test units to run concurrently.
+    :return: Seconds spent in each stage, per suite results, and the peak resident memory of the process.
+    """
+    start = time.perf_counter()
+    import boto3  # noqa: F401
+
+    boto3_import = time.perf_counter() - start
+
+    start = time.perf_counter()
+    import runner
+    from utils.fixtures import AWS
+    from utils.parallel import ParallelTextTestRunner
+
+    harness_import = time.perf_counter() - start
+
+    args = argparse.Namespace(
+        replay=cassette,
+        record=None,
+        changed_since=None,
+        suites=runner.SUITES,
+        env=[runner.DEFAULT_ENVIRONMENT],
+    )
+    installed = runner.install_cassette(args)
+
+    services = sorted({key.split(".")[0] for key in installed.interactions})
+    clients = {}
+    for service in services:
+        start = time.perf_counter()
+        AWS.client(service)
+        clients[service] = time.perf_counter() - start
+
+    with open(os.devnull, "w") as devnull:
+        start = time.perf_counter()
+        tests = runner.load_tests(args, devnull)
+        discovery = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = ParallelTextTestRunner(devnull, workers=workers).run(tests)
+        test_time = time.perf_counter() - start
+
+    suites: Dict[str, Dict[str, float]] = {}
+    for test_id, seconds in result.durations:
+        suite = suites.setdefault(
+            suite_of(test_id),
+            {"seconds": 0.0, "tests": 0, "failures": 0, "errors": 0},
+        )
+        suite["seconds"] += seconds
+        suite["tests"] += 1
+
+    for outcome, tests_with_outcome in (
+        ("failures", result.failures),
+        ("errors", result.errors),
+    ):
+        for test, _ in tests_with_outcome:
+            name = suite_of(test.id())
+            if name in suites:
+                suites[name][outcome] += 1
+
+    return {
+        "boto3_import_s": boto3_import,
+        "harness_import_s": harness_import,
+        "client_creation_s": clients,
+        "discovery_s": discovery,
+        "tests_s": test_time,
+        "peak_memory_bytes": peak_memory(),
+        "suites": suites,
+    }
+
+
+def peak_memory() -> int:
+    """
+    The peak resident memory of the current process in bytes.
+    """
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def median(values: List[Any]) -> Any:
+    """
+    The median of each measurement across repeated runs, rounded so insignificant changes don't show up in diffs.
+    :param values: Numbers, or dictionaries of measurements with the same keys.
+    """
+    if isinstance(values[0], dict):
+        return {key: median([value[key] for value in values]) for key in values[0]}
+
+    middle = statistics.median(values)
+    return int(middle) if isinstance(values[0], int) else round(middle, 3)
+
+
+def benchmark(cassette: str, repeat: int, workers: int) -> Dict[str, Any]:
+    """
+    Measure the test runner against a cassette.  Every measurement is the median of fresh processes, so imports and
+    clients are always cold.
+    :param cassette: The cassette to replay.
+    :param repeat: Number of times to repeat each measurement.
+    :param workers: Number of test units the runner runs concurrently.
+    :return: The benchmark results.
+    """
+    interpreter, end_to_end, profiles = [], [], []
+
+    for _ in range(repeat):
+        interpreter.append(timed("-c", "pass"))
+        end_to_end.append(
+            timed(
+                "runner.py",
+                os.devnull,
+                "--replay",
+                cassette,
+                "--workers",
+                str(workers),
+            )
+        )
+
+        process = child(
+            "-m",
+            "benchmarks.run_suite",
+            "--profile",
+            cassette,
+            "--workers",
+            str(workers),
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f"Profiling the test run failed:\n{process.stderr}")
+
+        # Timings of a failing run measure the failures, not the suites.
+        result = json.loads(process.stdout)
+        failing = [
+            name
+            for name, suite in result["suites"].items()
+            if suite["failures"] or suite["errors"]
+        ]
+        if failing:
+            raise RuntimeError(f"Suites failed against the cassette: {failing}")
+
+        profiles.append(result)
+
+    return {
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "repeat": repeat,
+        "workers": workers,
+        "interpreter_start_s": median(interpreter),
+        "end_to_end_s": median(end_to_end),
+        **median(profiles),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--cassette",
+        help="Cassette recorded with 'runner.py --record'.  Defaults to a stub cassette recorded against moto.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of times to repeat each measurement.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of test units the runner runs concurrently.",
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT,
+        help="File to write the results to as JSON.",
+    )
+
+    # Stages run in child processes, so each one starts cold.
+    parser.add_argument("--profile", metavar="CASSETTE", help=argparse.SUPPRESS)
+    parser.add_argument("--record-stub", metavar="CASSETTE", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    if args.record_stub:
+        record_stub(args.record_stub)
+        return 0
+
+    if args.profile:
+        print(json.dumps(profile(args.profile, args.workers)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        cassette = args.cassette
+        if not cassette:
+            cassette = os.path.join(directory, "stub.json.gz")
+            process = child("-m", "benchmarks.run_suite", "--record-stub", cassette)
+            if process.returncode != 0:
+                raise RuntimeError(
+                    f"Recording the stub cassette failed:\n{process.stderr}"
+                )
+
+        results = benchmark(cassette, args.repeat, args.workers)
+
+    results["cassette"] = "stub" if not args.cassette else os.path.basename(cassette)
+
+    for stage in (
+        "interpreter_start_s",
+        "boto3_import_s",
+        "harness_import_s",
+        "discovery_s",
+        "tests_s",
+        "end_to_end_s",
+    ):
+        print(f"{stage[:-2]:<20} {results[stage]:>8.3f}s")
+
+    for service, seconds in results["client_creation_s"].items():
+        print(f"{service + ' client':<20} {seconds:>8.3f}s")
+
+    print(f"{'peak memory':<20} {results['peak_memory_bytes'] / 2**20:>8.1f}MiB")
+
+    for name, suite in sorted(
+        results["suites"].items(), key=lambda item: -item[1]["seconds"]
+    ):
+        print(f"{name:<24} {suite['seconds']:>8.3f}s {suite['tests']:>4} tests")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Benchmark the items per second of the jarombek-com-subscribers bulk import and export tool at different worker
+counts.  By default it runs against moto's in-process DynamoDB stand-in with a simulated network round trip added to
+every request.  Pass --endpoint-url to benchmark against DynamoDB Local instead.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+import uuid
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+
+from botocore.client import BaseClient
+
+from tools.subscribers import (
+    HASH_KEY,
+    TransferResult,
+    create_client,
+    export_table,
+    import_items,
+)
+
+
+def add_latency(client: BaseClient, latency_ms: float) -> None:
+    """
+    Delay every request made by a client, simulating the round trip time to DynamoDB.
+    :param client: The DynamoDB client.
+    :param latency_ms: Milliseconds to wait before each request.
+    """
+    if latency_ms > 0:
+        client.meta.events.register(
+            "request-created.dynamodb", lambda **kwargs: time.sleep(latency_ms / 1000)
+        )
+
+
+def subscribers(count: int) -> List[dict]:
+    """
+    Generate synthetic subscriber items shaped like the item in dynamodb/main.tf.
+    """
+    return [
+        {
+            "email": {"S": f"subscriber-{i:07d}@jarombek.com"},
+            "subscribed": {"BOOL": True},
+            "created": {"S": "2026-10-18"},
+            "updated": {"S": "2026-10-18"},
+        }
+        for i in range(count)
+    ]
+
+
+def fresh_table(client: BaseClient) -> str:
+    table = f"benchmark-{uuid.uuid4().hex[:12]}"
+    client.create_table(
+        TableName=table,
+        AttributeDefinitions=[{"AttributeName": HASH_KEY, "AttributeType": "S"}],
+        KeySchema=[{"AttributeName": HASH_KEY, "KeyType": "HASH"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    client.get_waiter("table_exists").wait(TableName=table)
+    return table
+
+
+def row(name: str, workers: int, result: TransferResult) -> Dict[str, float]:
+    return {
+        "name": name,
+        "workers": workers,
+        "items": result.items,
+        "seconds": round(result.seconds, 3),
+        "items_per_second": round(result.items_per_second, 1),
+        "capacity_units": round(result.capacity_units, 1),
+        "retries": result.retries,
+    }
+
+
+def benchmark(
+    items: int,
+    workers: List[int],
+    latency_ms: float,
+    endpoint_url: Optional[str],
+    read_capacity: Optional[float] = None,
+    write_capacity: Optional[float] = None,
+) -> List[Dict[str, float]]:
+    """
+    Import synthetic subscribers into a fresh table and export them again with each worker count.
+    :return: One import and one export result per worker count.
+    """
+    data = subscribers(items)
+    results = []
+
+    for count in workers:
+        client = create_client(count, endpoint_url)
+        table = fresh_table(client)
+        add_latency(client, latency_ms)
+
+        imported = import_items(data, client, table, count, write_capacity)
+        results.append(row("import", count, imported))
+
+        exported = export_table(io.StringIO(), client, table, count, read_capacity)
+        results.append(row("export", count, exported))
+
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--items", type=int, default=5000, help="Number of subscribers to generate."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 4, 8, 16],
+        help="Worker counts to benchmark.",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=10.0,
+        help="Simulated round trip time added to every request.",
+    )
+    parser.add_argument(
+        "--read-capacity",
+        type=float,
+        help="Read capacity units per second to limit exports to.  Defaults to no limit.",
+    )
+    parser.add_argument(
+        "--write-capacity",
+        type=float,
+        help="Write capacity units per second to limit imports to.  Defaults to no limit.",
+    )
+    parser.add_argument(
+        "--endpoint-url",
+        help="Endpoint of DynamoDB Local.  Defaults to moto's in-process stand-in.",
+    )
+    parser.add_argument("--output", help="File to write the results to as JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    with ExitStack() as stack:
+        if not args.endpoint_url:
+            from moto import mock_aws
+
+            stack.enter_context(mock_aws())
+
+        results = benchmark(
+            args.items,
+            args.workers,
+            args.latency_ms,
+            args.endpoint_url,
+            args.read_capacity,
+            args.write_capacity,
+        )
+
+    for result in results:
+        print(
+            f"{result['name']:<7} {result['workers']:>3} workers {result['items']:>7} items "
+            f"{result['seconds']:>8.3f}s {result['items_per_second']:>9.1f} items/s "
+            f"{result['retries']:>4} retries"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
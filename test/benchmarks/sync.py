@@ -0,0 +1,152 @@
+"""
+Benchmark comparing the throughput of the parallel asset sync uploader to serial put_object calls.  By default both
+run against moto's in-process S3 stand-in with a simulated network round trip added to every request.  Pass
+--endpoint-url to benchmark against a real S3 compatible server such as MinIO instead.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+
+from botocore.client import BaseClient
+
+from tools.manifest import ASSET_DIRECTORY, Asset, build_manifest, publish
+from tools.sync import create_client, extra_args, upload
+
+
+def add_latency(client: BaseClient, latency_ms: float) -> None:
+    """
+    Delay every request made by a client, simulating the round trip time to S3.
+    :param client: The S3 client.
+    :param latency_ms: Milliseconds to wait before each request.
+    """
+    if latency_ms > 0:
+        client.meta.events.register(
+            "request-created.s3", lambda **kwargs: time.sleep(latency_ms / 1000)
+        )
+
+
+def serial_put(assets: List[Asset], bucket: str, client: BaseClient) -> None:
+    """
+    Upload assets one at a time with put_object, the way Terraform applies aws_s3_object resources.
+    """
+    for asset in assets:
+        with open(asset.path, "rb") as file:
+            client.put_object(
+                Bucket=bucket, Key=asset.key, Body=file, **extra_args(asset)
+            )
+
+
+def measure(name: str, assets: List[Asset], run) -> Dict[str, float]:
+    total_bytes = sum(asset.size for asset in assets)
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    return {
+        "name": name,
+        "files": len(assets),
+        "megabytes": round(total_bytes / 1e6, 2),
+        "seconds": round(seconds, 3),
+        "files_per_second": round(len(assets) / seconds, 1),
+        "megabytes_per_second": round(total_bytes / 1e6 / seconds, 2),
+    }
+
+
+def benchmark(
+    directory: str, workers: List[int], latency_ms: float, endpoint_url: Optional[str]
+) -> List[Dict[str, float]]:
+    """
+    Upload the asset directory to a fresh bucket serially and then with each worker count.
+    :return: One result per upload strategy.
+    """
+    assets = list(publish(build_manifest(directory, cache_path=None)).values())
+    results = []
+
+    def fresh_bucket(client: BaseClient) -> str:
+        bucket = f"benchmark-{uuid.uuid4().hex[:12]}"
+        client.create_bucket(Bucket=bucket)
+        return bucket
+
+    client = create_client(1, endpoint_url)
+    add_latency(client, latency_ms)
+    bucket = fresh_bucket(client)
+    results.append(
+        measure("serial put_object", assets, lambda: serial_put(assets, bucket, client))
+    )
+
+    for count in workers:
+        client = create_client(count, endpoint_url)
+        add_latency(client, latency_ms)
+        bucket = fresh_bucket(client)
+        results.append(
+            measure(
+                f"sync ({count} workers)",
+                assets,
+                lambda: upload(assets, bucket, client, count),
+            )
+        )
+
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--directory", default=ASSET_DIRECTORY, help="The directory to upload."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[4, 16, 32],
+        help="Worker counts to benchmark the sync uploader with.",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=20.0,
+        help="Simulated round trip time added to every request.",
+    )
+    parser.add_argument(
+        "--endpoint-url",
+        help="Endpoint of an S3 compatible server.  Defaults to moto's in-process stand-in.",
+    )
+    parser.add_argument("--output", help="File to write the results to as JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    with ExitStack() as stack:
+        if not args.endpoint_url:
+            from moto import mock_aws
+
+            stack.enter_context(mock_aws())
+
+        results = benchmark(
+            args.directory, args.workers, args.latency_ms, args.endpoint_url
+        )
+
+    for result in results:
+        print(
+            f"{result['name']:<20} {result['files']:>5} files {result['seconds']:>8.3f}s "
+            f"{result['files_per_second']:>8.1f} files/s {result['megabytes_per_second']:>8.2f} MB/s"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
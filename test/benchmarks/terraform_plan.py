@@ -0,0 +1,226 @@
+"""
+Benchmark comparing 'terraform plan' times of hand-written aws_s3_object resources (one resource and filemd5() call
+per file) to the generated for_each resource over objects.json.  Both configurations use a local backend and are
+applied to a moto S3 server first, so plans refresh real state.  Pass --endpoint-url to use another S3 compatible
+server such as MinIO instead.  Requires terraform on the PATH.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+
+from tools.manifest import ASSET_DIRECTORY
+from tools.terraform import generate
+from utils.selection import TEST_DIRECTORY
+
+DEFAULT_OUTPUT = os.path.join(
+    TEST_DIRECTORY, "benchmarks", "results", "terraform_plan.json"
+)
+
+PROVIDER = """
+provider "aws" {{
+  region                      = "us-east-1"
+  access_key                  = "benchmark"
+  secret_key                  = "benchmark"
+  s3_use_path_style           = true
+  skip_credentials_validation = true
+  skip_metadata_api_check     = true
+  skip_requesting_account_id  = true
+
+  endpoints {{
+    s3 = "{endpoint}"
+  }}
+}}
+
+resource "aws_s3_bucket" "asset-jarombek" {{
+  bucket = "asset.jarombek.com"
+}}
+"""
+
+HANDWRITTEN = """
+resource "aws_s3_object" "{name}" {{
+  bucket           = aws_s3_bucket.asset-jarombek.id
+  key              = "{key}"
+  source           = "{source}"
+  etag             = filemd5("{source}")
+  content_type     = "{content_type}"
+  content_encoding = {content_encoding}
+  cache_control    = "{cache_control}"
+}}
+"""
+
+GENERATED = """
+locals {{
+  objects = jsondecode(file("{objects}"))
+}}
+
+resource "aws_s3_object" "asset" {{
+  for_each = local.objects
+
+  bucket           = aws_s3_bucket.asset-jarombek.id
+  key              = each.value.key
+  source           = "{root}/${{each.value.source}}"
+  etag             = each.value.etag
+  content_type     = each.value.content_type
+  content_encoding = each.value.content_encoding
+  cache_control    = each.value.cache_control
+}}
+"""
+
+
+def handwritten_configuration(objects: Dict[str, dict], root: str) -> str:
+    """
+    Render the objects the way jarombek-com-assets/main.tf declared them before they were generated.
+    """
+    return "".join(
+        HANDWRITTEN.format(
+            name=f"object-{index}",
+            key=obj["key"],
+            source=f"{root}/{obj['source']}",
+            content_type=obj["content_type"],
+            content_encoding=json.dumps(obj["content_encoding"]),
+            cache_control=obj["cache_control"],
+        )
+        for index, obj in enumerate(objects.values())
+    )
+
+
+def terraform(directory: str, *args: str) -> float:
+    """
+    Run a terraform command in a working directory.
+    :return: The number of seconds the command took.
+    """
+    start = time.perf_counter()
+    subprocess.run(
+        ["terraform", *args, "-input=false", "-no-color"],
+        cwd=directory,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def measure(name: str, directory: str, repeat: int) -> List[Dict[str, float]]:
+    """
+    Apply a configuration, then time refreshing and non-refreshing plans against its state.
+    """
+    terraform(directory, "init")
+    terraform(directory, "apply", "-auto-approve")
+
+    results = []
+    for label, args in (
+        ("plan", ["plan"]),
+        ("plan -refresh=false", ["plan", "-refresh=false"]),
+    ):
+        times = [terraform(directory, *args) for _ in range(repeat)]
+        results.append(
+            {
+                "name": name,
+                "command": label,
+                "median_seconds": round(statistics.median(times), 3),
+                "min_seconds": round(min(times), 3),
+            }
+        )
+
+    return results
+
+
+def benchmark(
+    directory: str, objects_file: str, endpoint_url: str, repeat: int
+) -> List[Dict[str, float]]:
+    """
+    Benchmark planning the hand-written and generated configurations.
+    :return: One result per configuration and plan command.
+    """
+    objects = generate(directory, objects_file, cache_path=None)
+    root = os.path.dirname(os.path.normpath(directory))
+    provider = PROVIDER.format(endpoint=endpoint_url)
+
+    configurations = {
+        "hand-written": handwritten_configuration(objects, root),
+        "generated": GENERATED.format(objects=objects_file, root=root),
+    }
+
+    results = []
+    for name, configuration in configurations.items():
+        with tempfile.TemporaryDirectory() as working_directory:
+            with open(os.path.join(working_directory, "main.tf"), "w") as file:
+                file.write(provider + configuration)
+
+            results.extend(measure(name, working_directory, repeat))
+
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--directory", default=ASSET_DIRECTORY, help="The asset directory."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of times to run each plan."
+    )
+    parser.add_argument(
+        "--endpoint-url",
+        help="Endpoint of an S3 compatible server.  Defaults to a local moto server.",
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT,
+        help="File to write the results to as JSON.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    if shutil.which("terraform") is None:
+        print("terraform must be installed to run this benchmark.", file=sys.stderr)
+        return 1
+
+    with ExitStack() as stack:
+        endpoint_url = args.endpoint_url
+        if not endpoint_url:
+            from moto.server import ThreadedMotoServer
+
+            server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+            server.start()
+            stack.callback(server.stop)
+            host, port = server.get_host_and_port()
+            endpoint_url = f"http://{host}:{port}"
+
+        output_directory = stack.enter_context(tempfile.TemporaryDirectory())
+        results = benchmark(
+            args.directory,
+            os.path.join(output_directory, "objects.json"),
+            endpoint_url,
+            args.repeat,
+        )
+
+    for result in results:
+        print(
+            f"{result['name']:<14} {result['command']:<22} median {result['median_seconds']:>7.3f}s "
+            f"min {result['min_seconds']:>7.3f}s"
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
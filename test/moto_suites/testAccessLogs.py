@@ -0,0 +1,236 @@
+"""
+Unit tests for the CloudFront access log analyzer, run against generated logs on disk and in moto's S3 stand-in.
+These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import gzip
+import io
+import os
+import tempfile
+import unittest
+from typing import List
+
+import boto3
+from moto import mock_aws
+
+from tools.access_logs import (
+    FIELDS,
+    KeyStats,
+    LogAnalyzer,
+    local_logs,
+    report,
+    s3_logs,
+    suggestions,
+)
+from tools.histogram import Histogram
+
+
+def log_line(
+    key: str,
+    result: str = "Hit",
+    size: int = 1000,
+    status: int = 200,
+    seconds: float = 0.01,
+    fields: List[str] = FIELDS,
+) -> str:
+    values = {name: "-" for name in fields}
+    values.update(
+        {
+            "cs-uri-stem": key,
+            "x-edge-result-type": result,
+            "sc-bytes": str(size),
+            "sc-status": str(status),
+            "time-taken": f"{seconds:.3f}",
+        }
+    )
+    return "\t".join(values[name] for name in fields) + "\n"
+
+
+def log_file(lines: List[str], fields: List[str] = FIELDS) -> str:
+    return f"#Version: 1.0\n#Fields: {' '.join(fields)}\n" + "".join(lines)
+
+
+LINES = (
+    [log_line("/jarombek.png", seconds=0.002 * i) for i in range(1, 51)]
+    + [log_line("/jarombek.png", "Miss", seconds=0.2) for _ in range(10)]
+    + [log_line("/fonts/dyslexie-bold.ttf", "RefreshHit", size=50_000)] * 3
+    + [log_line("/missing.png", "Error", size=400, status=404)] * 2
+)
+
+
+class TestLogAnalyzer(unittest.TestCase):
+    def analyze(self, text: str, chunk_bytes: int = 4096) -> LogAnalyzer:
+        analyzer = LogAnalyzer(chunk_bytes)
+        analyzer.add_file(io.StringIO(text))
+        return analyzer
+
+    def test_totals(self) -> None:
+        """
+        Test that requests, bytes, cache results, and errors are totalled per object and ranked by bytes
+        """
+        stats = self.analyze(log_file(LINES)).stats()
+
+        self.assertEqual(
+            ["/fonts/dyslexie-bold.ttf", "/jarombek.png", "/missing.png"],
+            [item.key for item in stats],
+        )
+        font, image, missing = stats
+        self.assertEqual((3, 150_000, 3, 0, 0), font[1:6])
+        self.assertEqual((60, 60_000, 50, 10, 0), image[1:6])
+        self.assertEqual((2, 800, 0, 0, 2), missing[1:6])
+        self.assertAlmostEqual(50 / 60, image.hit_ratio)
+        self.assertIsNone(missing.hit_ratio)
+
+    def test_latency(self) -> None:
+        """
+        Test that latencies are recorded in microseconds within the histogram's precision
+        """
+        image = self.analyze(log_file(LINES)).stats()[1]
+        self.assertEqual(60, image.latency.count)
+        self.assertEqual(2000, image.latency.min)
+        self.assertEqual(200_000, image.latency.max)
+        self.assertAlmostEqual(60_000, image.latency.percentile(50), delta=400)
+
+    def test_blocks(self) -> None:
+        """
+        Test that the results don't depend on where blocks split the lines
+        """
+        text = log_file(LINES)
+        expected = self.analyze(text, chunk_bytes=len(text)).stats()
+
+        for chunk_bytes in (1, 97, 1000):
+            with self.subTest(chunk_bytes=chunk_bytes):
+                stats = self.analyze(text, chunk_bytes).stats()
+                self.assertEqual(
+                    [item[:6] for item in expected], [item[:6] for item in stats]
+                )
+                self.assertEqual(
+                    [item.latency.counts for item in expected],
+                    [item.latency.counts for item in stats],
+                )
+
+    def test_header_fields(self) -> None:
+        """
+        Test that columns are found from the file's header, whatever their order
+        """
+        fields = list(reversed(FIELDS))
+        lines = [log_line("/jarombek.png", size=10, fields=fields)] * 4
+        stats = self.analyze(log_file(lines, fields)).stats()
+        self.assertEqual([("/jarombek.png", 4, 40)], [item[:3] for item in stats])
+
+    def test_encoded_keys(self) -> None:
+        """
+        Test that encoded and decoded forms of the same key are counted as one object
+        """
+        lines = [log_line("/logos/aws%20lambda.png"), log_line("/logos/aws lambda.png")]
+        stats = self.analyze(log_file(lines)).stats()
+        self.assertEqual([("/logos/aws lambda.png", 2)], [item[:2] for item in stats])
+
+    def test_malformed_lines(self) -> None:
+        """
+        Test that blank lines are ignored and truncated lines are skipped, without shifting the columns of the lines
+        after them
+        """
+        truncated = log_line("/missing.png")[:40] + "\n"
+        lines = LINES[:30] + ["\n", truncated, "\n\n"] + LINES[30:] + [truncated]
+        expected = self.analyze(log_file(LINES)).stats()
+
+        for chunk_bytes in (97, 4096):
+            with self.subTest(chunk_bytes=chunk_bytes):
+                analyzer = self.analyze(log_file(lines), chunk_bytes)
+                self.assertEqual(
+                    [item[:6] for item in expected],
+                    [item[:6] for item in analyzer.stats()],
+                )
+                self.assertEqual(2, analyzer.skipped)
+                self.assertEqual(2, report(analyzer, top=1)["skipped"])
+
+    def test_report(self) -> None:
+        result = report(self.analyze(log_file(LINES)), top=2)
+        self.assertEqual(65, result["lines"])
+        self.assertEqual(3, result["objects"])
+        self.assertEqual(2, len(result["ranked"]))
+        self.assertAlmostEqual(53 / 63, result["total"]["hit_ratio"], places=4)
+
+
+class TestSuggestions(unittest.TestCase):
+    def stats(self, key: str, requests: int, size: int, hits: int, errors: int = 0):
+        return KeyStats(
+            key, requests, requests * size, hits, requests - hits, errors, Histogram()
+        )
+
+    def test_large_objects(self) -> None:
+        """
+        Test that large objects with a big share of the bytes served are flagged for optimization
+        """
+        stats = self.stats("/computer.jpg", 1000, 500_000, 1000)
+        self.assertEqual(
+            ["optimize, a large object with a big share of bytes"],
+            suggestions(stats, stats.bytes * 4),
+        )
+        self.assertEqual([], suggestions(stats, stats.bytes * 100))
+
+    def test_low_hit_ratio(self) -> None:
+        """
+        Test that frequently missed objects are flagged unless they are already cached forever
+        """
+        stats = self.stats("/jarombek.png", 1000, 100, 500)
+        self.assertEqual(
+            ["cache longer, or publish under a fingerprinted key"],
+            suggestions(stats, stats.bytes * 100),
+        )
+
+        stats = self.stats("/posts/html.3f2a1b4c.png", 1000, 100, 500)
+        self.assertEqual([], suggestions(stats, stats.bytes * 100))
+
+        stats = self.stats("/jarombek.png", 10, 100, 5)
+        self.assertEqual([], suggestions(stats, stats.bytes * 100))
+
+    def test_errors(self) -> None:
+        stats = self.stats("/missing.png", 200, 400, 0, errors=200)
+        self.assertEqual(
+            ["mostly errors, check the object exists"], suggestions(stats, stats.bytes)
+        )
+
+
+class TestLogSources(unittest.TestCase):
+    def test_local_logs(self) -> None:
+        """
+        Test that gzipped and plain log files in a directory are all read
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with gzip.open(os.path.join(directory, "a.gz"), "wt") as file:
+                file.write(log_file(LINES[:10]))
+            with open(os.path.join(directory, "b.log"), "w") as file:
+                file.write(log_file(LINES[10:]))
+            with open(os.path.join(directory, "README.md"), "w") as file:
+                file.write("# Not a log\n")
+
+            analyzer = LogAnalyzer()
+            for log in local_logs(directory):
+                analyzer.add_file(log)
+
+        self.assertEqual(len(LINES), analyzer.lines)
+
+    @mock_aws
+    def test_s3_logs(self) -> None:
+        """
+        Test that gzipped logs are streamed from S3
+        """
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="jarombek-logs")
+        for i in range(3):
+            s3.put_object(
+                Bucket="jarombek-logs",
+                Key=f"asset/E2EXAMPLE.2026-10-18-0{i}.gz",
+                Body=gzip.compress(log_file(LINES).encode()),
+            )
+
+        analyzer = LogAnalyzer()
+        for log in s3_logs("jarombek-logs", "asset/", client=s3):
+            analyzer.add_file(log)
+
+        self.assertEqual(3 * len(LINES), analyzer.lines)
+        self.assertEqual(30, analyzer.total().misses)
@@ -0,0 +1,122 @@
+"""
+Unit tests for precompressed text assets and WOFF2 font conversion, run against moto's in-memory S3 stand-in.
+These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+from moto import mock_aws
+
+from tools.compress import compress, convert_fonts
+from tools.manifest import build_manifest
+from tools.sync import create_client, sync
+
+
+def build_font(path: str) -> None:
+    """
+    Write a minimal TrueType font with a single square glyph.
+    """
+    pen = TTGlyphPen(None)
+    pen.moveTo((100, 0))
+    pen.lineTo((100, 700))
+    pen.lineTo((500, 700))
+    pen.lineTo((500, 0))
+    pen.closePath()
+
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder([".notdef", "A"])
+    builder.setupCharacterMap({ord("A"): "A"})
+    builder.setupGlyf({".notdef": TTGlyphPen(None).glyph(), "A": pen.glyph()})
+    builder.setupHorizontalMetrics({".notdef": (600, 0), "A": (600, 100)})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(path)
+
+
+@mock_aws
+class TestAssetCompress(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create an asset directory with an SVG, a font, and an image
+        """
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        self.directory = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.directory.name, "asset")
+        os.makedirs(os.path.join(self.assets, "fonts"))
+
+        self.svg = (
+            b'<svg xmlns="http://www.w3.org/2000/svg">' + b"<rect/>" * 200 + b"</svg>"
+        )
+        with open(os.path.join(self.assets, "flag.svg"), "wb") as file:
+            file.write(self.svg)
+
+        with open(os.path.join(self.assets, "jarombek.png"), "wb") as file:
+            file.write(b"\x89PNG jarombek")
+
+        build_font(os.path.join(self.assets, "fonts", "test.ttf"))
+
+        self.s3 = create_client(workers=4)
+        self.bucket = "asset.jarombek.com"
+        self.s3.create_bucket(Bucket=self.bucket)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_fonts_converted_to_woff2(self) -> None:
+        """
+        Test that TrueType fonts get a smaller WOFF2 version which is only written once
+        """
+        self.assertEqual(convert_fonts(self.assets), ["fonts/test.woff2"])
+        self.assertEqual(convert_fonts(self.assets), [])
+
+        with TTFont(os.path.join(self.assets, "fonts", "test.woff2")) as font:
+            self.assertEqual(font.flavor, "woff2")
+            self.assertIn("A", font.getGlyphOrder())
+
+    def test_only_text_assets_compressed(self) -> None:
+        """
+        Test that SVGs and fonts are precompressed while images are left alone
+        """
+        results = {result.key: result for result in compress(self.assets, None)}
+
+        self.assertEqual(sorted(results), ["flag.svg", "fonts/test.ttf"])
+        self.assertLess(results["flag.svg"].gzip_size, results["flag.svg"].size)
+        self.assertLess(results["flag.svg"].brotli_size, results["flag.svg"].size)
+
+    def test_served_with_content_encoding(self) -> None:
+        """
+        Test that precompressed assets are stored with a gzip Content-Encoding and their encoded size
+        """
+        sync(self.assets, self.bucket, self.s3, workers=4, cache_path=None)
+        manifest = build_manifest(self.assets, None)
+
+        svg = self.s3.get_object(Bucket=self.bucket, Key="flag.svg")
+        body = svg["Body"].read()
+
+        self.assertEqual(svg.get("ContentEncoding"), "gzip")
+        self.assertEqual(svg.get("ContentType"), "image/svg+xml")
+        self.assertEqual(svg.get("ContentLength"), manifest["flag.svg"].size)
+        self.assertLess(len(body), len(self.svg))
+        self.assertEqual(gzip.decompress(body), self.svg)
+
+        png = self.s3.head_object(Bucket=self.bucket, Key="jarombek.png")
+        self.assertNotIn("ContentEncoding", png)
+
+    def test_precompression_deterministic(self) -> None:
+        """
+        Test that precompressing the same file twice produces the same digest, so unchanged assets aren't
+        uploaded again
+        """
+        first = build_manifest(self.assets, None)["flag.svg"]
+        second = build_manifest(self.assets, None)["flag.svg"]
+        self.assertEqual(first.md5, second.md5)
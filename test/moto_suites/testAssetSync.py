@@ -0,0 +1,96 @@
+"""
+Unit tests for the asset sync uploader, run against moto's in-memory S3 stand-in.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import os
+import tempfile
+import unittest
+
+from moto import mock_aws
+
+from tools.cache_policy import published_key
+from tools.manifest import MULTIPART_CHUNKSIZE, md5_file, multipart_etag
+from tools.sync import create_client, sync
+
+
+@mock_aws
+class TestAssetSync(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create an asset directory and an empty bucket in the S3 stand-in
+        """
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        self.directory = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.directory.name, "asset")
+        os.makedirs(os.path.join(self.assets, "fonts"))
+        os.makedirs(os.path.join(self.assets, "posts"))
+
+        self.write("jarombek.png", b"\x89PNG jarombek")
+        self.write("fonts/dyslexie-bold.ttf", b"\x00\x01\x00\x00 font")
+        self.write("posts/aj-switch.gif", os.urandom(MULTIPART_CHUNKSIZE + 1024))
+        self.gif = os.path.join(self.assets, "posts/aj-switch.gif")
+        self.gif_key = published_key("posts/aj-switch.gif", md5_file(self.gif))
+
+        self.s3 = create_client(workers=4)
+        self.bucket = "asset.jarombek.com"
+        self.s3.create_bucket(Bucket=self.bucket)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, key: str, content: bytes) -> None:
+        with open(os.path.join(self.assets, key), "wb") as file:
+            file.write(content)
+
+    def sync(self):
+        return sync(self.assets, self.bucket, self.s3, workers=4, cache_path=None)
+
+    def test_sync_uploads_everything(self) -> None:
+        """
+        Test that every file is uploaded to an empty bucket with the Terraform content types, with post images under
+        both their fingerprinted and original keys
+        """
+        result = self.sync()
+
+        self.assertEqual(
+            sorted(result.uploaded),
+            [
+                "fonts/dyslexie-bold.ttf",
+                "jarombek.png",
+                self.gif_key,
+                "posts/aj-switch.gif",
+            ],
+        )
+        self.assertEqual(result.skipped, 0)
+
+        font = self.s3.head_object(Bucket=self.bucket, Key="fonts/dyslexie-bold.ttf")
+        self.assertEqual(font.get("ContentType"), "font/ttf")
+
+        png = self.s3.head_object(Bucket=self.bucket, Key="jarombek.png")
+        self.assertEqual(png.get("ContentType"), "image/png")
+
+    def test_large_files_use_multipart(self) -> None:
+        """
+        Test that files larger than the part size are uploaded in multiple parts
+        """
+        self.sync()
+
+        gif = self.s3.head_object(Bucket=self.bucket, Key=self.gif_key)
+        self.assertTrue(gif.get("ETag").strip('"').endswith("-2"))
+        self.assertEqual(gif.get("ETag").strip('"'), multipart_etag(self.gif))
+
+    def test_sync_skips_unchanged(self) -> None:
+        """
+        Test that a second sync only uploads files which changed in between
+        """
+        self.sync()
+        self.assertEqual(self.sync().uploaded, [])
+
+        self.write("jarombek.png", b"\x89PNG a new jarombek")
+        result = self.sync()
+
+        self.assertEqual(result.uploaded, ["jarombek.png"])
+        self.assertEqual(result.replaced, ["jarombek.png"])
+        self.assertEqual(result.skipped, 3)
@@ -0,0 +1,156 @@
+"""
+Unit tests for the Cache-Control policy of the objects in the asset.jarombek.com S3 bucket, run against moto's
+in-memory S3 stand-in and the objects uploaded by Terraform.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from moto import mock_aws
+
+from tools.cache_policy import (
+    FINGERPRINTED,
+    IMMUTABLE,
+    MAPPING_KEY,
+    NO_CACHE,
+    SHORT_LIVED,
+    cache_control,
+    fingerprint,
+    policy,
+    published_keys,
+)
+from tools.manifest import ASSET_DIRECTORY, build_manifest, key_mapping, md5_file
+from tools.sync import create_client, sync
+from tools.terraform import OBJECTS_FILE
+
+
+@mock_aws
+class TestCachePolicy(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create an asset directory with a mutable root image, a post image, and a font
+        """
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        self.directory = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.directory.name, "asset")
+        os.makedirs(os.path.join(self.assets, "fonts"))
+        os.makedirs(os.path.join(self.assets, "posts"))
+
+        for key, content in (
+            ("jarombek.png", b"\x89PNG jarombek"),
+            ("posts/1-14-18-html.png", b"\x89PNG html"),
+            ("fonts/dyslexie-bold.ttf", b"\x00\x01\x00\x00 font"),
+        ):
+            with open(os.path.join(self.assets, key), "wb") as file:
+                file.write(content)
+
+        self.s3 = create_client(workers=4)
+        self.bucket = "asset.jarombek.com"
+        self.s3.create_bucket(Bucket=self.bucket)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_policy(self) -> None:
+        """
+        Test that post images are fingerprinted and cached forever, while mutable assets are short lived
+        """
+        self.assertEqual(policy("posts/1-14-18-html.png").cache_control, IMMUTABLE)
+        self.assertTrue(policy("posts/1-14-18-html.png").fingerprint)
+        self.assertEqual(policy("jarombek.png").cache_control, SHORT_LIVED)
+        self.assertFalse(policy("jarombek.png").fingerprint)
+        self.assertEqual(policy("fonts/dyslexie-bold.ttf").cache_control, SHORT_LIVED)
+        self.assertEqual(policy(MAPPING_KEY).cache_control, NO_CACHE)
+
+    def test_fingerprint(self) -> None:
+        """
+        Test that fingerprints are inserted before the extension of a key
+        """
+        self.assertEqual(
+            fingerprint("posts/1-14-18-html.png", "60472337e1b2c3d4"),
+            "posts/1-14-18-html.60472337.png",
+        )
+        self.assertEqual(
+            fingerprint("posts/switch.gif.webp", "0123456789abcdef"),
+            "posts/switch.gif.01234567.webp",
+        )
+
+    def test_legacy_keys(self) -> None:
+        """
+        Test that fingerprinted assets keep their original keys, which are short lived since their contents change
+        """
+        self.assertEqual(
+            published_keys("posts/1-14-18-html.png", "60472337e1b2c3d4"),
+            ["posts/1-14-18-html.60472337.png", "posts/1-14-18-html.png"],
+        )
+        self.assertEqual(
+            published_keys("jarombek.png", "0123456789abcdef"), ["jarombek.png"]
+        )
+        self.assertEqual(cache_control("posts/1-14-18-html.60472337.png"), IMMUTABLE)
+        self.assertEqual(cache_control("posts/1-14-18-html.png"), SHORT_LIVED)
+
+    def test_uploaded_objects_follow_policy(self) -> None:
+        """
+        Test that every uploaded object has the Cache-Control header its policy requires, and that post images
+        are uploaded under their fingerprinted keys as well as the original keys published articles link to
+        """
+        sync(self.assets, self.bucket, self.s3, workers=4, cache_path=None)
+        md5 = md5_file(os.path.join(self.assets, "posts/1-14-18-html.png"))
+
+        keys = [
+            obj["Key"]
+            for obj in self.s3.list_objects_v2(Bucket=self.bucket)["Contents"]
+        ]
+        self.assertEqual(
+            sorted(keys),
+            [
+                "fonts/dyslexie-bold.ttf",
+                "jarombek.png",
+                f"posts/1-14-18-html.{md5[:8]}.png",
+                "posts/1-14-18-html.png",
+            ],
+        )
+
+        for key in keys:
+            with self.subTest(key=key):
+                obj = self.s3.head_object(Bucket=self.bucket, Key=key)
+                self.assertEqual(obj.get("CacheControl"), cache_control(key))
+
+    def test_key_mapping_up_to_date(self) -> None:
+        """
+        Test that the committed asset-manifest.json maps every asset to the key it's published under
+        """
+        with open(os.path.join(ASSET_DIRECTORY, MAPPING_KEY)) as file:
+            committed = json.load(file)["assets"]
+
+        manifest = build_manifest(ASSET_DIRECTORY, None, workers=1)
+        self.assertEqual(
+            committed,
+            key_mapping(manifest),
+            "Regenerate it with 'python3 -m tools.manifest --write-mapping'",
+        )
+
+    def test_terraform_follows_policy(self) -> None:
+        """
+        Test that every object Terraform uploads has the Cache-Control header its policy requires, and that every
+        fingerprinted post image is still uploaded under its original key
+        """
+        with open(OBJECTS_FILE) as file:
+            objects = json.load(file)
+
+        self.assertGreater(len(objects), 0)
+
+        for key, obj in objects.items():
+            with self.subTest(key=key):
+                self.assertEqual(obj["key"], key)
+                self.assertEqual(obj["cache_control"], cache_control(key))
+
+        fingerprinted = [key for key in objects if FINGERPRINTED.search(key)]
+        self.assertGreater(len(fingerprinted), 0)
+        for key in fingerprinted:
+            with self.subTest(key=key):
+                self.assertIn(objects[key]["source"][len("asset/") :], objects)
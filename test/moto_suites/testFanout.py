@@ -0,0 +1,143 @@
+"""
+End to end tests for the subscriber email fan-out, run against moto's in-memory DynamoDB stand-in and a local SMTP
+sink.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import os
+import tempfile
+import unittest
+from typing import List
+from unittest import mock
+
+from moto import mock_aws
+
+from tools.fanout import Checkpoint, SMTPSender, fan_out, subscribers
+from tools.subscribers import HASH_KEY, TABLE, create_client, import_items
+from utils.smtp_server import LocalSMTPServer
+
+
+def subscriber(number: int, subscribed: bool = True) -> dict:
+    return {
+        "email": {"S": f"subscriber{number}@jarombek.com"},
+        "subscribed": {"BOOL": subscribed},
+        "created": {"S": "2026-10-18"},
+        "updated": {"S": "2026-10-18"},
+    }
+
+
+@mock_aws
+class TestFanout(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create the subscribers table in the DynamoDB stand-in, with a few users who have unsubscribed
+        """
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        self.client = create_client()
+        self.client.create_table(
+            TableName=TABLE,
+            AttributeDefinitions=[{"AttributeName": HASH_KEY, "AttributeType": "S"}],
+            KeySchema=[{"AttributeName": HASH_KEY, "KeyType": "HASH"}],
+            ProvisionedThroughput={"ReadCapacityUnits": 20, "WriteCapacityUnits": 20},
+        )
+        import_items(
+            [subscriber(i, subscribed=i % 10 != 0) for i in range(150)], self.client
+        )
+        self.expected = sorted(
+            f"subscriber{i}@jarombek.com" for i in range(150) if i % 10 != 0
+        )
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.directory.name, "checkpoint.txt")
+
+        # Retries back off without waiting, so temporary failures don't slow the tests down.
+        patcher = mock.patch("tools.fanout.backoff", return_value=0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def fan_out(self, sink: LocalSMTPServer, **kwargs):
+        return fan_out(
+            subscribers(self.client),
+            lambda: SMTPSender(sink.host, sink.port),
+            Checkpoint(self.checkpoint_path),
+            workers=4,
+            batch_size=10,
+            **kwargs,
+        )
+
+    def checkpointed(self) -> List[str]:
+        with open(self.checkpoint_path) as file:
+            return sorted(line.strip() for line in file)
+
+    def test_every_subscriber_emailed_once(self) -> None:
+        """
+        Test that each subscribed user receives exactly one email, and unsubscribed users receive none
+        """
+        with LocalSMTPServer() as sink:
+            result = self.fan_out(sink)
+
+        self.assertEqual(len(self.expected), result.sent)
+        self.assertEqual([], result.failed)
+        self.assertEqual(self.expected, sorted(sink.recipients()))
+        self.assertEqual(self.expected, self.checkpointed())
+        self.assertEqual("Welcome to jarombek.com", sink.messages[0].message["Subject"])
+
+    def test_sessions_reused(self) -> None:
+        """
+        Test that each worker sends all of its batches over one SMTP session
+        """
+        with LocalSMTPServer() as sink:
+            self.fan_out(sink)
+
+        self.assertLessEqual(sink.connections, 4)
+
+    def test_resume_after_interruption(self) -> None:
+        """
+        Test that a run which stopped partway resumes without emailing anyone twice
+        """
+        with LocalSMTPServer() as sink:
+            first = self.fan_out(sink, limit=50)
+            second = self.fan_out(sink)
+
+        self.assertEqual(50, first.sent)
+        self.assertEqual(len(self.expected) - 50, second.sent)
+        self.assertEqual(50, second.skipped)
+        self.assertEqual(self.expected, sorted(sink.recipients()))
+
+    def test_temporary_failures_retried(self) -> None:
+        """
+        Test that recipients the provider temporarily rejects are retried until they are sent
+        """
+        with LocalSMTPServer(deferred={self.expected[0]: 2}) as sink:
+            result = self.fan_out(sink)
+
+        self.assertEqual(2, result.retries)
+        self.assertEqual([], result.failed)
+        self.assertEqual(self.expected, sorted(sink.recipients()))
+
+    def test_permanent_failures_reported(self) -> None:
+        """
+        Test that recipients the provider rejects are reported as failures without being retried
+        """
+        rejected = self.expected[:2]
+        with LocalSMTPServer(rejected=rejected) as sink:
+            result = self.fan_out(sink)
+
+        self.assertEqual(rejected, sorted(result.failed))
+        self.assertEqual(0, result.retries)
+        self.assertEqual(self.expected[2:], sorted(sink.recipients()))
+        self.assertEqual(self.expected[2:], self.checkpointed())
+
+    def test_retries_give_up(self) -> None:
+        """
+        Test that a recipient which is never accepted fails after the maximum number of attempts
+        """
+        with LocalSMTPServer(deferred={self.expected[0]: 100}) as sink:
+            result = self.fan_out(sink, max_attempts=3)
+
+        self.assertEqual([self.expected[0]], result.failed)
+        self.assertEqual(len(self.expected) - 1, result.sent)
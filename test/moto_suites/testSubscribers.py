@@ -0,0 +1,253 @@
+"""
+Unit tests for the jarombek-com-subscribers bulk export and import tool, run against moto's in-memory DynamoDB
+stand-in and stubbed clients.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import io
+import os
+import unittest
+
+import boto3
+from botocore.stub import Stubber
+from moto import mock_aws
+
+from tools.subscribers import (
+    HASH_KEY,
+    TABLE,
+    Capacity,
+    TokenBucket,
+    batches,
+    create_client,
+    export_table,
+    import_items,
+    read_items,
+    table_capacity,
+    write_batch,
+)
+
+
+def subscriber(number: int) -> dict:
+    return {
+        "email": {"S": f"subscriber{number}@jarombek.com"},
+        "subscribed": {"BOOL": number % 2 == 0},
+        "created": {"S": "2026-10-18"},
+        "updated": {"S": "2026-10-18"},
+    }
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(10, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_burst_available_immediately(self) -> None:
+        """
+        Test that a full bucket hands out a second of capacity without waiting
+        """
+        self.bucket.acquire(10)
+        self.assertEqual([], self.clock.slept)
+
+    def test_acquire_waits_for_refill(self) -> None:
+        """
+        Test that an empty bucket waits until enough tokens are added
+        """
+        self.bucket.acquire(10)
+        self.bucket.acquire(5)
+        self.assertAlmostEqual(0.5, sum(self.clock.slept))
+
+    def test_debt_is_paid_off(self) -> None:
+        """
+        Test that consumption reported after a request delays the following requests
+        """
+        self.bucket.acquire(1)
+        self.bucket.consume(19)
+        self.bucket.acquire(1)
+        self.assertAlmostEqual(1.1, sum(self.clock.slept))
+
+    def test_sustained_rate(self) -> None:
+        """
+        Test that many small requests don't exceed the rate after the initial burst
+        """
+        for _ in range(60):
+            self.bucket.acquire(1)
+
+        self.assertAlmostEqual(5.0, self.clock.now)
+
+    def test_unlimited(self) -> None:
+        """
+        Test that a bucket without a rate never waits
+        """
+        bucket = TokenBucket(None, clock=self.clock, sleep=self.clock.sleep)
+        for _ in range(100):
+            bucket.acquire(100)
+            bucket.consume(100)
+
+        self.assertEqual([], self.clock.slept)
+
+
+class TestSubscribers(unittest.TestCase):
+    def test_capacity_matches_terraform(self) -> None:
+        """
+        Test that the rate limits are read from the provisioned capacity in dynamodb/main.tf
+        """
+        self.assertEqual(Capacity(read=20, write=20), table_capacity())
+
+    def test_batches_deduplicate_keys(self) -> None:
+        """
+        Test that items are grouped into batches of 25 without repeating a key in a batch
+        """
+        items = [subscriber(i) for i in range(30)] + [subscriber(29)]
+        result = list(batches(items))
+
+        self.assertEqual([25, 5], [len(batch) for batch in result])
+        self.assertEqual(
+            30, len({item[HASH_KEY]["S"] for batch in result for item in batch})
+        )
+
+    def test_read_items_skips_blank_lines(self) -> None:
+        lines = io.StringIO('{"email": {"S": "a@jarombek.com"}}\n\n')
+        self.assertEqual([{"email": {"S": "a@jarombek.com"}}], list(read_items(lines)))
+
+    def test_unprocessed_items_retried(self) -> None:
+        """
+        Test that items DynamoDB leaves unprocessed are resent until they are written
+        """
+        client = boto3.client(
+            "dynamodb",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        batch = [subscriber(i) for i in range(3)]
+        unprocessed = [{"PutRequest": {"Item": item}} for item in batch[1:]]
+
+        with Stubber(client) as stub:
+            stub.add_response(
+                "batch_write_item",
+                {"UnprocessedItems": {TABLE: unprocessed}},
+                {
+                    "RequestItems": {
+                        TABLE: [{"PutRequest": {"Item": item}} for item in batch]
+                    },
+                    "ReturnConsumedCapacity": "TOTAL",
+                },
+            )
+            stub.add_response(
+                "batch_write_item",
+                {"UnprocessedItems": {}},
+                {
+                    "RequestItems": {TABLE: unprocessed},
+                    "ReturnConsumedCapacity": "TOTAL",
+                },
+            )
+
+            result = write_batch(
+                client, TABLE, batch, TokenBucket(None), sleep=lambda seconds: None
+            )
+
+        self.assertEqual(3, result.items)
+        self.assertEqual(1, result.retries)
+
+    def test_consumed_capacity_settled(self) -> None:
+        """
+        Test that the token bucket is charged the capacity DynamoDB reports, rather than the estimate
+        """
+        client = boto3.client(
+            "dynamodb",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        clock = FakeClock()
+        bucket = TokenBucket(20, clock=clock, sleep=clock.sleep)
+
+        with Stubber(client) as stub:
+            stub.add_response(
+                "batch_write_item",
+                {
+                    "UnprocessedItems": {},
+                    "ConsumedCapacity": [{"TableName": TABLE, "CapacityUnits": 6.0}],
+                },
+            )
+            result = write_batch(
+                client, TABLE, [subscriber(i) for i in range(3)], bucket
+            )
+
+        self.assertEqual(6.0, result.capacity_units)
+        self.assertAlmostEqual(14.0, bucket.tokens)
+
+    def test_unprocessed_items_give_up(self) -> None:
+        """
+        Test that a batch which is never fully processed raises an error instead of dropping items
+        """
+        client = boto3.client(
+            "dynamodb",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        batch = [subscriber(0)]
+
+        with Stubber(client) as stub:
+            for _ in range(2):
+                stub.add_response(
+                    "batch_write_item",
+                    {"UnprocessedItems": {TABLE: [{"PutRequest": {"Item": batch[0]}}]}},
+                )
+
+            with self.assertRaises(RuntimeError):
+                write_batch(
+                    client,
+                    TABLE,
+                    batch,
+                    TokenBucket(None),
+                    max_attempts=2,
+                    sleep=lambda seconds: None,
+                )
+
+
+@mock_aws
+class TestSubscribersTable(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create the subscribers table in the DynamoDB stand-in
+        """
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        self.client = create_client(workers=4)
+        self.client.create_table(
+            TableName=TABLE,
+            AttributeDefinitions=[{"AttributeName": HASH_KEY, "AttributeType": "S"}],
+            KeySchema=[{"AttributeName": HASH_KEY, "KeyType": "HASH"}],
+            ProvisionedThroughput={"ReadCapacityUnits": 20, "WriteCapacityUnits": 20},
+        )
+
+    def test_import_export_round_trip(self) -> None:
+        """
+        Test that imported items are all exported by a segmented scan, unchanged
+        """
+        items = [subscriber(i) for i in range(250)]
+        imported = import_items(items, self.client, workers=4)
+        self.assertEqual(250, imported.items)
+
+        output = io.StringIO()
+        exported = export_table(output, self.client, workers=3)
+        self.assertEqual(250, exported.items)
+
+        output.seek(0)
+        key = lambda item: item[HASH_KEY]["S"]
+        self.assertEqual(sorted(items, key=key), sorted(read_items(output), key=key))
@@ -4,21 +4,279 @@ Author: Andrew Jarombek
 Date: 5/27/2019
 """
 
-import unittest
+import argparse
+import datetime
+import os
 import sys
+import unittest
+from typing import Optional
+
+from tools.history import History, current_commit
+from utils.cassette import OFFLINE, Cassette, RECORD, REPLAY
+from utils.environments import (
+    DEFAULT_ENVIRONMENT,
+    ENVIRONMENTS,
+    environment_summary,
+    with_environments,
+)
+from utils.fixtures import AWS
+from utils.instrumentation import Instrumentation
+from utils.parallel import ParallelTextTestRunner
+from utils.results import collect, write_json, write_junit
+from utils.selection import MOTO_SUITES_DIRECTORY, affected_suites, changed_files
+
+SUITES = "suites"
+MOTO_SUITES = os.path.basename(MOTO_SUITES_DIRECTORY)
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments passed to the test runner.
+    :return: A namespace containing the argument values.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the jarombek.com AWS infrastructure test suites."
+    )
+    parser.add_argument(
+        "log_filename",
+        nargs="?",
+        help="File to write the test log to.  Defaults to standard error.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of test units to run concurrently.  Defaults to 1 (serial).",
+    )
+    parser.add_argument(
+        "--granularity",
+        choices=["class", "test"],
+        default="class",
+        help="Whether a unit of concurrent work is a test class or a single test.",
+    )
+
+    parser.add_argument(
+        "--suites",
+        choices=[SUITES, MOTO_SUITES],
+        default=SUITES,
+        help="Directory of test suites to run.  The moto suites mock AWS for the whole process, so they run "
+        "separately from the live suites and only serially.",
+    )
+
+    parser.add_argument(
+        "--env",
+        nargs="+",
+        choices=ENVIRONMENTS,
+        help="Environments to test.  Tests of each environment run concurrently with --workers.  Defaults to the "
+        "TEST_ENV environment variable, or prod.",
+    )
+
+    parser.add_argument(
+        "--instrument",
+        metavar="REPORT",
+        help="Record the count, latency, retries, and throttling of every AWS API call per test, and write them to "
+        "a JSON report.",
+    )
+
+    parser.add_argument(
+        "--junit", metavar="PATH", help="Write the results of every test as JUnit XML."
+    )
+    parser.add_argument(
+        "--json",
+        metavar="PATH",
+        help="Write the outcome and duration of every test as JSON.",
+    )
+    parser.add_argument(
+        "--history",
+        metavar="DATABASE",
+        help="Append the outcome and duration of every test to a SQLite history, which 'python3 -m tools.history "
+        "compare' checks for regressions.",
+    )
+
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="Only run the test suites affected by the files changed since a git revision.",
+    )
+
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record every AWS API response to a cassette file.",
+    )
+    cassette.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Serve AWS API responses from a cassette file instead of AWS.",
+    )
+    args = parser.parse_args()
+    if args.suites == MOTO_SUITES and args.workers > 1:
+        parser.error(
+            "The moto suites patch botocore for every thread, so they must run with --workers 1"
+        )
+
+    args.env = args.env or [os.environ.get("TEST_ENV", DEFAULT_ENVIRONMENT)]
+    return args
+
+
+def install_cassette(args: argparse.Namespace) -> Optional[Cassette]:
+    """
+    Hook a record or replay cassette into boto3, if one was requested.  This must happen before the test suites
+    are discovered, since some modules create boto3 clients when they are imported.
+    :param args: Command line arguments passed to the test runner.
+    :return: The installed cassette, or None if the tests run against AWS without recording.
+    """
+    if args.replay:
+        # Replayed runs never reach AWS, so they shouldn't need real credentials or go looking for them.
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "replay")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "replay")
+        cassette = Cassette(args.replay, REPLAY)
+        OFFLINE.set()
+    elif args.record:
+        cassette = Cassette(args.record, RECORD)
+    else:
+        return None
+
+    cassette.install()
+    return cassette
+
+
+def install_instrumentation(args: argparse.Namespace) -> Optional[Instrumentation]:
+    """
+    Hook API call instrumentation into boto3, if it was requested.  When it isn't, no event handlers are registered.
+    :param args: Command line arguments passed to the test runner.
+    :return: The installed instrumentation, or None.
+    """
+    if not args.instrument:
+        return None
+
+    instrumentation = Instrumentation()
+    instrumentation.install()
+    return instrumentation
+
+
+def load_tests(args: argparse.Namespace, stream) -> unittest.TestSuite:
+    """
+    Discover the test suites to run, with a variant of the environment parametrized tests for each environment.
+    :param args: Command line arguments passed to the test runner.
+    :param stream: Stream which the selected suites are written to.
+    :return: The test suite to run.
+    """
+    return with_environments(discover(args, stream), args.env)
+
+
+def discover(args: argparse.Namespace, stream) -> unittest.TestSuite:
+    """
+    Discover the test suites.  With --changed-since, only suites affected by the changed files are loaded.
+    :param args: Command line arguments passed to the test runner.
+    :param stream: Stream which the selected suites are written to.
+    :return: The discovered test suites.
+    """
+    loader = unittest.TestLoader()
+    if not args.changed_since:
+        return loader.discover(args.suites)
+
+    changed = changed_files(args.changed_since)
+    suites = (
+        affected_suites(changed, os.path.abspath(args.suites))
+        if changed is not None
+        else None
+    )
+    if suites is None:
+        stream.write(
+            f"Running every test suite for changes since {args.changed_since}\n"
+        )
+        return loader.discover(args.suites)
+
+    stream.write(
+        f"Running {len(suites)} test suites affected by {len(changed)} changed files: "
+        f"{', '.join(sorted(suites)) or 'none'}\n"
+    )
+    return unittest.TestSuite(
+        loader.discover(args.suites, pattern=f"{suite}.py") for suite in sorted(suites)
+    )
+
+
+def save_results(
+    result: unittest.TestResult, args: argparse.Namespace, started: datetime.datetime
+) -> None:
+    """
+    Write the outcome and duration of every test to the result files and history requested on the command line.
+    :param result: The merged result of the test run.
+    :param args: Command line arguments passed to the test runner.
+    :param started: When the test run started.
+    """
+    if not (args.junit or args.json or args.history):
+        return
+
+    records = collect(result)
+    commit = current_commit()
+
+    if args.junit:
+        write_junit(records, args.junit)
+    if args.json:
+        write_json(
+            records,
+            args.json,
+            started=started.isoformat(timespec="seconds"),
+            commit=commit,
+            environments=args.env,
+        )
+    if args.history:
+        with History(args.history) as history:
+            history.append(records, started, commit, args.workers)
+
+
+def run(
+    tests: unittest.TestSuite,
+    stream,
+    args: argparse.Namespace,
+    instrumentation: Optional[Instrumentation] = None,
+) -> int:
+    """
+    Execute the test suite and determine the exit code of the runner.
+    :param tests: The test suite to run.
+    :param stream: Stream which the test log is written to.
+    :param args: Command line arguments passed to the test runner.
+    :param instrumentation: API call instrumentation to report on after the tests run.
+    :return: The number of tests which errored.
+    """
+    runner = ParallelTextTestRunner(
+        stream, workers=args.workers, granularity=args.granularity, verbosity=3
+    )
+    started = datetime.datetime.now(datetime.timezone.utc)
+    result: unittest.TestResult = runner.run(tests)
+    runner.stream.writeln(environment_summary(result, args.env))
+    runner.stream.writeln(AWS.stats())
+    save_results(result, args, started)
+
+    if instrumentation:
+        instrumentation.save(args.instrument)
+        runner.stream.writeln(
+            f"Slowest AWS API calls (full report in {args.instrument}):"
+        )
+        runner.stream.writeln(instrumentation.table())
+
+    return len(result.errors)
+
 
 if __name__ == "__main__":
+    args = parse_args()
+    cassette = install_cassette(args)
+    instrumentation = install_instrumentation(args)
+
     # Create the test suite
-    tests = unittest.TestLoader().discover("suites")
-
-    if len(sys.argv) > 1:
-        log_filename = sys.argv[1]
-        with open(log_filename, "w+") as log_file:
-            # Create a test runner an execute the test suite
-            runner = unittest.TextTestRunner(log_file, verbosity=3)
-            result: unittest.TestResult = runner.run(tests)
-            exit(len(result.errors))
+    tests = load_tests(args, sys.stderr)
+
+    if args.log_filename:
+        with open(args.log_filename, "w+") as log_file:
+            exit_code = run(tests, log_file, args, instrumentation)
     else:
-        runner = unittest.TextTestRunner(verbosity=3)
-        result: unittest.TestResult = runner.run(tests)
-        exit(len(result.errors))
+        exit_code = run(tests, sys.stderr, args, instrumentation)
+
+    if cassette and cassette.mode == RECORD:
+        cassette.save()
+
+    exit(exit_code)
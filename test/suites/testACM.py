@@ -5,32 +5,28 @@ Date: 5/27/2019
 """
 
 import unittest
-import os
 
-import boto3
+from utils.environments import EnvironmentTestCase
+from utils.fixtures import AWS
 
-try:
-    prod_env = os.environ["TEST_ENV"] == "prod"
-except KeyError:
-    prod_env = True
 
-
-class TestACM(unittest.TestCase):
+class TestACM(EnvironmentTestCase):
     def setUp(self) -> None:
         """
         Perform set-up logic before executing any unit tests
         """
-        self.acm = boto3.client("acm")
-        self.acm_certificates = self.acm.list_certificates(
-            CertificateStatuses=["ISSUED"]
+        self.acm_certificates = AWS.call(
+            "acm", "list_certificates", CertificateStatuses=["ISSUED"]
         )
 
-    @unittest.skipIf(prod_env, "Dev wildcard certificate not needed for production.")
-    @unittest.skipIf(not prod_env, "Dev website not currently running.")
+    @unittest.skip("Dev website not currently running.")
     def test_dev_wildcard_cert_issued(self) -> None:
         """
         Test that the dev wildcard ACM certificate exists
         """
+        if self.env == "prod":
+            self.skipTest("Dev wildcard certificate not needed for production.")
+
         for cert in self.acm_certificates.get("CertificateSummaryList"):
             if cert.get("DomainName") == "*.dev.jarombek.com":
                 self.assertTrue(True)
@@ -0,0 +1,187 @@
+"""
+Unit tests for the asset manifest and bucket diff engine.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from tools.manifest import (
+    build_manifest,
+    content_type,
+    diff,
+    is_compressible,
+    main,
+    md5_file,
+    multipart_etag,
+    write_compressed,
+)
+
+
+class TestAssetManifest(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create a small asset directory with a hash cache next to it
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.directory.name, "asset")
+        self.cache = os.path.join(self.directory.name, "cache.json")
+        os.makedirs(os.path.join(self.assets, "posts"))
+
+        self.write("jarombek.png", b"\x89PNG jarombek")
+        self.write("flag.svg", b"<svg></svg>")
+        self.write("posts/aj-switch.gif", b"GIF89a" * 1000)
+        self.write("posts/empty.png", b"")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, key: str, content: bytes) -> None:
+        with open(os.path.join(self.assets, key), "wb") as file:
+            file.write(content)
+
+    def test_manifest_entries(self) -> None:
+        """
+        Test that the manifest has the key, size, digest, and content type of every file
+        """
+        manifest = build_manifest(self.assets, self.cache, workers=2)
+
+        self.assertEqual(
+            sorted(manifest),
+            ["flag.svg", "jarombek.png", "posts/aj-switch.gif", "posts/empty.png"],
+        )
+
+        gif = manifest["posts/aj-switch.gif"]
+        self.assertEqual(gif.size, 6000)
+        self.assertEqual(gif.md5, md5_file(gif.path))
+        self.assertEqual(gif.content_type, "image/gif")
+        self.assertEqual(manifest["flag.svg"].content_type, "image/svg+xml")
+        self.assertEqual(manifest["flag.svg"].encoding, "gzip")
+        self.assertEqual(manifest["jarombek.png"].encoding, None)
+        self.assertEqual(
+            manifest["posts/empty.png"].md5, "d41d8cd98f00b204e9800998ecf8427e"
+        )
+
+    def test_hash_cache_reused(self) -> None:
+        """
+        Test that unchanged files are served from the hash cache and changed files are rehashed
+        """
+        build_manifest(self.assets, self.cache, workers=1, save_cache=True)
+
+        # Poison the cached digest of an unchanged file, which proves it isn't rehashed.
+        with open(self.cache) as file:
+            cache = json.load(file)
+        cache["flag.svg"]["md5"] = "cached"
+        with open(self.cache, "w") as file:
+            json.dump(cache, file)
+
+        self.write("jarombek.png", b"\x89PNG a new jarombek")
+        manifest = build_manifest(self.assets, self.cache, workers=1)
+
+        self.assertEqual(manifest["flag.svg"].md5, "cached")
+        self.assertEqual(
+            manifest["jarombek.png"].md5, md5_file(manifest["jarombek.png"].path)
+        )
+
+    def test_cli_saves_hash_cache(self) -> None:
+        """
+        Test that repeat runs of the command line tool only rehash the files which changed since the last run
+        """
+        argv = ["--directory", self.assets, "--cache", self.cache, "--workers", "1"]
+        # The first run writes asset-manifest.json, which the second run hashes like any other asset.
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(2):
+                main([*argv, "--write-mapping"])
+
+        # Poison every cached digest, so only rehashed files have their real digest.
+        with open(self.cache) as file:
+            cache = json.load(file)
+        for entry in cache.values():
+            entry["md5"] = "cached"
+        with open(self.cache, "w") as file:
+            json.dump(cache, file)
+
+        self.write("jarombek.png", b"\x89PNG a new jarombek")
+        with contextlib.redirect_stdout(io.StringIO()):
+            main([*argv, "--write-mapping"])
+
+        with open(self.cache) as file:
+            digests = {key: entry["md5"] for key, entry in json.load(file).items()}
+
+        rehashed = {key for key, md5 in digests.items() if md5 != "cached"}
+        self.assertEqual({"jarombek.png"}, rehashed)
+        self.assertEqual(
+            md5_file(os.path.join(self.assets, "jarombek.png")),
+            digests["jarombek.png"],
+        )
+
+    def test_manifest_read_only(self) -> None:
+        """
+        Test that building a manifest writes nothing to disk, and that the compressed copies written afterwards have
+        the digests in the manifest
+        """
+        manifest = build_manifest(self.assets, self.cache, workers=2)
+        svg = manifest["flag.svg"]
+
+        self.assertEqual(os.listdir(self.directory.name), ["asset"])
+        self.assertEqual(write_compressed(self.assets, manifest), ["flag.svg"])
+        self.assertEqual(md5_file(svg.path), svg.md5)
+        self.assertEqual(os.path.getsize(svg.path), svg.size)
+        self.assertEqual(write_compressed(self.assets, manifest), [])
+
+    def test_diff(self) -> None:
+        """
+        Test that missing, stale, and orphaned objects are all reported
+        """
+        manifest = build_manifest(self.assets, None, workers=1)
+        png = manifest["jarombek.png"]
+        gif = manifest["posts/aj-switch.gif"]
+
+        objects = [
+            {"Key": "flag.svg", "Size": 11, "ETag": '"stale"'},
+            {"Key": "jarombek.png", "Size": png.size, "ETag": f'"{png.md5}"'},
+            {
+                "Key": "posts/aj-switch.gif",
+                "Size": gif.size,
+                "ETag": f'"{multipart_etag(gif.path)}"',
+            },
+            {"Key": "posts/removed.png", "Size": 10, "ETag": '"removed"'},
+        ]
+        result = diff(manifest, iter(objects))
+
+        self.assertEqual(result.missing, ["posts/empty.png"])
+        self.assertEqual(result.stale, ["flag.svg"])
+        self.assertEqual(result.orphaned, ["posts/removed.png"])
+        self.assertFalse(result.in_sync)
+
+    def test_content_type_matches_terraform(self) -> None:
+        """
+        Test that content types match those used by the aws_s3_object resources, except EOT fonts, which the
+        hand-written resources served as font/otf
+        """
+        self.assertEqual(content_type("computer.jpg"), "image/jpeg")
+        self.assertEqual(
+            content_type("fonts/ElegantIcons.eot"), "application/vnd.ms-fontobject"
+        )
+        self.assertEqual(content_type("fonts/ElegantIcons.woff"), "font/woff")
+        self.assertEqual(content_type("fonts/dyslexie-bold.ttf"), "font/ttf")
+
+    def test_binary_fonts_not_compressed(self) -> None:
+        """
+        Test that TrueType and OpenType fonts are precompressed, while font formats which are already compressed
+        aren't
+        """
+        for key, compressible in (
+            ("fonts/dyslexie-bold.ttf", True),
+            ("fonts/Longway-Regular.otf", True),
+            ("fonts/ElegantIcons.eot", False),
+            ("fonts/ElegantIcons.woff", False),
+            ("fonts/ElegantIcons.woff2", False),
+        ):
+            with self.subTest(key=key):
+                self.assertEqual(compressible, is_compressible(key))
@@ -0,0 +1,122 @@
+"""
+Unit tests for the asset image optimization pipeline.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import filecmp
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image, ImageChops, ImageDraw
+
+from tools.optimize import optimize, variant_formats, variant_path
+
+
+class TestAssetOptimize(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create an asset directory with an uncompressed PNG, a JPEG, and an animated GIF
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.directory.name, "asset")
+        self.cache = os.path.join(self.directory.name, "optimize.json")
+        self.hash_cache = os.path.join(self.directory.name, "hashes.json")
+        os.makedirs(os.path.join(self.assets, "posts"))
+
+        gradient = Image.linear_gradient("L").resize((128, 128)).convert("RGB")
+        self.png = os.path.join(self.assets, "posts", "screenshot.png")
+        gradient.save(self.png, "PNG", compress_level=0)
+        gradient.save(os.path.join(self.assets, "computer.jpg"), "JPEG", quality=95)
+
+        frames = []
+        for frame in range(5):
+            image = Image.new("RGB", (64, 64), "white")
+            ImageDraw.Draw(image).rectangle(
+                [frame * 10, 0, frame * 10 + 9, 63], fill="red"
+            )
+            frames.append(image)
+
+        self.gif = os.path.join(self.assets, "posts", "switch.gif")
+        frames[0].save(
+            self.gif, "GIF", save_all=True, append_images=frames[1:], duration=100
+        )
+
+        self.original_png = Image.open(self.png)
+        self.original_png.load()
+
+    def tearDown(self) -> None:
+        self.original_png.close()
+        self.directory.cleanup()
+
+    def optimize(self):
+        return optimize(self.assets, self.cache, self.hash_cache, workers=2)
+
+    def test_png_recompressed_losslessly(self) -> None:
+        """
+        Test that a PNG shrinks without any of its pixels changing
+        """
+        results = {result.key: result for result in self.optimize()}
+        png = results["posts/screenshot.png"]
+
+        self.assertLess(png.optimized_size, png.original_size)
+
+        with Image.open(self.png) as optimized:
+            difference = ImageChops.difference(
+                optimized.convert("RGB"), self.original_png.convert("RGB")
+            )
+            self.assertIsNone(difference.getbbox())
+
+    def test_variants_generated(self) -> None:
+        """
+        Test that modern format variants are written next to the originals, including animated ones
+        """
+        results = {result.key: result for result in self.optimize()}
+
+        for extension in results["posts/screenshot.png"].variants:
+            self.assertIn(extension, variant_formats())
+            self.assertTrue(os.path.exists(variant_path(self.png, extension)))
+
+        self.assertIn("webp", results["posts/switch.gif"].variants)
+        with Image.open(variant_path(self.gif, "webp")) as webp:
+            self.assertEqual(webp.n_frames, 5)
+
+    def test_unchanged_files_not_reprocessed(self) -> None:
+        """
+        Test that a second run serves every image from the cache without rewriting any files
+        """
+        first = self.optimize()
+        modified = {
+            path: os.stat(path).st_mtime_ns
+            for path in (self.png, variant_path(self.png, "webp"))
+        }
+
+        second = self.optimize()
+
+        self.assertEqual(first, second)
+        for path, mtime in modified.items():
+            self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+
+    def test_dry_run(self) -> None:
+        """
+        Test that a dry run reports the savings without touching the asset directory or the cache
+        """
+        original = os.path.join(self.directory.name, "original")
+        shutil.copytree(self.assets, original)
+
+        results = optimize(
+            self.assets, self.cache, self.hash_cache, workers=2, dry_run=True
+        )
+        png = {result.key: result for result in results}["posts/screenshot.png"]
+
+        self.assertLess(png.optimized_size, png.original_size)
+        self.assertIn("webp", png.variants)
+        self.assertFalse(os.path.exists(self.cache))
+
+        comparison = filecmp.dircmp(original, self.assets)
+        for directory in (comparison, comparison.subdirs["posts"]):
+            self.assertEqual(
+                [], directory.left_only + directory.right_only + directory.diff_files
+            )
@@ -0,0 +1,89 @@
+"""
+Unit tests for the asset reachability and latency probe, run against a local HTTP stand-in.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import os
+import tempfile
+import unittest
+
+from tools.probe import Thresholds, percentile, probe, violations
+from utils.http_server import LocalHTTPServer
+
+
+class TestAssetProbe(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create a directory of assets to serve
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.directory.name, "posts"))
+
+        self.keys = [f"posts/image-{index}.png" for index in range(40)]
+        for index, key in enumerate(self.keys):
+            with open(os.path.join(self.directory.name, key), "wb") as file:
+                file.write(b"\x89PNG" * (index + 1))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_every_object_probed(self) -> None:
+        """
+        Test that every object is requested over no more keep-alive connections than the concurrency limit
+        """
+        with LocalHTTPServer(self.directory.name, latency_ms=5) as server:
+            report = probe(server.url, self.keys, concurrency=4)
+
+        self.assertEqual([result.key for result in report.results], sorted(self.keys))
+        self.assertEqual(report.errors, [])
+        self.assertEqual(report.bytes, sum(4 * (index + 1) for index in range(40)))
+        self.assertEqual(server.requests, 40)
+        self.assertLessEqual(server.connections, 4)
+
+        for result in report.results:
+            self.assertEqual(result.status, 200)
+            self.assertGreaterEqual(result.total, result.ttfb)
+            self.assertGreaterEqual(result.ttfb, 0.005)
+
+        self.assertGreater(report.throughput, 0)
+        self.assertLessEqual(report.percentile(50), report.percentile(99))
+
+    def test_errors_fail_thresholds(self) -> None:
+        """
+        Test that missing objects are reported as errors and exceed the error rate threshold
+        """
+        with LocalHTTPServer(self.directory.name) as server:
+            report = probe(server.url, self.keys + ["posts/missing.png"], concurrency=4)
+
+        self.assertEqual(
+            [result.key for result in report.errors], ["posts/missing.png"]
+        )
+        self.assertEqual(report.errors[0].status, 404)
+        self.assertAlmostEqual(report.error_rate, 1 / 41)
+
+        self.assertEqual(len(violations(report, Thresholds(max_error_rate=0.0))), 1)
+        self.assertEqual(violations(report, Thresholds(max_error_rate=0.05)), [])
+
+    def test_slow_objects_fail_thresholds(self) -> None:
+        """
+        Test that a slow tail fails the p99 threshold without failing the p50 threshold
+        """
+        with LocalHTTPServer(
+            self.directory.name, slow_paths={"/posts/image-0.png": 300}
+        ) as server:
+            report = probe(server.url, self.keys, concurrency=8)
+
+        problems = violations(report, Thresholds(p50=0.2, p99=0.2))
+        self.assertEqual(len(problems), 1)
+        self.assertTrue(problems[0].startswith("p99 latency"))
+
+    def test_percentile(self) -> None:
+        """
+        Test that percentiles are computed with the nearest-rank method
+        """
+        values = [0.1 * index for index in range(1, 101)]
+        self.assertAlmostEqual(percentile(values, 50), 5.0)
+        self.assertAlmostEqual(percentile(values, 95), 9.5)
+        self.assertAlmostEqual(percentile(values, 100), 10.0)
+        self.assertEqual(percentile([], 95), 0.0)
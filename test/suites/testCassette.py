@@ -0,0 +1,176 @@
+"""
+Unit tests for recording and replaying boto3 API calls with cassettes.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import datetime
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import boto3
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+
+from utils.cassette import Cassette, CassetteMissError, RECORD, REPLAY
+
+GET_ROLE = b"""<GetRoleResponse xmlns="https://iam.amazonaws.com/doc/2010-05-08/">
+  <GetRoleResult>
+    <Role>
+      <Path>/admin/</Path>
+      <AssumeRolePolicyDocument>%7B%22Version%22%3A%222012-10-17%22%7D</AssumeRolePolicyDocument>
+      <RoleName>ecs-task-role</RoleName>
+      <RoleId>AROAEXAMPLE</RoleId>
+      <Arn>arn:aws:iam::123456789012:role/admin/ecs-task-role</Arn>
+      <CreateDate>2024-01-28T12:00:00Z</CreateDate>
+    </Role>
+  </GetRoleResult>
+  <ResponseMetadata><RequestId>1</RequestId></ResponseMetadata>
+</GetRoleResponse>"""
+
+
+class _IAMHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for IAM which answers every request with a role.
+    """
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(len(GET_ROLE)))
+        self.end_headers()
+        self.wfile.write(GET_ROLE)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def offline_session() -> boto3.session.Session:
+    return boto3.session.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-east-1",
+    )
+
+
+class TestCassette(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Record a cassette containing a successful and a failed API call
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cassette.json.gz")
+
+        cassette = Cassette(self.path, RECORD)
+        session = offline_session()
+        cassette.install(session)
+        acm = session.client("acm")
+        iam = session.client("iam")
+
+        with Stubber(acm) as acm_stub, Stubber(iam) as iam_stub:
+            acm_stub.add_response(
+                "list_certificates",
+                {
+                    "CertificateSummaryList": [
+                        {
+                            "CertificateArn": "arn:aws:acm:us-east-1:123456789012:certificate/1",
+                            "DomainName": "*.jarombek.com",
+                            "CreatedAt": datetime.datetime(2024, 1, 28, 12, 0),
+                        }
+                    ]
+                },
+                {"CertificateStatuses": ["ISSUED"]},
+            )
+            iam_stub.add_client_error(
+                "get_role",
+                service_error_code="NoSuchEntity",
+                http_status_code=404,
+                expected_params={"RoleName": "missing-role"},
+            )
+
+            self.recorded = acm.list_certificates(CertificateStatuses=["ISSUED"])
+            with self.assertRaises(ClientError):
+                iam.get_role(RoleName="missing-role")
+
+        cassette.save()
+
+        replay_session = offline_session()
+        Cassette(self.path, REPLAY).install(replay_session)
+        self.acm = replay_session.client("acm")
+        self.iam = replay_session.client("iam")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_replay_matches_recording(self) -> None:
+        """
+        Test that a replayed response is identical to the recorded one, including datetimes
+        """
+        replayed = self.acm.list_certificates(CertificateStatuses=["ISSUED"])
+        self.assertEqual(
+            replayed.get("CertificateSummaryList"),
+            self.recorded.get("CertificateSummaryList"),
+        )
+
+    def test_replay_client_error(self) -> None:
+        """
+        Test that a recorded error response is raised again when it is replayed
+        """
+        with self.assertRaises(ClientError) as context:
+            self.iam.get_role(RoleName="missing-role")
+
+        self.assertEqual(context.exception.response["Error"]["Code"], "NoSuchEntity")
+
+    def test_replay_unrecorded_request(self) -> None:
+        """
+        Test that a request with parameters missing from the cassette fails with a clear error
+        """
+        with self.assertRaises(CassetteMissError):
+            self.acm.list_certificates(CertificateStatuses=["EXPIRED"])
+
+    def test_cassette_deterministic(self) -> None:
+        """
+        Test that saving the same interactions twice produces byte-for-byte identical cassettes
+        """
+        cassette = Cassette(self.path, REPLAY)
+        copy_path = os.path.join(self.directory.name, "copy.json.gz")
+        cassette.path = copy_path
+        cassette.save()
+
+        with open(self.path, "rb") as original, open(copy_path, "rb") as copy:
+            self.assertEqual(original.read(), copy.read())
+
+    def test_replay_decoded_response(self) -> None:
+        """
+        Test that a response botocore changes after parsing, such as an IAM role's URL encoded policy document, is
+        recorded before it's changed, so it replays the same way
+        """
+        path = os.path.join(self.directory.name, "iam.json.gz")
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _IAMHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            host, port = server.server_address[:2]
+            cassette = Cassette(path, RECORD)
+            session = offline_session()
+            cassette.install(session)
+            iam = session.client("iam", endpoint_url=f"http://{host}:{port}")
+            recorded = iam.get_role(RoleName="ecs-task-role")
+            cassette.save()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        replay_session = offline_session()
+        Cassette(path, REPLAY).install(replay_session)
+        replayed = replay_session.client("iam").get_role(RoleName="ecs-task-role")
+
+        self.assertEqual(
+            recorded["Role"]["AssumeRolePolicyDocument"], {"Version": "2012-10-17"}
+        )
+        self.assertEqual(replayed["Role"], recorded["Role"])
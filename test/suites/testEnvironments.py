@@ -0,0 +1,112 @@
+"""
+Unit tests for environment parametrized test classes and running every environment's variant in one test run.
+These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import io
+import threading
+import unittest
+
+from utils.environments import (
+    EnvironmentTestCase,
+    environment_of,
+    environment_summary,
+    with_environments,
+)
+from utils.parallel import ParallelTextTestRunner, iter_tests
+
+
+def sample_class(barrier: threading.Barrier = None) -> type:
+    """
+    Create an environment parametrized test class.  It's created inside a function so discovery doesn't run it.
+    :param barrier: If given, every test waits on it, so the tests only pass when they run concurrently.
+    """
+
+    class TestSample(EnvironmentTestCase):
+        setups = []
+
+        @classmethod
+        def setUpClass(cls) -> None:
+            cls.setups.append(cls.env)
+
+        def test_environment(self) -> None:
+            if barrier:
+                barrier.wait(timeout=5)
+            self.assertIn(self.env, ("prod", "dev"))
+
+        def test_prod_only(self) -> None:
+            if self.env != "prod":
+                self.skipTest("Only deployed to production.")
+
+        def test_dev_broken(self) -> None:
+            self.assertEqual("prod", self.env)
+
+    return TestSample
+
+
+class TestEnvironments(unittest.TestCase):
+    def test_default_environment(self) -> None:
+        """
+        Test that a parametrized test class run on its own tests production
+        """
+        self.assertEqual("prod", sample_class().env)
+
+    def test_variants(self) -> None:
+        """
+        Test that each environment gets its own test class, grouped after the tests which aren't parametrized
+        """
+        sample = sample_class()
+        loader = unittest.TestLoader()
+        suite = unittest.TestSuite(
+            [
+                loader.loadTestsFromTestCase(sample),
+                loader.loadTestsFromTestCase(TestEnvironments),
+            ]
+        )
+
+        tests = list(iter_tests(with_environments(suite, ["prod", "dev"])))
+        envs = [getattr(test, "env", None) for test in tests]
+        count = len(loader.getTestCaseNames(TestEnvironments))
+        self.assertEqual([None] * count + ["prod"] * 3 + ["dev"] * 3, envs)
+
+        variants = {type(test) for test in tests[count:]}
+        self.assertEqual(2, len(variants))
+        self.assertTrue(all(issubclass(variant, sample) for variant in variants))
+        self.assertTrue(tests[-1].id().endswith(".TestSample[dev].test_prod_only"))
+
+    def test_unknown_environment(self) -> None:
+        with self.assertRaises(ValueError):
+            sample_class().for_environment("staging")
+
+    def test_environment_of(self) -> None:
+        self.assertEqual(
+            "dev", environment_of("setUpClass (suites.testACM.TestACM[dev])")
+        )
+        self.assertIsNone(environment_of("suites.testIAM.TestIAM.test_role"))
+
+    def test_environments_run_concurrently(self) -> None:
+        """
+        Test that the prod and dev variants run at the same time, with their own class fixtures and results
+        """
+        sample = sample_class(barrier=threading.Barrier(2))
+        suite = with_environments(
+            unittest.TestLoader().loadTestsFromTestCase(sample), ["prod", "dev"]
+        )
+
+        stream = io.StringIO()
+        runner = ParallelTextTestRunner(stream, workers=2, verbosity=2)
+        result = runner.run(suite)
+
+        self.assertEqual(6, result.testsRun)
+        self.assertEqual(["dev", "prod"], sorted(sample.setups))
+        self.assertEqual(1, len(result.failures))
+        self.assertTrue(
+            result.failures[0][0].id().endswith("TestSample[dev].test_dev_broken")
+        )
+        self.assertEqual(
+            "prod: 3 tests, 0 failures, 0 errors, 0 skipped\n"
+            "dev:  3 tests, 1 failures, 0 errors, 1 skipped",
+            environment_summary(result, ["prod", "dev"]),
+        )
@@ -0,0 +1,248 @@
+"""
+Unit tests for the structured test results and the SQLite history of test durations.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+
+from tools.history import History, spread
+from utils.parallel import ParallelTextTestRunner
+from utils.results import (
+    ERRORED,
+    FAILED,
+    PASSED,
+    SKIPPED,
+    Record,
+    collect,
+    write_json,
+    write_junit,
+)
+
+
+def sample_suite() -> unittest.TestSuite:
+    """
+    A suite with every kind of test outcome, created inside a function so discovery doesn't run it.
+    """
+
+    class TestSample(unittest.TestCase):
+        def test_passes(self) -> None:
+            pass
+
+        def test_fails(self) -> None:
+            self.assertEqual(1, 2)
+
+        def test_errors(self) -> None:
+            raise RuntimeError("AWS is down")
+
+        @unittest.skip("Not deployed.")
+        def test_skipped(self) -> None:
+            pass
+
+        def test_subtest_fails(self) -> None:
+            for key in ("a", "b"):
+                with self.subTest(key=key):
+                    self.assertEqual("a", key)
+
+    class TestBrokenFixture(unittest.TestCase):
+        @classmethod
+        def setUpClass(cls) -> None:
+            raise RuntimeError("No credentials")
+
+        def test_never_runs(self) -> None:
+            pass
+
+    loader = unittest.TestLoader()
+    return unittest.TestSuite(
+        [
+            loader.loadTestsFromTestCase(TestSample),
+            loader.loadTestsFromTestCase(TestBrokenFixture),
+        ]
+    )
+
+
+class TestResults(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        result = ParallelTextTestRunner(io.StringIO(), workers=2).run(sample_suite())
+        self.records = {record.name: record for record in collect(result)}
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_outcomes(self) -> None:
+        """
+        Test that every test is recorded once with its outcome, folding subtests into their test
+        """
+        outcomes = {name: record.outcome for name, record in self.records.items()}
+        self.assertEqual(
+            {
+                "test_passes": PASSED,
+                "test_fails": FAILED,
+                "test_errors": ERRORED,
+                "test_skipped": SKIPPED,
+                "test_subtest_fails": FAILED,
+                "setUpClass": ERRORED,
+            },
+            outcomes,
+        )
+        self.assertIn("AWS is down", self.records["test_errors"].message)
+        self.assertTrue(
+            self.records["setUpClass"].classname.endswith("TestBrokenFixture")
+        )
+
+    def test_junit(self) -> None:
+        """
+        Test that the JUnit XML has a test suite per class with each test's outcome
+        """
+        path = os.path.join(self.directory.name, "results.xml")
+        write_junit(list(self.records.values()), path)
+
+        root = ElementTree.parse(path).getroot()
+        self.assertEqual("6", root.get("tests"))
+
+        suites = {suite.get("name").split(".")[-1]: suite for suite in root}
+        sample = suites["TestSample"]
+        self.assertEqual(
+            ("5", "2", "1", "1"),
+            tuple(
+                sample.get(name) for name in ("tests", "failures", "errors", "skipped")
+            ),
+        )
+
+        case = sample.find("testcase[@name='test_errors']")
+        self.assertEqual("RuntimeError: AWS is down", case.find("error").get("message"))
+        self.assertEqual(
+            "Not deployed.",
+            sample.find("testcase[@name='test_skipped']/skipped").get("message"),
+        )
+
+    def test_json(self) -> None:
+        path = os.path.join(self.directory.name, "results.json")
+        write_json(list(self.records.values()), path, commit="abc123")
+
+        with open(path) as file:
+            content = json.load(file)
+
+        self.assertEqual("abc123", content["commit"])
+        self.assertEqual(6, len(content["tests"]))
+        self.assertTrue(all(test["seconds"] >= 0 for test in content["tests"]))
+
+
+class TestHistory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.history = History(os.path.join(self.directory.name, "history.db"))
+
+    def tearDown(self) -> None:
+        self.history.close()
+        self.directory.cleanup()
+
+    def append(self, workers: int = 4, **durations: float) -> int:
+        return self.history.append(
+            (
+                Record(test_id, PASSED, seconds)
+                for test_id, seconds in durations.items()
+            ),
+            workers=workers,
+        )
+
+    def test_regression_flagged(self) -> None:
+        """
+        Test that a test which slowed well beyond its normal variation is flagged, while noise isn't
+        """
+        for i in range(10):
+            self.append(route53=2.0 + 0.05 * (i % 3), acm=0.5 + 0.01 * (i % 2))
+
+        self.append(route53=2.1, acm=0.5)
+        self.assertEqual([], self.history.compare())
+
+        self.append(route53=3.0, acm=0.52)
+        regressions = self.history.compare()
+
+        self.assertEqual(
+            ["route53"], [regression.test_id for regression in regressions]
+        )
+        self.assertAlmostEqual(1.5, regressions[0].slowdown, delta=0.05)
+        self.assertEqual(10, regressions[0].samples)
+
+    def test_short_tests_not_flagged(self) -> None:
+        """
+        Test that relative jumps in very short tests stay within the absolute noise floor
+        """
+        for _ in range(5):
+            self.append(iam=0.001)
+
+        self.append(iam=0.004)
+        self.assertEqual([], self.history.compare())
+
+    def test_baseline_needs_passing_runs(self) -> None:
+        """
+        Test that a test isn't compared until it has enough passing runs, and failed runs don't count
+        """
+        for _ in range(4):
+            self.append(acm=1.0)
+        self.history.append([Record("acm", FAILED, 0.1)])
+
+        self.append(acm=10.0)
+        self.assertEqual([], self.history.compare())
+
+        self.append(acm=1.0)
+        self.append(acm=10.0)
+        self.assertEqual(["acm"], [r.test_id for r in self.history.compare()])
+
+    def test_compare_earlier_run(self) -> None:
+        for _ in range(5):
+            self.append(acm=1.0)
+        regressed = self.append(acm=5.0)
+        self.append(acm=1.0)
+
+        self.assertEqual([], self.history.compare())
+        self.assertEqual(1, len(self.history.compare(regressed)))
+
+    def test_baseline_same_workers(self) -> None:
+        """
+        Test that a run is only compared with runs which had the same number of workers, since tests slow down when
+        more of them run concurrently
+        """
+        for _ in range(5):
+            self.append(workers=1, acm=1.0)
+            self.append(workers=4, acm=3.0)
+
+        self.append(workers=4, acm=3.0)
+        self.assertEqual([], self.history.compare())
+
+        self.append(workers=1, acm=3.0)
+        regressions = self.history.compare()
+        self.assertEqual(["acm"], [regression.test_id for regression in regressions])
+        self.assertEqual(1.0, regressions[0].baseline)
+
+    def test_history_migrated(self) -> None:
+        """
+        Test that a history written before runs recorded their workers gains the column
+        """
+        path = os.path.join(self.directory.name, "old.db")
+        with sqlite3.connect(path) as connection:
+            connection.executescript(
+                "CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, started TEXT NOT NULL, commit_sha TEXT);"
+            )
+            connection.executescript(
+                "INSERT INTO runs (started) VALUES ('2026-10-01T05:00:00+00:00');"
+            )
+        connection.close()
+
+        with History(path) as history:
+            self.assertIsNone(history.workers(1))
+            history.append([Record("acm", PASSED, 1.0)], workers=4)
+            self.assertEqual(4, history.workers(2))
+
+    def test_spread_floors(self) -> None:
+        self.assertAlmostEqual(0.1, spread([2.0, 2.0, 2.0]))
+        self.assertAlmostEqual(0.01, spread([0.001, 0.001, 0.001]))
+        self.assertAlmostEqual(1.4826, spread([1.0, 2.0, 3.0]))
@@ -5,7 +5,8 @@ Date: 5/27/2019
 """
 
 import unittest
-import boto3
+
+from utils.fixtures import AWS
 
 
 class TestIAM(unittest.TestCase):
@@ -13,13 +14,13 @@ class TestIAM(unittest.TestCase):
         """
         Perform set-up logic before executing any unit tests
         """
-        self.iam = boto3.client("iam")
+        self.iam = AWS.client("iam")
 
     def test_ecs_task_role_exists(self) -> None:
         """
         Test that the ecs-task-role IAM Role exists
         """
-        role_dict = self.iam.get_role(RoleName="ecs-task-role")
+        role_dict = AWS.call("iam", "get_role", RoleName="ecs-task-role")
         role = role_dict.get("Role")
         self.assertEqual(role.get("Path"), "/admin/")
         self.assertEqual(role.get("RoleName"), "ecs-task-role")
@@ -28,7 +29,9 @@ class TestIAM(unittest.TestCase):
         """
         Test that the ecs-task-policy is attached to the ecs-task-role
         """
-        policy_response = self.iam.list_attached_role_policies(RoleName="ecs-task-role")
+        policy_response = AWS.call(
+            "iam", "list_attached_role_policies", RoleName="ecs-task-role"
+        )
         policies = policy_response.get("AttachedPolicies")
         ecs_policy = policies[0]
         self.assertEqual(len(policies), 1)
@@ -0,0 +1,192 @@
+"""
+Unit tests for the boto3 API call instrumentation, run against stubbed clients and a local HTTP server which
+throttles requests.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import boto3
+from botocore.config import Config
+from botocore.stub import Stubber
+
+from utils.instrumentation import (
+    OUTSIDE_TEST,
+    Instrumentation,
+    current_test,
+    set_current_test,
+)
+
+CREDENTIALS = {
+    "region_name": "us-east-1",
+    "aws_access_key_id": "testing",
+    "aws_secret_access_key": "testing",
+}
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for DynamoDB which throttles the first requests it receives.
+    """
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        throttle = self.server.throttles > 0
+        self.server.throttles -= int(throttle)
+
+        if throttle:
+            status, body = 400, {
+                "__type": "com.amazonaws.dynamodb.v20120810#ThrottlingException",
+                "message": "Rate exceeded",
+            }
+        else:
+            status, body = 200, {"TableNames": []}
+
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/x-amz-json-1.0")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Install instrumentation on a fresh session, so other tests' clients aren't instrumented
+        """
+        self.session = boto3.session.Session(**CREDENTIALS)
+        self.instrumentation = Instrumentation()
+        self.instrumentation.install(self.session)
+
+    def tearDown(self) -> None:
+        set_current_test(None)
+
+    def test_calls_counted_per_operation(self) -> None:
+        """
+        Test that every API call is counted under its service and operation
+        """
+        client = self.session.client("s3")
+        with Stubber(client) as stub:
+            for _ in range(3):
+                stub.add_response("list_buckets", {"Buckets": []})
+            stub.add_response(
+                "get_bucket_location", {"LocationConstraint": "us-east-1"}
+            )
+
+            for _ in range(3):
+                client.list_buckets()
+            client.get_bucket_location(Bucket="asset.jarombek.com")
+
+        operations = self.instrumentation.report()["operations"]
+        self.assertEqual(3, operations["s3.ListBuckets"]["count"])
+        self.assertEqual(1, operations["s3.GetBucketLocation"]["count"])
+        self.assertEqual(0, operations["s3.ListBuckets"]["errors"])
+
+    def test_calls_attributed_to_current_test(self) -> None:
+        """
+        Test that API calls are attributed to the test running on the calling thread
+        """
+        # The runner has already attributed this thread to this test, so start from a thread outside any test.
+        running = current_test()
+        self.addCleanup(set_current_test, None if running == OUTSIDE_TEST else running)
+        set_current_test(None)
+
+        client = self.session.client("s3")
+        with Stubber(client) as stub:
+            stub.add_response("list_buckets", {"Buckets": []})
+            stub.add_response("list_buckets", {"Buckets": []})
+
+            client.list_buckets()
+            set_current_test(self.id())
+            client.list_buckets()
+
+        tests = {call["test"] for call in self.instrumentation.report()["calls"]}
+        self.assertEqual({OUTSIDE_TEST, self.id()}, tests)
+
+    def test_errors_and_throttles_counted(self) -> None:
+        """
+        Test that error responses are counted, and throttling errors are counted separately
+        """
+        client = self.session.client("route53")
+        with Stubber(client) as stub:
+            stub.add_client_error("list_hosted_zones", "ThrottlingException")
+            stub.add_client_error("list_hosted_zones", "AccessDenied")
+
+            for _ in range(2):
+                with self.assertRaises(client.exceptions.ClientError):
+                    client.list_hosted_zones()
+
+        stats = self.instrumentation.report()["operations"]["route53.ListHostedZones"]
+        self.assertEqual(2, stats["count"])
+        self.assertEqual(2, stats["errors"])
+        self.assertEqual(1, stats["throttles"])
+
+    def test_retries_and_throttles_recorded(self) -> None:
+        """
+        Test that throttled requests which botocore retries are recorded as retries and throttles of a single call
+        """
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottlingHandler)
+        server.throttles = 2
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            host, port = server.server_address[:2]
+            client = self.session.client(
+                "dynamodb",
+                endpoint_url=f"http://{host}:{port}",
+                config=Config(retries={"mode": "legacy", "max_attempts": 3}),
+            )
+            client.list_tables()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        stats = self.instrumentation.report()["operations"]["dynamodb.ListTables"]
+        self.assertEqual(1, stats["count"])
+        self.assertEqual(2, stats["retries"])
+        self.assertEqual(2, stats["throttles"])
+        self.assertEqual(0, stats["errors"])
+
+    def test_uninstrumented_session_not_recorded(self) -> None:
+        """
+        Test that API calls from a session without instrumentation aren't recorded
+        """
+        client = boto3.session.Session(**CREDENTIALS).client("s3")
+        with Stubber(client) as stub:
+            stub.add_response("list_buckets", {"Buckets": []})
+            client.list_buckets()
+
+        self.assertEqual({}, self.instrumentation.stats)
+
+    def test_report_saved(self) -> None:
+        """
+        Test that the report is written as JSON with the slowest calls first
+        """
+        self.instrumentation.record("s3", "ListBuckets", "a", 0.5)
+        self.instrumentation.record("s3", "ListBuckets", "b", 1.5)
+        self.instrumentation.record("acm", "ListCertificates", "a", 1.0, retries=1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.json")
+            self.instrumentation.save(path)
+            with open(path) as file:
+                report = json.load(file)
+
+        self.assertEqual(["b", "a", "a"], [call["test"] for call in report["calls"]])
+        self.assertEqual(
+            ["s3.ListBuckets", "acm.ListCertificates"], list(report["operations"])
+        )
+        self.assertEqual(2, report["operations"]["s3.ListBuckets"]["count"])
+        self.assertEqual(1, report["operations"]["acm.ListCertificates"]["retries"])
+        self.assertIn("s3.ListBuckets / b", self.instrumentation.table())
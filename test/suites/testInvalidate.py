@@ -0,0 +1,221 @@
+"""
+Unit tests for the CloudFront invalidation planner, submitted to a stubbed CloudFront client.  These tests run
+offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import unittest
+
+import boto3
+from botocore.stub import ANY, Stubber
+
+from tools.invalidate import (
+    MAX_FILE_PATHS,
+    MAX_WILDCARD_PATHS,
+    batches,
+    find_distribution,
+    path,
+    plan_paths,
+    submit,
+)
+
+DISTRIBUTION_ID = "E2JAROMBEKCOM"
+
+KEYS = [
+    "jarombek.png",
+    "asset-manifest.json",
+    "fonts/dyslexie-bold.ttf",
+    "fonts/dyslexie-regular.ttf",
+    "fonts/fantasque-sans-mono.ttf",
+] + [f"logos/logo-{i}.png" for i in range(30)]
+
+
+def invalidation(invalidation_id: str, status: str, paths: list) -> dict:
+    return {
+        "Invalidation": {
+            "Id": invalidation_id,
+            "Status": status,
+            "CreateTime": "2026-10-18T00:00:00Z",
+            "InvalidationBatch": {
+                "Paths": {"Quantity": len(paths), "Items": paths},
+                "CallerReference": "reference",
+            },
+        }
+    }
+
+
+class TestInvalidationPlan(unittest.TestCase):
+    def test_individual_paths(self) -> None:
+        """
+        Test that a few changed objects among many unchanged ones are invalidated one by one
+        """
+        plan = plan_paths(["jarombek.png", "logos/logo-3.png"], KEYS)
+        self.assertEqual(["/jarombek.png", "/logos/logo-3.png"], plan.paths)
+        self.assertEqual(0, plan.evicted)
+
+    def test_fully_changed_directory(self) -> None:
+        """
+        Test that a directory whose objects all changed is invalidated with a single wildcard
+        """
+        fonts = [key for key in KEYS if key.startswith("fonts/")]
+        plan = plan_paths(fonts + ["jarombek.png"], KEYS)
+
+        self.assertEqual(["/jarombek.png", "/fonts/*"], plan.paths)
+        self.assertEqual(0, plan.evicted)
+
+    def test_wildcard_only_when_cheaper(self) -> None:
+        """
+        Test that a mostly changed directory collapses to a wildcard, evicting its few unchanged objects, unless
+        evictions are weighed as costly as paths
+        """
+        logos = [f"logos/logo-{i}.png" for i in range(25)]
+
+        plan = plan_paths(logos, KEYS)
+        self.assertEqual(["/logos/*"], plan.paths)
+        self.assertEqual(5, plan.evicted)
+        self.assertEqual(1, plan.wildcards)
+
+        plan = plan_paths(logos, KEYS, eviction_cost=5)
+        self.assertEqual(25, len(plan.paths))
+        self.assertEqual(0, plan.wildcards)
+
+    def test_everything_changed(self) -> None:
+        self.assertEqual(["/*"], plan_paths(KEYS, KEYS).paths)
+
+    def test_nothing_changed(self) -> None:
+        self.assertEqual([], plan_paths([], KEYS).paths)
+
+    def test_paths_encoded(self) -> None:
+        self.assertEqual("/posts/my%20post%2B1.png", path("posts/my post+1.png"))
+
+    def test_batches_within_limits(self) -> None:
+        """
+        Test that batches never exceed CloudFront's file path and wildcard limits
+        """
+        files = [f"/{i}.png" for i in range(MAX_FILE_PATHS + 10)]
+        wildcards = [f"/{i}/*" for i in range(MAX_WILDCARD_PATHS + 1)]
+        result = batches(files + wildcards)
+
+        self.assertEqual(
+            files + wildcards, [item for batch in result for item in batch]
+        )
+        for batch in result:
+            self.assertLessEqual(
+                sum(1 for item in batch if item.endswith("*")), MAX_WILDCARD_PATHS
+            )
+            self.assertLessEqual(
+                sum(1 for item in batch if not item.endswith("*")), MAX_FILE_PATHS
+            )
+
+        self.assertEqual(3, len(result))
+
+
+class TestInvalidationSubmit(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = boto3.client(
+            "cloudfront",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        self.stub = Stubber(self.client)
+
+    def test_find_distribution(self) -> None:
+        self.stub.add_response(
+            "list_distributions",
+            {
+                "DistributionList": {
+                    "Marker": "",
+                    "MaxItems": 100,
+                    "IsTruncated": False,
+                    "Quantity": 1,
+                    "Items": [
+                        {
+                            "Id": DISTRIBUTION_ID,
+                            "ARN": f"arn:aws:cloudfront::123456789012:distribution/{DISTRIBUTION_ID}",
+                            "Status": "Deployed",
+                            "LastModifiedTime": "2026-10-18T00:00:00Z",
+                            "DomainName": "d1.cloudfront.net",
+                            "Aliases": {
+                                "Quantity": 1,
+                                "Items": ["asset.jarombek.com"],
+                            },
+                            "Origins": {
+                                "Quantity": 1,
+                                "Items": [
+                                    {
+                                        "Id": "origin",
+                                        "DomainName": "asset.jarombek.com.s3.amazonaws.com",
+                                    }
+                                ],
+                            },
+                            "DefaultCacheBehavior": {
+                                "TargetOriginId": "origin",
+                                "ViewerProtocolPolicy": "redirect-to-https",
+                            },
+                            "CacheBehaviors": {"Quantity": 0},
+                            "CustomErrorResponses": {"Quantity": 0},
+                            "Comment": "",
+                            "PriceClass": "PriceClass_100",
+                            "Enabled": True,
+                            "ViewerCertificate": {},
+                            "Restrictions": {
+                                "GeoRestriction": {
+                                    "RestrictionType": "none",
+                                    "Quantity": 0,
+                                }
+                            },
+                            "WebACLId": "",
+                            "HttpVersion": "http2",
+                            "IsIPV6Enabled": True,
+                            "Staging": False,
+                        }
+                    ],
+                }
+            },
+        )
+
+        with self.stub:
+            self.assertEqual(DISTRIBUTION_ID, find_distribution(self.client))
+
+    def test_submit_polls_each_batch(self) -> None:
+        """
+        Test that each batch is submitted once the previous batch completed, polling until it's done
+        """
+        paths = [f"/{i}/*" for i in range(MAX_WILDCARD_PATHS + 2)]
+        first, second = paths[:MAX_WILDCARD_PATHS], paths[MAX_WILDCARD_PATHS:]
+
+        for invalidation_id, batch in (("I1", first), ("I2", second)):
+            self.stub.add_response(
+                "create_invalidation",
+                {
+                    **invalidation(invalidation_id, "InProgress", batch),
+                    "Location": f"https://cloudfront.amazonaws.com/{invalidation_id}",
+                },
+                {
+                    "DistributionId": DISTRIBUTION_ID,
+                    "InvalidationBatch": {
+                        "Paths": {"Quantity": len(batch), "Items": batch},
+                        "CallerReference": ANY,
+                    },
+                },
+            )
+            expected = {"DistributionId": DISTRIBUTION_ID, "Id": invalidation_id}
+            self.stub.add_response(
+                "get_invalidation",
+                invalidation(invalidation_id, "InProgress", batch),
+                expected,
+            )
+            self.stub.add_response(
+                "get_invalidation",
+                invalidation(invalidation_id, "Completed", batch),
+                expected,
+            )
+
+        with self.stub:
+            result = submit(paths, self.client, DISTRIBUTION_ID, poll_interval=0.01)
+
+        self.stub.assert_no_pending_responses()
+        self.assertEqual(["I1", "I2"], [item.id for item in result])
+        self.assertEqual([first, second], [item.paths for item in result])
@@ -4,68 +4,51 @@ Author: Andrew Jarombek
 Date: 5/28/2019
 """
 
-import os
 import unittest
 
-import boto3
-
-from aws_test_functions.Route53 import Route53
 from aws_test_functions.LoadBalancing import LB
 from aws_test_functions.SecurityGroup import SecurityGroup
 from aws_test_functions.ECS import ECS
 
-try:
-    prod_env = os.environ["TEST_ENV"] == "prod"
-except KeyError:
-    prod_env = True
+from utils.environments import EnvironmentTestCase
+from utils.fixtures import AWS
+from utils.route53 import snapshot
+
+# The website URL, certificate domain, and wildcard certificate domain of each environment.
+DOMAINS = {
+    "prod": ("jarombek.com", "jarombek.com", "*.jarombek.com"),
+    "dev": ("dev.jarombek.com", "*.jarombek.com", "*.dev.jarombek.com"),
+}
 
 
-class TestJarombekCom(unittest.TestCase):
+class TestJarombekCom(EnvironmentTestCase):
     def setUp(self) -> None:
         """
         Perform set-up logic before executing any unit tests
         """
-        self.ec2 = boto3.client("ec2")
-        self.route53 = boto3.client("route53")
-        self.elb = boto3.client("elbv2")
-        self.acm = boto3.client("acm")
-        self.acm_certificates = self.acm.list_certificates(
-            CertificateStatuses=["ISSUED"]
+        self.ec2 = AWS.client("ec2")
+        self.route53 = AWS.client("route53")
+        self.elb = AWS.client("elbv2")
+        self.acm = AWS.client("acm")
+        self.acm_certificates = AWS.call(
+            "acm", "list_certificates", CertificateStatuses=["ISSUED"]
         ).get("CertificateSummaryList")
 
-        if prod_env:
-            self.env = "prod"
-            self.website_url = "jarombek.com"
-            self.cert_url = "jarombek.com"
-            self.wc_cert_url = "*.jarombek.com"
-            self.lb_certs = [
-                cert
-                for cert in self.acm_certificates
-                if cert.get("DomainName") == self.cert_url
-                or cert.get("DomainName") == self.wc_cert_url
-            ]
-        else:
-            self.env = "dev"
-            self.website_url = "dev.jarombek.com"
-            self.cert_url = "*.jarombek.com"
-            self.wc_cert_url = "*.dev.jarombek.com"
-            self.lb_certs = [
-                cert
-                for cert in self.acm_certificates
-                if cert.get("DomainName") == self.cert_url
-                or cert.get("DomainName") == self.wc_cert_url
-            ]
+        self.website_url, self.cert_url, self.wc_cert_url = DOMAINS[self.env]
+        self.lb_certs = [
+            cert
+            for cert in self.acm_certificates
+            if cert.get("DomainName") == self.cert_url
+            or cert.get("DomainName") == self.wc_cert_url
+        ]
 
     @unittest.skip("jarombek.com ECS infrastructure no longer used")
     def test_jarombek_com_a_record_exists(self) -> None:
         """
         Determine if the 'A' record exists for the website in Route53
         """
-        try:
-            a_record = Route53.get_record("jarombek.com.", self.website_url, "A")
-        except IndexError:
-            a_record = None
-            self.assertFalse(True)
+        a_record = snapshot("jarombek.com.").get(self.website_url, "A")
+        self.assertIsNotNone(a_record)
 
         self.assertEqual(a_record.get("Name"), f"{self.website_url}.")
         self.assertEqual(a_record.get("Type"), "A")
@@ -75,13 +58,8 @@ class TestJarombekCom(unittest.TestCase):
         """
         Determine if the 'CNAME' record exists for the 'www' prefixed website in Route53
         """
-        try:
-            a_record = Route53.get_record(
-                "jarombek.com.", f"www.{self.website_url}", "CNAME"
-            )
-        except IndexError:
-            a_record = None
-            self.assertFalse(True)
+        a_record = snapshot("jarombek.com.").get(f"www.{self.website_url}", "CNAME")
+        self.assertIsNotNone(a_record)
 
         self.assertEqual(a_record.get("Name"), f"www.{self.website_url}.")
         self.assertEqual(a_record.get("Type"), "CNAME")
@@ -4,9 +4,25 @@ Author: Andrew Jarombek
 Date: 5/28/2019
 """
 
+import os
+import random
 import unittest
-import boto3
 import urllib.request as request
+from concurrent.futures import ThreadPoolExecutor
+
+from tools.cache_policy import cache_control
+from tools.manifest import ASSET_DIRECTORY, digest
+from tools.probe import Thresholds, probe, summary, violations
+from utils.cassette import requires_internet
+from utils.fixtures import AWS
+from utils.s3 import any_keys, iter_objects
+
+
+# Every object must be served, and CloudFront should serve most of them from an edge cache.
+PROBE_THRESHOLDS = Thresholds(max_error_rate=0.0, p50=0.5, p95=2.0, p99=5.0)
+
+# Number of objects in the bucket requested through CloudFront.  'python3 -m tools.probe' requests all of them.
+PROBE_SAMPLE = 20
 
 
 class TestJarombekComAssets(unittest.TestCase):
@@ -14,21 +30,25 @@ class TestJarombekComAssets(unittest.TestCase):
         """
         Perform set-up logic before executing any unit tests
         """
-        self.s3 = boto3.client("s3")
+        self.s3 = AWS.client("s3")
         self.bucket_name = "asset.jarombek.com"
 
     def test_assets_jarombek_com_bucket_exists(self) -> None:
         """
         Test if an S3 bucket for asset.jarombek.com exists
         """
-        s3_bucket = self.s3.list_objects(Bucket=self.bucket_name)
+        s3_bucket = AWS.call(
+            "s3", "list_objects_v2", Bucket=self.bucket_name, MaxKeys=1
+        )
         self.assertEqual(s3_bucket.get("Name"), self.bucket_name)
 
     def test_s3_bucket_public_access(self) -> None:
         """
         Test whether the public access configuration for a asset.jarombek.com S3 bucket is correct
         """
-        public_access_block = self.s3.get_public_access_block(Bucket=self.bucket_name)
+        public_access_block = AWS.call(
+            "s3", "get_public_access_block", Bucket=self.bucket_name
+        )
         config = public_access_block.get("PublicAccessBlockConfiguration")
         self.assertTrue(config.get("BlockPublicAcls"))
         self.assertTrue(config.get("IgnorePublicAcls"))
@@ -39,9 +59,51 @@ class TestJarombekComAssets(unittest.TestCase):
         """
         Test if the S3 bucket for asset.jarombek.com contains objects
         """
-        contents = self.s3.list_objects(Bucket=self.bucket_name).get("Contents")
-        self.assertGreater(len(contents), 0)
+        self.assertTrue(any_keys(self.bucket_name))
+
+    def test_assets_jarombek_com_directories_not_empty(self) -> None:
+        """
+        Test if each directory in the S3 bucket for asset.jarombek.com contains objects
+        """
+        for prefix in ["fonts/", "logos/", "posts/"]:
+            with self.subTest(prefix=prefix):
+                self.assertTrue(any_keys(self.bucket_name, prefix))
+
+    def test_assets_jarombek_com_cache_control(self) -> None:
+        """
+        Test that every object in the S3 bucket has the Cache-Control header its policy requires
+        """
+        keys = [obj["Key"] for obj in iter_objects(self.bucket_name)]
 
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            headers = executor.map(
+                lambda key: self.s3.head_object(Bucket=self.bucket_name, Key=key).get(
+                    "CacheControl"
+                ),
+                keys,
+            )
+
+            for key, header in zip(keys, headers):
+                with self.subTest(key=key):
+                    self.assertEqual(header, cache_control(key))
+
+    @requires_internet
+    def test_assets_jarombek_com_text_assets_compressed(self) -> None:
+        """
+        Test that text based assets are served through CloudFront precompressed, at their encoded size
+        """
+        for key in ["flag.svg", "fonts/dyslexie-bold.ttf"]:
+            with self.subTest(key=key):
+                _, size = digest(os.path.join(ASSET_DIRECTORY, key), compress=True)
+                req = request.Request(
+                    url=f"https://asset.jarombek.com/{key}",
+                    headers={"Accept-Encoding": "gzip"},
+                )
+                with request.urlopen(req) as f:
+                    self.assertEqual(f.headers.get("Content-Encoding"), "gzip")
+                    self.assertEqual(len(f.read()), size)
+
+    @requires_internet
     def test_assets_jarombek_com_reachable(self) -> None:
         """
         Test that the asset.jarombek.com S3 bucket is reachable via HTTPS
@@ -50,3 +112,15 @@ class TestJarombekComAssets(unittest.TestCase):
         req = request.Request(url="https://asset.jarombek.com")
         with request.urlopen(req) as f:
             self.assertEqual(f.status, 200)
+
+    @requires_internet
+    def test_assets_jarombek_com_objects_served(self) -> None:
+        """
+        Test that a sample of the objects in the S3 bucket are served through CloudFront within the latency
+        thresholds.  Keys come from the bucket, so assets which haven't been applied yet aren't requested
+        """
+        keys = sorted(obj["Key"] for obj in iter_objects(self.bucket_name))
+        sample = random.Random(18).sample(keys, min(PROBE_SAMPLE, len(keys)))
+
+        report = probe("https://asset.jarombek.com", sample)
+        self.assertEqual(violations(report, PROBE_THRESHOLDS), [], summary(report))
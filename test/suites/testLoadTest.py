@@ -0,0 +1,264 @@
+"""
+Unit tests for the open-loop load test and its capacity report, run against a local HTTP server which stands in
+for a container of the web image.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from tools.histogram import Histogram
+from tools.loadtest import (
+    MIN_REPLICAS,
+    SLO,
+    Route,
+    Stage,
+    StageResult,
+    TargetResult,
+    arrivals,
+    default_mix,
+    load_test,
+    parse_bytes,
+    recommend,
+)
+from utils.http_server import LocalHTTPServer
+
+
+def target_result(rate: float, p99_ms: float, errors: int = 0) -> TargetResult:
+    latency = Histogram()
+    requests = int(rate * 10)
+    for _ in range(requests):
+        latency.record(int(p99_ms * 1000))
+
+    return TargetResult(
+        requests=requests,
+        errors=errors,
+        latency=latency,
+        statuses={"200": requests - errors},
+    )
+
+
+def stage_result(
+    rate: float, p99_ms: float, errors: int = 0, cpu: float = None, memory: int = None
+) -> StageResult:
+    return StageResult(
+        rate=rate,
+        duration=10,
+        targets={"web": target_result(rate, p99_ms, errors)},
+        cpu_cores=cpu,
+        memory_bytes=memory,
+    )
+
+
+class TestHistogram(unittest.TestCase):
+    def test_percentiles_within_precision(self) -> None:
+        """
+        Test that percentiles are within the histogram's relative error of the exact values
+        """
+        rng = random.Random(18)
+        values = sorted(int(rng.lognormvariate(10, 1)) for _ in range(10000))
+        histogram = Histogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (50, 90, 99, 99.9):
+            exact = values[int(percent / 100 * len(values)) - 1]
+            self.assertAlmostEqual(
+                exact, histogram.percentile(percent), delta=exact / 100
+            )
+
+        self.assertEqual(values[-1], histogram.percentile(100))
+        self.assertEqual(values[0], histogram.min)
+
+    def test_small_values_exact(self) -> None:
+        histogram = Histogram()
+        for value in range(100):
+            histogram.record(value)
+
+        self.assertEqual(49, histogram.percentile(50))
+        self.assertEqual(99, histogram.max)
+
+    def test_merge(self) -> None:
+        """
+        Test that merging histograms is the same as recording every value in one histogram
+        """
+        first, second, combined = Histogram(), Histogram(), Histogram()
+        for value in range(0, 100000, 7):
+            (first if value % 2 else second).record(value)
+            combined.record(value)
+
+        first.merge(second)
+        self.assertEqual(combined.to_dict(), first.to_dict())
+
+    def test_empty(self) -> None:
+        self.assertEqual(0, Histogram().percentile(99))
+
+
+class TestLoadTest(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create a directory served as the web application's pages and assets
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.directory.name, "blog"))
+        for page in ("index.html", "blog/index.html", "jarombek.png"):
+            with open(os.path.join(self.directory.name, page), "w") as file:
+                file.write("<html>jarombek.com</html>")
+
+        self.routes = [
+            Route("web", "/", 2),
+            Route("web", "/blog/", 2),
+            Route("asset", "/jarombek.png", 1),
+        ]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_arrival_rates(self) -> None:
+        """
+        Test that uniform arrivals are evenly spaced and Poisson arrivals average the requested rate
+        """
+        rng = random.Random(18)
+        self.assertEqual(
+            [0.0, 0.25, 0.5, 0.75], arrivals(Stage(4, 1), poisson=False, rng=rng)
+        )
+
+        poisson = arrivals(Stage(100, 100), poisson=True, rng=rng)
+        self.assertAlmostEqual(10000, len(poisson), delta=300)
+        self.assertTrue(all(0 <= offset < 100 for offset in poisson))
+
+    def test_open_loop_load(self) -> None:
+        """
+        Test that requests keep arriving at the stage's rate while a slow server is still answering earlier ones
+        """
+        with LocalHTTPServer(self.directory.name, latency_ms=300) as server:
+            results = load_test(
+                [Stage(rate=40, duration=1)],
+                self.routes,
+                server.url,
+                server.url,
+                poisson=False,
+                seed=18,
+            )
+
+        result = results[0]
+        self.assertEqual(40, result.requests)
+        self.assertEqual(40, server.requests)
+        for target in result.targets.values():
+            self.assertEqual(0, target.errors)
+            self.assertGreaterEqual(target.latency.percentile(50), 300_000)
+
+    def test_targets_recorded_separately(self) -> None:
+        """
+        Test that web and asset requests are recorded against their own target, and only web requests count
+        towards the achieved rate
+        """
+        with LocalHTTPServer(self.directory.name) as web:
+            with LocalHTTPServer(self.directory.name) as assets:
+                result = load_test(
+                    [Stage(rate=40, duration=1)],
+                    self.routes,
+                    web.url,
+                    assets.url,
+                    poisson=False,
+                    seed=18,
+                )[0]
+
+        self.assertEqual(["asset", "web"], sorted(result.targets))
+        self.assertEqual(web.requests, result.web.requests)
+        self.assertEqual(assets.requests, result.targets["asset"].requests)
+        self.assertEqual(40, web.requests + assets.requests)
+        self.assertEqual(web.requests, result.achieved_rate)
+
+    def test_errors_counted(self) -> None:
+        """
+        Test that failed responses are counted as errors by status
+        """
+        routes = self.routes + [Route("web", "/missing", 5)]
+        with LocalHTTPServer(self.directory.name) as server:
+            result = load_test(
+                [Stage(rate=50, duration=1)],
+                routes,
+                server.url,
+                server.url,
+                poisson=False,
+                seed=18,
+            )[0]
+
+        self.assertGreater(result.web.errors, 0)
+        self.assertEqual(result.web.errors, result.web.statuses["404"])
+        self.assertEqual(0, result.targets["asset"].errors)
+        self.assertEqual(
+            result.requests,
+            sum(sum(target.statuses.values()) for target in result.targets.values()),
+        )
+
+    def test_default_mix(self) -> None:
+        """
+        Test that the default mix only requests the web application, and asset fetches are added about two per page
+        view when asked for
+        """
+        self.assertEqual({"web"}, {route.target for route in default_mix()})
+
+        routes = default_mix(["jarombek.png", "posts/a.png", "posts/b.png"])
+        pages = sum(route.weight for route in routes if route.target == "web")
+        assets = sum(route.weight for route in routes if route.target == "asset")
+        self.assertAlmostEqual(2, assets / pages)
+
+    def test_parse_bytes(self) -> None:
+        self.assertEqual(int(123.5 * 2**20), parse_bytes("123.5MiB"))
+        self.assertEqual(1_200_000_000, parse_bytes("1.2GB "))
+        self.assertEqual(512, parse_bytes("512B"))
+
+
+class TestCapacityReport(unittest.TestCase):
+    def test_recommendation(self) -> None:
+        """
+        Test that replicas are sized from the highest rate one instance sustained within the SLO
+        """
+        results = [
+            stage_result(10, 50, cpu=0.1, memory=100 * 2**20),
+            stage_result(20, 120, cpu=0.2, memory=110 * 2**20),
+            stage_result(40, 900, cpu=0.4, memory=130 * 2**20),
+        ]
+        recommendation = recommend(results, SLO(p99_ms=500), peak_rate=70)
+
+        self.assertEqual(20, recommendation.sustainable_rate)
+        self.assertEqual(5, recommendation.replicas)
+        self.assertEqual("200m", recommendation.cpu_request)
+        self.assertEqual("144Mi", recommendation.memory_request)
+        self.assertEqual([], recommendation.notes)
+
+    def test_assets_not_counted(self) -> None:
+        """
+        Test that asset fetches served by CloudFront don't count towards the web application's capacity or SLO
+        """
+        results = [
+            stage_result(10, 50)._replace(
+                targets={
+                    "web": target_result(10, 50),
+                    "asset": target_result(30, 900, errors=100),
+                }
+            )
+        ]
+        recommendation = recommend(results, SLO(p99_ms=500), peak_rate=70)
+
+        self.assertEqual(10, recommendation.sustainable_rate)
+        self.assertEqual(10, recommendation.replicas)
+
+    def test_minimum_replicas(self) -> None:
+        results = [stage_result(10, 50), stage_result(20, 900)]
+        recommendation = recommend(results, SLO(p99_ms=500), peak_rate=1)
+
+        self.assertEqual(MIN_REPLICAS, recommendation.replicas)
+        self.assertIsNone(recommendation.cpu_request)
+
+    def test_errors_fail_slo(self) -> None:
+        results = [stage_result(10, 50, errors=50)]
+        recommendation = recommend(results, SLO(max_error_rate=0.01), peak_rate=10)
+
+        self.assertIsNone(recommendation.replicas)
+        self.assertTrue(recommendation.notes)
@@ -4,10 +4,15 @@ Author: Andrew Jarombek
 Date: 5/28/2019
 """
 
+import os
 import unittest
-import boto3
 
-from aws_test_functions.Route53 import Route53
+from utils.fixtures import AWS
+from utils.route53 import ExpectedRecord, snapshot, terraform_records
+
+ROUTE53_TERRAFORM = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "route53", "main.tf"
+)
 
 
 class TestRoute53(unittest.TestCase):
@@ -15,14 +20,18 @@ class TestRoute53(unittest.TestCase):
         """
         Perform set-up logic before executing any unit tests
         """
-        self.route53 = boto3.client("route53")
+        self.route53 = AWS.client("route53")
+        self.zone = snapshot("jarombek.com.")
 
     def test_jarombek_com_zone_exists(self) -> None:
         """
         Determine if the jarombek.com Route53 zone exists.
         """
-        zones = self.route53.list_hosted_zones_by_name(
-            DNSName="jarombek.com.", MaxItems="1"
+        zones = AWS.call(
+            "route53",
+            "list_hosted_zones_by_name",
+            DNSName="jarombek.com.",
+            MaxItems="1",
         ).get("HostedZones")
         self.assertEqual(len(zones), 1)
 
@@ -30,8 +39,11 @@ class TestRoute53(unittest.TestCase):
         """
         Determine if the jarombek.com Route53 zone is public.
         """
-        zones = self.route53.list_hosted_zones_by_name(
-            DNSName="jarombek.com.", MaxItems="1"
+        zones = AWS.call(
+            "route53",
+            "list_hosted_zones_by_name",
+            DNSName="jarombek.com.",
+            MaxItems="1",
         ).get("HostedZones")
         self.assertFalse(zones[0].get("Config").get("PrivateZone"))
 
@@ -39,11 +51,8 @@ class TestRoute53(unittest.TestCase):
         """
         Determine if the 'NS' record exists for 'jarombek.com.' in Route53
         """
-        try:
-            a_record = Route53.get_record("jarombek.com.", "jarombek.com.", "NS")
-        except IndexError:
-            a_record = None
-            self.assertFalse(True)
+        a_record = self.zone.get("jarombek.com.", "NS")
+        self.assertIsNotNone(a_record)
 
         self.assertEqual(a_record.get("Name"), "jarombek.com.")
         self.assertEqual(a_record.get("Type"), "NS")
@@ -52,11 +61,8 @@ class TestRoute53(unittest.TestCase):
         """
         Determine if the 'A' record exists for 'jarombek.com.' in Route53
         """
-        try:
-            a_record = Route53.get_record("jarombek.com.", "asset.jarombek.com.", "A")
-        except IndexError:
-            a_record = None
-            self.assertFalse(True)
+        a_record = self.zone.get("asset.jarombek.com.", "A")
+        self.assertIsNotNone(a_record)
 
         self.assertEqual(a_record.get("Name"), "asset.jarombek.com.")
         self.assertEqual(a_record.get("Type"), "A")
@@ -65,11 +71,40 @@ class TestRoute53(unittest.TestCase):
         """
         Determine if the 'MX' record exists for 'jarombek.com.' in Route53
         """
-        try:
-            a_record = Route53.get_record("jarombek.com.", "jarombek.com.", "MX")
-        except IndexError:
-            a_record = None
-            self.assertFalse(True)
+        a_record = self.zone.get("jarombek.com.", "MX")
+        self.assertIsNotNone(a_record)
 
         self.assertEqual(a_record.get("Name"), "jarombek.com.")
         self.assertEqual(a_record.get("Type"), "MX")
+
+    def test_jarombek_com_mx_record_values(self) -> None:
+        """
+        Determine if the 'MX' record for 'jarombek.com.' routes mail to every Google mail server
+        """
+        mismatches = self.zone.mismatches(
+            [
+                ExpectedRecord(
+                    name="jarombek.com.",
+                    type="MX",
+                    ttl=300,
+                    values=[
+                        "1 ASPMX.L.GOOGLE.COM.",
+                        "5 ALT1.ASPMX.L.GOOGLE.COM.",
+                        "5 ALT2.ASPMX.L.GOOGLE.COM.",
+                        "10 ALT3.ASPMX.L.GOOGLE.COM.",
+                        "10 ALT4.ASPMX.L.GOOGLE.COM.",
+                    ],
+                )
+            ]
+        )
+        self.assertEqual(mismatches, [])
+
+    def test_jarombek_com_records_match_terraform(self) -> None:
+        """
+        Determine if every record declared in the route53 Terraform module exists with the same values
+        """
+        with open(ROUTE53_TERRAFORM) as file:
+            expected = terraform_records(file.read())
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(self.zone.mismatches(expected), [])
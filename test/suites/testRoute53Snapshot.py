@@ -0,0 +1,174 @@
+"""
+Unit tests for the in-memory Route53 zone snapshot, run against a stubbed Route53 client.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import os
+import unittest
+
+import boto3
+from botocore.stub import Stubber
+
+from utils.route53 import ExpectedRecord, ZoneSnapshot, terraform_records
+
+ROUTE53_TERRAFORM = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "route53", "main.tf"
+)
+
+MX_VALUES = [
+    "1 ASPMX.L.GOOGLE.COM.",
+    "5 ALT1.ASPMX.L.GOOGLE.COM.",
+    "5 ALT2.ASPMX.L.GOOGLE.COM.",
+    "10 ALT3.ASPMX.L.GOOGLE.COM.",
+    "10 ALT4.ASPMX.L.GOOGLE.COM.",
+]
+
+
+class TestRoute53Snapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Load a snapshot of a zone whose record sets span two pages
+        """
+        client = boto3.client(
+            "route53",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+
+        with Stubber(client) as stub:
+            stub.add_response(
+                "list_hosted_zones_by_name",
+                {
+                    "HostedZones": [
+                        {
+                            "Id": "/hostedzone/Z1",
+                            "Name": "jarombek.com.",
+                            "CallerReference": "jarombek",
+                            "Config": {"PrivateZone": False},
+                        }
+                    ],
+                    "IsTruncated": False,
+                    "MaxItems": "100",
+                },
+                {"DNSName": "jarombek.com."},
+            )
+            stub.add_response(
+                "list_resource_record_sets",
+                {
+                    "ResourceRecordSets": [
+                        {
+                            "Name": "jarombek.com.",
+                            "Type": "MX",
+                            "TTL": 300,
+                            "ResourceRecords": [{"Value": v} for v in MX_VALUES],
+                        },
+                        {
+                            "Name": "jarombek.com.",
+                            "Type": "NS",
+                            "TTL": 172800,
+                            "ResourceRecords": [{"Value": "ns-1.awsdns-1.com."}],
+                        },
+                    ],
+                    "IsTruncated": True,
+                    "NextRecordName": "asset.jarombek.com.",
+                    "NextRecordType": "A",
+                    "MaxItems": "2",
+                },
+                {"HostedZoneId": "/hostedzone/Z1"},
+            )
+            stub.add_response(
+                "list_resource_record_sets",
+                {
+                    "ResourceRecordSets": [
+                        {
+                            "Name": "asset.jarombek.com.",
+                            "Type": "A",
+                            "AliasTarget": {
+                                "HostedZoneId": "Z2FDTNDATAQYW2",
+                                "DNSName": "d1.cloudfront.net.",
+                                "EvaluateTargetHealth": False,
+                            },
+                        },
+                        {
+                            "Name": "\\052.jarombek.com.",
+                            "Type": "CNAME",
+                            "TTL": 300,
+                            "ResourceRecords": [{"Value": "jarombek.com"}],
+                        },
+                    ],
+                    "IsTruncated": False,
+                    "MaxItems": "2",
+                },
+                {
+                    "HostedZoneId": "/hostedzone/Z1",
+                    "StartRecordName": "asset.jarombek.com.",
+                    "StartRecordType": "A",
+                },
+            )
+
+            self.zone = ZoneSnapshot.load("jarombek.com", client)
+            stub.assert_no_pending_responses()
+
+    def test_every_page_indexed(self) -> None:
+        """
+        Test that records from every page of the listing are indexed by name and type
+        """
+        self.assertEqual(len(self.zone), 4)
+        self.assertIn(("jarombek.com.", "MX"), self.zone)
+        self.assertIn(("Asset.Jarombek.com", "A"), self.zone)
+        self.assertIn(("*.jarombek.com.", "CNAME"), self.zone)
+        self.assertNotIn(("jarombek.com.", "A"), self.zone)
+
+    def test_get_record(self) -> None:
+        """
+        Test that single records are answered from memory, whether or not names are fully qualified
+        """
+        self.assertEqual(self.zone.get("jarombek.com", "NS").get("TTL"), 172800)
+        self.assertIsNone(self.zone.get("dev.jarombek.com", "A"))
+        self.assertEqual(self.zone.values("jarombek.com.", "MX"), MX_VALUES)
+
+    def test_bulk_mismatches(self) -> None:
+        """
+        Test that a whole set of expected records is checked in one pass, reporting every difference
+        """
+        self.assertEqual(
+            self.zone.mismatches(
+                [
+                    ExpectedRecord(
+                        "jarombek.com.", "MX", list(reversed(MX_VALUES)), 300
+                    ),
+                    ExpectedRecord(
+                        "asset.jarombek.com", "A", alias="d1.cloudfront.net"
+                    ),
+                ]
+            ),
+            [],
+        )
+
+        self.assertEqual(
+            self.zone.mismatches(
+                [
+                    ExpectedRecord("jarombek.com.", "MX", MX_VALUES[:4], 3600),
+                    ExpectedRecord("dev.jarombek.com.", "A"),
+                ]
+            ),
+            [
+                f"jarombek.com. MX: values {sorted(MX_VALUES)} != {sorted(MX_VALUES[:4])}",
+                "jarombek.com. MX: TTL 300 != 3600",
+                "dev.jarombek.com. A: missing",
+            ],
+        )
+
+    def test_terraform_records(self) -> None:
+        """
+        Test that the records declared in the route53 Terraform module match the snapshot
+        """
+        with open(ROUTE53_TERRAFORM) as file:
+            expected = terraform_records(file.read())
+
+        self.assertEqual(
+            expected, [ExpectedRecord("jarombek.com.", "MX", MX_VALUES, 300)]
+        )
+        self.assertEqual(self.zone.mismatches(expected), [])
@@ -0,0 +1,87 @@
+"""
+Unit tests for the streaming S3 listing helpers.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import unittest
+
+import boto3
+from botocore.stub import Stubber
+
+from utils.s3 import any_keys, iter_keys
+
+
+class TestS3Listing(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Perform set-up logic before executing any unit tests
+        """
+        self.s3 = boto3.session.Session(
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+            region_name="us-east-1",
+        ).client("s3")
+        self.stubber = Stubber(self.s3)
+        self.stubber.activate()
+
+    def tearDown(self) -> None:
+        self.stubber.deactivate()
+
+    def add_page(self, keys: list, token: str = None, next_token: str = None) -> None:
+        """
+        Queue a stubbed page of list_objects_v2 results.
+        :param keys: The object keys in the page.
+        :param token: The continuation token expected in the request for this page.
+        :param next_token: The continuation token for the page after this one, if there is one.
+        """
+        response = {
+            "Name": "asset.jarombek.com",
+            "Contents": [{"Key": key} for key in keys],
+            "IsTruncated": next_token is not None,
+        }
+        expected = {"Bucket": "asset.jarombek.com", "Prefix": "posts/", "MaxKeys": 2}
+
+        if next_token:
+            response["NextContinuationToken"] = next_token
+        if token:
+            expected["ContinuationToken"] = token
+
+        self.stubber.add_response("list_objects_v2", response, expected)
+
+    def test_iter_keys_all_pages(self) -> None:
+        """
+        Test that every key is yielded across multiple pages
+        """
+        self.add_page(["posts/a.png", "posts/b.png"], next_token="page-2")
+        self.add_page(["posts/c.gif"], token="page-2")
+
+        keys = list(iter_keys("asset.jarombek.com", "posts/", 2, self.s3))
+        self.assertEqual(keys, ["posts/a.png", "posts/b.png", "posts/c.gif"])
+        self.stubber.assert_no_pending_responses()
+
+    def test_iter_keys_lazy(self) -> None:
+        """
+        Test that the next page isn't requested until the current page is consumed
+        """
+        self.add_page(["posts/a.png", "posts/b.png"], next_token="page-2")
+        self.add_page(["posts/c.gif"], token="page-2")
+
+        keys = iter_keys("asset.jarombek.com", "posts/", 2, self.s3)
+        self.assertEqual(next(keys), "posts/a.png")
+        self.assertEqual(next(keys), "posts/b.png")
+
+        with self.assertRaises(AssertionError):
+            self.stubber.assert_no_pending_responses()
+
+    def test_any_keys_empty_prefix(self) -> None:
+        """
+        Test that a prefix without any objects is reported as empty
+        """
+        self.stubber.add_response(
+            "list_objects_v2",
+            {"Name": "asset.jarombek.com", "KeyCount": 0, "IsTruncated": False},
+            {"Bucket": "asset.jarombek.com", "Prefix": "videos/", "MaxKeys": 1},
+        )
+
+        self.assertFalse(any_keys("asset.jarombek.com", "videos/", self.s3))
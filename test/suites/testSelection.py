@@ -0,0 +1,105 @@
+"""
+Unit tests for change-aware test suite selection, including checks that the suite coverage mapping is complete.
+These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import os
+import unittest
+
+from utils.selection import (
+    COVERAGE,
+    HARNESS_SUITES,
+    MOTO_SUITES_DIRECTORY,
+    REPOSITORY,
+    RUN_ALL,
+    SUITES_DIRECTORY,
+    affected_suites,
+    changed_files,
+    suite_names,
+)
+
+
+class TestSelection(unittest.TestCase):
+    def test_every_suite_mapped(self) -> None:
+        """
+        Test that every suite is mapped, so new suites can't be left out of change-aware runs
+        """
+        mapped = {suite for suites in COVERAGE.values() for suite in suites}
+        suites = set(suite_names()) | set(suite_names(MOTO_SUITES_DIRECTORY))
+        self.assertEqual(suites, mapped | HARNESS_SUITES)
+        self.assertEqual(set(), mapped & HARNESS_SUITES)
+
+    def test_every_terraform_module_mapped(self) -> None:
+        """
+        Test that every top level directory with Terraform code is mapped to the suites covering it
+        """
+        modules = {
+            directory
+            for directory in os.listdir(REPOSITORY)
+            for root, _, files in os.walk(os.path.join(REPOSITORY, directory))
+            if any(name.endswith(".tf") for name in files)
+        }
+        self.assertEqual(modules, set(COVERAGE))
+
+    def test_run_all_files_exist(self) -> None:
+        for path in RUN_ALL - {"test/Pipfile.lock"}:
+            self.assertTrue(os.path.exists(os.path.join(REPOSITORY, path)), path)
+
+    def test_terraform_change(self) -> None:
+        """
+        Test that a new post image only selects the asset suites, in each suites directory
+        """
+        changed = ["jarombek-com-assets/asset/posts/new-post.png"]
+        for directory in (SUITES_DIRECTORY, MOTO_SUITES_DIRECTORY):
+            with self.subTest(directory=directory):
+                self.assertEqual(
+                    set(COVERAGE["jarombek-com-assets"]) & set(suite_names(directory)),
+                    affected_suites(changed, directory),
+                )
+
+    def test_tooling_change_selects_importers(self) -> None:
+        """
+        Test that a change to a tool selects every suite which imports it, directly or through another tool
+        """
+        changed = ["test/tools/subscribers.py"]
+        suites = affected_suites(changed) | affected_suites(
+            changed, MOTO_SUITES_DIRECTORY
+        )
+        self.assertEqual({"testFanout", "testSubscribers"}, suites)
+
+    def test_suite_change(self) -> None:
+        self.assertEqual({"testACM"}, affected_suites(["test/suites/testACM.py"]))
+
+    def test_moto_suite_change(self) -> None:
+        """
+        Test that a changed moto suite is only selected from the moto suites directory
+        """
+        changed = ["test/moto_suites/testAssetSync.py"]
+        self.assertEqual(set(), affected_suites(changed))
+        self.assertEqual(
+            {"testAssetSync"}, affected_suites(changed, MOTO_SUITES_DIRECTORY)
+        )
+
+    def test_harness_change_runs_everything(self) -> None:
+        """
+        Test that changes to the runner, its dependencies, or the workflow run every suite
+        """
+        self.assertIsNone(affected_suites(["test/runner.py"]))
+        self.assertIsNone(affected_suites(["test/utils/fixtures.py"]))
+        self.assertIsNone(affected_suites([".github/workflows/aws_tests.yml"]))
+
+    def test_unrelated_change(self) -> None:
+        """
+        Test that documentation and code without AWS tests don't select any suites
+        """
+        self.assertEqual(
+            set(),
+            affected_suites(
+                ["README.md", "route53/README.md", "test-k8s/main_test.go"]
+            ),
+        )
+
+    def test_unknown_revision(self) -> None:
+        self.assertIsNone(changed_files("0000000000000000000000000000000000000000"))
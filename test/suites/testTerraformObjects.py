@@ -0,0 +1,235 @@
+"""
+Unit tests for the generated S3 objects uploaded by jarombek-com-assets/main.tf.  These tests run offline.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import json
+import os
+import re
+import tempfile
+import unittest
+
+from tools.cache_policy import FINGERPRINTED, MAPPING_KEY
+from tools.manifest import ASSET_DIRECTORY, build_manifest, key_mapping, md5_file
+from tools.terraform import (
+    HANDWRITTEN_FILE,
+    OBJECTS_FILE,
+    compare,
+    generate,
+    handwritten_keys,
+    load_handwritten,
+    moved_blocks,
+)
+
+TERRAFORM_DIRECTORY = os.path.dirname(ASSET_DIRECTORY)
+REGENERATE = "Regenerate it with 'python3 -m tools.terraform'"
+
+# How the generated objects differ from the hand-written resources in HANDWRITTEN_FILE.  Assets added since the
+# migration belong in ADDED.
+NEVER_DECLARED = {"github.png", "logos/svg.png"}
+NOT_IN_TREE = {
+    "posts/11-1-21-saintsxctf-home.png",
+    "posts/8-11-21-saintsxctf-home-page.png",
+}
+ADDED = {
+    MAPPING_KEY,
+    "fonts/ElegantIcons.woff2",
+    "fonts/FantasqueSansMono-Bold.woff2",
+    "fonts/Longway-Regular.woff2",
+    "fonts/SylexiadSansThin-Bold.woff2",
+    "fonts/SylexiadSansThin.woff2",
+    "fonts/dyslexie-bold.woff2",
+}
+
+HANDWRITTEN = """
+resource "aws_s3_object" "jarombek-png" {
+  bucket       = aws_s3_bucket.asset-jarombek.id
+  key          = "jarombek.png"
+  source       = "asset/jarombek.png"
+  etag         = filemd5("${path.cwd}/asset/jarombek.png")
+  content_type = "image/png"
+}
+
+resource "aws_s3_object" "flag-svg" {
+  bucket           = aws_s3_bucket.asset-jarombek.id
+  key              = "flag.svg"
+  source           = "compressed/flag.svg"
+  etag             = filemd5("${path.cwd}/compressed/flag.svg")
+  content_type     = "image/svg+xml"
+  content_encoding = "gzip"
+}
+
+resource "aws_s3_object" "posts-1-14-18-html-png" {
+  bucket        = aws_s3_bucket.asset-jarombek.id
+  key           = local.asset_keys["posts/1-14-18-html.png"]
+  source        = "asset/posts/1-14-18-html.png"
+  etag          = filemd5("${path.cwd}/asset/posts/1-14-18-html.png")
+  content_type  = "image/png"
+  cache_control = local.immutable
+}
+"""
+
+
+class TestTerraformObjects(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create an asset directory matching the hand-written Terraform resources
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.directory.name, "asset")
+        os.makedirs(os.path.join(self.assets, "posts"))
+
+        for key, content in (
+            ("jarombek.png", b"\x89PNG jarombek"),
+            ("flag.svg", b'<svg xmlns="http://www.w3.org/2000/svg"></svg>'),
+            ("posts/1-14-18-html.png", b"\x89PNG html"),
+        ):
+            with open(os.path.join(self.assets, key), "wb") as file:
+                file.write(content)
+
+        self.output = os.path.join(self.directory.name, "objects.json")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_generated_keys_match_handwritten(self) -> None:
+        """
+        Test that the generated objects cover exactly the hand-written resources, and that each one has a moved
+        block to its generated instance
+        """
+        generated = generate(self.assets, self.output, cache_path=None)
+        generated.pop("asset-manifest.json")
+        handwritten = handwritten_keys(HANDWRITTEN)
+
+        self.assertTrue(compare(generated, handwritten).identical)
+        self.assertIn(
+            "moved {\n"
+            "  from = aws_s3_object.posts-1-14-18-html-png\n"
+            '  to   = aws_s3_object.asset["posts/1-14-18-html.png"]\n'
+            "}\n",
+            moved_blocks(generated, handwritten),
+        )
+
+    def test_moved_blocks_keep_keys(self) -> None:
+        """
+        Test that state is never moved to an object with a different S3 key, which would delete the existing object
+        """
+        generated = generate(self.assets, self.output, cache_path=None)
+        generated["jarombek.png"]["key"] = "jarombek.0123abcd.png"
+        blocks = moved_blocks(generated, handwritten_keys(HANDWRITTEN))
+
+        self.assertNotIn("aws_s3_object.jarombek-png", blocks)
+        self.assertIn("aws_s3_object.flag-svg", blocks)
+
+    def test_generated_objects(self) -> None:
+        """
+        Test that each object has the same arguments its hand-written resource had, with a precomputed digest
+        """
+        generated = generate(self.assets, self.output, cache_path=None)
+
+        with open(self.output) as file:
+            self.assertEqual(json.load(file), generated)
+
+        png = os.path.join(self.assets, "posts/1-14-18-html.png")
+        fingerprinted = f"posts/1-14-18-html.{md5_file(png)[:8]}.png"
+        self.assertEqual(
+            generated[fingerprinted],
+            {
+                "key": fingerprinted,
+                "source": "asset/posts/1-14-18-html.png",
+                "etag": md5_file(png),
+                "content_type": "image/png",
+                "content_encoding": None,
+                "cache_control": "public, max-age=31536000, immutable",
+            },
+        )
+        self.assertEqual(
+            generated["posts/1-14-18-html.png"],
+            {
+                **generated[fingerprinted],
+                "key": "posts/1-14-18-html.png",
+                "cache_control": "public, max-age=300, must-revalidate",
+            },
+        )
+        self.assertEqual(generated["flag.svg"]["source"], "compressed/flag.svg")
+        self.assertEqual(generated["flag.svg"]["content_encoding"], "gzip")
+        self.assertEqual(
+            generated["flag.svg"]["etag"],
+            md5_file(os.path.join(self.directory.name, "compressed/flag.svg")),
+        )
+
+    def test_objects_file_up_to_date(self) -> None:
+        """
+        Test that the committed objects.json and asset-manifest.json are exactly what tools.terraform generates from
+        the asset directory.  The asset directory is linked into the temporary directory, so the compressed copies
+        and objects file are generated there
+        """
+        with open(os.path.join(ASSET_DIRECTORY, MAPPING_KEY)) as file:
+            committed_mapping = json.load(file)["assets"]
+
+        with open(OBJECTS_FILE) as file:
+            committed = json.load(file)
+
+        # The mapping is checked first, since generate() rewrites it when it's out of date.
+        manifest = build_manifest(ASSET_DIRECTORY, None)
+        self.assertEqual(committed_mapping, key_mapping(manifest), REGENERATE)
+
+        linked = os.path.join(self.directory.name, "linked", "asset")
+        os.makedirs(os.path.dirname(linked))
+        os.symlink(ASSET_DIRECTORY, linked)
+
+        self.assertEqual(
+            committed, generate(linked, self.output, cache_path=None), REGENERATE
+        )
+
+    def test_generated_keys_match_baseline(self) -> None:
+        """
+        Test that the committed objects are exactly the hand-written resources main.tf had before the migration,
+        apart from the known differences
+        """
+        with open(OBJECTS_FILE) as file:
+            committed = json.load(file)
+
+        keys = set(load_handwritten(HANDWRITTEN_FILE).values())
+        paths = {key for key in committed if not FINGERPRINTED.search(key)}
+        self.assertEqual((keys - NOT_IN_TREE) | NEVER_DECLARED | ADDED, paths)
+
+    def test_moved_from_baseline(self) -> None:
+        """
+        Test that every moved block hands over the state of a resource which existed in main.tf before the
+        migration, to the object with the same key, and that every such resource is moved
+        """
+        with open(os.path.join(TERRAFORM_DIRECTORY, "moved.tf")) as file:
+            moved = re.findall(
+                r'from = aws_s3_object\.(\S+)\n\s*to   = aws_s3_object\.asset\["([^"]+)"\]',
+                file.read(),
+            )
+
+        handwritten = load_handwritten(HANDWRITTEN_FILE)
+        for name, key in moved:
+            with self.subTest(name=name):
+                self.assertEqual(handwritten.get(name), key)
+
+        self.assertEqual(
+            {name for name, key in handwritten.items() if key not in NOT_IN_TREE},
+            {name for name, _ in moved},
+        )
+
+    def test_moved_resources_generated(self) -> None:
+        """
+        Test that every hand-written resource moved into the for_each resource is still generated, so Terraform
+        never deletes an object because its moved block points nowhere
+        """
+        with open(os.path.join(TERRAFORM_DIRECTORY, "moved.tf")) as file:
+            moved = file.read()
+
+        with open(OBJECTS_FILE) as file:
+            committed = json.load(file)
+
+        targets = [
+            line.split('"')[1] for line in moved.splitlines() if "to   =" in line
+        ]
+        self.assertGreater(len(targets), 0)
+        self.assertEqual(sorted(set(targets) - set(committed)), [])
+        self.assertEqual(len(targets), len(set(targets)))
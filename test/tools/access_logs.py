@@ -0,0 +1,434 @@
+"""
+Analyze the standard access logs of the asset.jarombek.com CloudFront distribution.  Gzipped log files are streamed
+from a local directory or S3 a block of lines at a time, and each block is split into columns which are aggregated
+with numpy into per-object request counts, bytes, edge cache hit ratios, and latency histograms.  The report ranks
+objects by bytes served and suggests which to optimize or cache longer.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import sys
+from typing import Dict, Iterator, List, NamedTuple, Optional, TextIO
+from urllib.parse import unquote
+
+import numpy
+from botocore.client import BaseClient
+
+from tools.cache_policy import IMMUTABLE, cache_control
+from tools.histogram import Histogram
+from utils.fixtures import AWS
+from utils.s3 import iter_keys
+
+# Fields of the standard log format, used when a log file has no '#Fields' header.
+FIELDS = [
+    "date",
+    "time",
+    "x-edge-location",
+    "sc-bytes",
+    "c-ip",
+    "cs-method",
+    "cs(Host)",
+    "cs-uri-stem",
+    "sc-status",
+    "cs(Referer)",
+    "cs(User-Agent)",
+    "cs-uri-query",
+    "cs(Cookie)",
+    "x-edge-result-type",
+    "x-edge-request-id",
+    "x-host-header",
+    "cs-protocol",
+    "cs-bytes",
+    "time-taken",
+    "x-forwarded-for",
+    "ssl-protocol",
+    "ssl-cipher",
+    "x-edge-response-result-type",
+    "cs-protocol-version",
+    "fle-status",
+    "fle-encrypted-fields",
+    "c-port",
+    "time-to-first-byte",
+    "x-edge-detailed-result-type",
+    "sc-content-type",
+    "sc-content-len",
+    "sc-range-start",
+    "sc-range-end",
+]
+
+# Responses served from the edge cache.  A RefreshHit was revalidated with the origin but not downloaded again.
+HIT_RESULTS = ["Hit", "RefreshHit"]
+MISS_RESULTS = ["Miss"]
+
+# Logs are read a block of text at a time, which bounds the memory used no matter how large the log files are.
+CHUNK_BYTES = 4 * 2**20
+
+# Thresholds for the report's suggestions.
+MIN_REQUESTS = 100
+LOW_HIT_RATIO = 0.8
+LARGE_OBJECT_BYTES = 200_000
+HEAVY_BYTES_SHARE = 0.05
+
+
+class Chunk(NamedTuple):
+    keys: numpy.ndarray
+    bytes: numpy.ndarray
+    hits: numpy.ndarray
+    misses: numpy.ndarray
+    errors: numpy.ndarray
+    latency_us: numpy.ndarray
+
+
+class KeyStats(NamedTuple):
+    key: str
+    requests: int
+    bytes: int
+    hits: int
+    misses: int
+    errors: int
+    latency: Histogram
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """
+        The share of cacheable requests served from the edge cache, or None if there were none.
+        """
+        cacheable = self.hits + self.misses
+        return self.hits / cacheable if cacheable else None
+
+    @property
+    def average_bytes(self) -> float:
+        return self.bytes / self.requests if self.requests else 0.0
+
+
+def open_log(path: str) -> TextIO:
+    """
+    Open a log file as text, decompressing it on the fly if it's gzipped.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+
+    return open(path, encoding="utf-8", errors="replace")
+
+
+def local_logs(directory: str) -> Iterator[TextIO]:
+    """
+    Stream every log file in a directory, in name order.
+    :param directory: A directory of log files, such as a local copy of the logging bucket.
+    :return: A generator of open files, each closed once the next is requested.
+    """
+    for root, _, files in sorted(os.walk(directory)):
+        for name in sorted(files):
+            if name.endswith(".gz") or name.endswith(".log"):
+                with open_log(os.path.join(root, name)) as file:
+                    yield file
+
+
+def s3_logs(
+    bucket: str, prefix: str = "", client: Optional[BaseClient] = None
+) -> Iterator[TextIO]:
+    """
+    Stream every log file in an S3 bucket, without downloading them to disk or reading them into memory.
+    :param bucket: The bucket CloudFront writes logs to.
+    :param prefix: The log prefix of the distribution.
+    :param client: The S3 client to use.  Defaults to the shared S3 client.
+    :return: A generator of text streams, one per object.
+    """
+    client = client or AWS.client("s3")
+    for key in iter_keys(bucket, prefix, client=client):
+        body = client.get_object(Bucket=bucket, Key=key)["Body"]
+        stream = gzip.GzipFile(fileobj=body) if key.endswith(".gz") else body
+        with io.TextIOWrapper(stream, encoding="utf-8", errors="replace") as file:
+            yield file
+
+
+class LogAnalyzer:
+    """
+    Aggregates log files a block of lines at a time.  Memory use is bounded by the block size and the number of
+    distinct objects, not the size of the logs.
+    """
+
+    def __init__(self, chunk_bytes: int = CHUNK_BYTES) -> None:
+        self.chunk_bytes = chunk_bytes
+        # Objects are numbered by their decoded key, and each key as it appears in the logs maps to that number.
+        self.objects: Dict[str, int] = {}
+        self.index: Dict[str, int] = {}
+        self.requests = numpy.zeros(0, dtype=numpy.int64)
+        self.bytes = numpy.zeros(0, dtype=numpy.int64)
+        self.hits = numpy.zeros(0, dtype=numpy.int64)
+        self.misses = numpy.zeros(0, dtype=numpy.int64)
+        self.errors = numpy.zeros(0, dtype=numpy.int64)
+        self.latency: List[Histogram] = []
+        self.lines = 0
+        self.skipped = 0
+
+    def add_file(self, file: TextIO) -> None:
+        """
+        Aggregate a log file.  The '#Fields' header of the file determines its columns.
+        :param file: The log file, opened as text.
+        """
+        fields = FIELDS
+        remainder = ""
+
+        while True:
+            block = file.read(self.chunk_bytes)
+            text = remainder + block
+            if block:
+                # Lines cut off at the end of a block are finished by the next one.
+                end = text.rfind("\n") + 1
+                text, remainder = text[:end], text[end:]
+
+            if text.startswith("#") or "\n#" in text:
+                lines = text.splitlines(keepends=True)
+                for line in lines:
+                    if line.startswith("#Fields:"):
+                        fields = line.split()[1:]
+                text = "".join(line for line in lines if not line.startswith("#"))
+
+            if text.strip():
+                self.add_chunk(self.parse(text, fields))
+            if not block:
+                return
+
+    def parse(self, text: str, fields: List[str]) -> Chunk:
+        """
+        Split a block of log lines into the columns the analysis needs, converted to numpy arrays.
+        :param text: Tab separated log lines.
+        :param fields: The names of the columns.
+        :return: The chunk's columns.  Keys are numbered by the analyzer's index of objects.  Lines which don't
+        have every field are skipped and counted.
+        """
+        # Splitting the whole block at once and slicing out every column is much faster than splitting each line.
+        # Blank lines and lines without every field, such as one truncated by an interrupted write, would shift the
+        # columns of every line after them, so only complete lines are joined.
+        separators = len(fields) - 1
+        lines = text.split("\n")
+        rows = [line for line in lines if line.count("\t") == separators]
+        self.skipped += sum(map(bool, lines)) - len(rows)
+        values = "\t".join(rows).split("\t") if rows else []
+
+        def column(name: str) -> List[str]:
+            return values[fields.index(name) :: len(fields)]
+
+        stems = column("cs-uri-stem")
+        for stem in set(stems).difference(self.index):
+            self.index[stem] = self.objects.setdefault(unquote(stem), len(self.objects))
+
+        results = column("x-edge-result-type")
+        return Chunk(
+            keys=numpy.array(
+                list(map(self.index.__getitem__, stems)), dtype=numpy.int64
+            ),
+            bytes=numpy.array(list(map(int, column("sc-bytes")))),
+            hits=numpy.array([result in HIT_RESULTS for result in results]),
+            misses=numpy.array([result in MISS_RESULTS for result in results]),
+            errors=numpy.array(list(map(int, column("sc-status")))) >= 400,
+            latency_us=numpy.rint(
+                numpy.array(list(map(float, column("time-taken")))) * 1e6
+            ).astype(numpy.int64),
+        )
+
+    def add_chunk(self, chunk: Chunk) -> None:
+        """
+        Add a parsed chunk to the per-object totals and latency histograms.
+        """
+        if not len(chunk.keys):
+            return
+
+        size = len(self.objects)
+        grow = size - len(self.requests)
+        if grow > 0:
+            for name in ("requests", "bytes", "hits", "misses", "errors"):
+                setattr(self, name, numpy.pad(getattr(self, name), (0, grow)))
+            self.latency.extend(Histogram() for _ in range(grow))
+
+        self.requests += numpy.bincount(chunk.keys, minlength=size)
+        self.bytes += numpy.bincount(
+            chunk.keys, weights=chunk.bytes, minlength=size
+        ).astype(numpy.int64)
+        self.hits += numpy.bincount(chunk.keys[chunk.hits], minlength=size)
+        self.misses += numpy.bincount(chunk.keys[chunk.misses], minlength=size)
+        self.errors += numpy.bincount(chunk.keys[chunk.errors], minlength=size)
+
+        # Group the latencies by key, so each key's histogram is built from an array in one call.
+        order = numpy.argsort(chunk.keys, kind="stable")
+        keys = chunk.keys[order]
+        starts = numpy.flatnonzero(numpy.diff(keys)) + 1
+        for key, latencies in zip(
+            keys[numpy.concatenate(([0], starts))],
+            numpy.split(chunk.latency_us[order], starts),
+        ):
+            self.latency[key].merge(Histogram.from_values(latencies))
+
+        self.lines += len(chunk.keys)
+
+    def stats(self) -> List[KeyStats]:
+        """
+        The totals of every object, ranked by bytes served.
+        """
+        keys = sorted(self.objects, key=self.objects.get)
+        result = [
+            KeyStats(
+                key=key,
+                requests=int(self.requests[i]),
+                bytes=int(self.bytes[i]),
+                hits=int(self.hits[i]),
+                misses=int(self.misses[i]),
+                errors=int(self.errors[i]),
+                latency=self.latency[i],
+            )
+            for i, key in enumerate(keys)
+        ]
+        return sorted(result, key=lambda stats: (-stats.bytes, stats.key))
+
+    def total(self) -> KeyStats:
+        """
+        The totals across every object.
+        """
+        latency = Histogram()
+        for histogram in self.latency:
+            latency.merge(histogram)
+
+        return KeyStats(
+            key="*",
+            requests=int(self.requests.sum()),
+            bytes=int(self.bytes.sum()),
+            hits=int(self.hits.sum()),
+            misses=int(self.misses.sum()),
+            errors=int(self.errors.sum()),
+            latency=latency,
+        )
+
+
+def suggestions(stats: KeyStats, total_bytes: int) -> List[str]:
+    """
+    Suggest how to serve an object more efficiently.
+    :param stats: The object's totals.
+    :param total_bytes: The bytes served for every object, to find the objects which dominate traffic.
+    :return: Suggestions, empty if nothing stands out.
+    """
+    result = []
+    if stats.requests >= MIN_REQUESTS and stats.errors > stats.requests / 2:
+        result.append("mostly errors, check the object exists")
+        return result
+
+    share = stats.bytes / total_bytes if total_bytes else 0.0
+    if stats.average_bytes >= LARGE_OBJECT_BYTES and share >= HEAVY_BYTES_SHARE:
+        result.append("optimize, a large object with a big share of bytes")
+
+    key = stats.key.lstrip("/")
+    if (
+        stats.requests >= MIN_REQUESTS
+        and stats.hit_ratio is not None
+        and stats.hit_ratio < LOW_HIT_RATIO
+        and cache_control(key) != IMMUTABLE
+    ):
+        result.append("cache longer, or publish under a fingerprinted key")
+
+    return result
+
+
+def report(analyzer: LogAnalyzer, top: int) -> dict:
+    """
+    Summarize the analysis as a JSON serializable report.
+    :param analyzer: An analyzer which read every log file.
+    :param top: The number of objects to rank.
+    """
+    total = analyzer.total()
+
+    def summary(stats: KeyStats) -> dict:
+        return {
+            "key": stats.key,
+            "requests": stats.requests,
+            "bytes": stats.bytes,
+            "bytes_share": round(stats.bytes / total.bytes, 4) if total.bytes else 0.0,
+            "hit_ratio": None if stats.hit_ratio is None else round(stats.hit_ratio, 4),
+            "errors": stats.errors,
+            "latency_ms": {
+                "p50": stats.latency.percentile(50) / 1000,
+                "p99": stats.latency.percentile(99) / 1000,
+            },
+            "suggestions": suggestions(stats, total.bytes),
+        }
+
+    return {
+        "lines": analyzer.lines,
+        "skipped": analyzer.skipped,
+        "objects": len(analyzer.objects),
+        "total": summary(total),
+        "ranked": [summary(stats) for stats in analyzer.stats()[:top]],
+    }
+
+
+def format_report(result: dict) -> str:
+    """
+    Format a report as a table ranked by bytes served.
+    """
+    total = result["total"]
+    lines = [
+        f"{result['lines']} requests for {result['objects']} objects, {total['bytes'] / 1e6:.1f} MB, "
+        f"hit ratio {total['hit_ratio'] or 0:.1%}, p50 {total['latency_ms']['p50']:.1f}ms, "
+        f"p99 {total['latency_ms']['p99']:.1f}ms, {result['skipped']} malformed lines skipped",
+        f"{'Key':<48} {'Requests':>9} {'MB':>9} {'Share':>6} {'Hit':>6} {'p99 ms':>8}  Suggestions",
+    ]
+    for item in result["ranked"]:
+        hit_ratio = "-" if item["hit_ratio"] is None else f"{item['hit_ratio']:.0%}"
+        lines.append(
+            f"{item['key'][:48]:<48} {item['requests']:>9} {item['bytes'] / 1e6:>9.2f} "
+            f"{item['bytes_share']:>6.1%} {hit_ratio:>6} {item['latency_ms']['p99']:>8.1f}  "
+            f"{'; '.join(item['suggestions'])}"
+        )
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Analyze the asset.jarombek.com CloudFront access logs."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--directory", help="A local directory of log files.")
+    source.add_argument("--bucket", help="The S3 bucket CloudFront writes logs to.")
+    parser.add_argument("--prefix", default="", help="The log prefix in the bucket.")
+    parser.add_argument(
+        "--top", type=int, default=25, help="Number of objects to rank."
+    )
+    parser.add_argument(
+        "--chunk-bytes",
+        type=int,
+        default=CHUNK_BYTES,
+        help="Characters of log lines aggregated at a time.",
+    )
+    parser.add_argument("--output", help="File to write the report to as JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    files = (
+        local_logs(args.directory)
+        if args.directory
+        else s3_logs(args.bucket, args.prefix)
+    )
+
+    analyzer = LogAnalyzer(args.chunk_bytes)
+    for file in files:
+        analyzer.add_file(file)
+
+    result = report(analyzer, args.top)
+    print(format_report(result))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Cache-Control policy for the objects in the asset.jarombek.com S3 bucket.  Assets which never change once published
+(such as blog post images) are uploaded under content hashed keys and cached forever, while mutable assets which
+are referenced by a fixed URL are given short lifetimes so CloudFront and browsers pick up changes quickly.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import os
+import re
+from typing import List, NamedTuple
+
+# A year is the longest lifetime browsers and CloudFront honor.  Fingerprinted keys change whenever their contents
+# do, so they never need to be revalidated.
+IMMUTABLE = "public, max-age=31536000, immutable"
+SHORT_LIVED = "public, max-age=300, must-revalidate"
+NO_CACHE = "no-cache"
+
+FINGERPRINT_LENGTH = 8
+FINGERPRINTED = re.compile(rf"\.[0-9a-f]{{{FINGERPRINT_LENGTH}}}\.[^./]+$")
+
+# Published articles link to post images by their original keys, and the website doesn't read the key mapping yet.
+# Until it does, fingerprinted assets are also published under their original keys, so those links keep working.
+KEEP_LEGACY_KEYS = True
+
+# Key of the JSON file mapping each asset to the key it's published under.  The website reads it to find
+# fingerprinted keys, so it must never be served stale.
+MAPPING_KEY = "asset-manifest.json"
+
+
+class CachePolicy(NamedTuple):
+    prefix: str
+    cache_control: str
+    fingerprint: bool
+
+
+# Evaluated in order, the first policy whose prefix matches a key applies.
+CACHE_POLICIES: List[CachePolicy] = [
+    CachePolicy(prefix=MAPPING_KEY, cache_control=NO_CACHE, fingerprint=False),
+    CachePolicy(prefix="posts/", cache_control=IMMUTABLE, fingerprint=True),
+    CachePolicy(prefix="", cache_control=SHORT_LIVED, fingerprint=False),
+]
+
+
+def policy(key: str) -> CachePolicy:
+    """
+    Find the cache policy for an asset.
+    :param key: The path of the asset relative to the asset directory, such as 'posts/1-14-18-html.png'.
+    :return: The first matching policy in CACHE_POLICIES.
+    """
+    return next(rule for rule in CACHE_POLICIES if key.startswith(rule.prefix))
+
+
+def fingerprint(key: str, md5: str) -> str:
+    """
+    Insert a content hash before the extension of a key, for example 'posts/html.png' becomes
+    'posts/html.3f2a1b4c.png'.
+    :param key: The path of the asset relative to the asset directory.
+    :param md5: The hex encoded MD5 digest of the uploaded file, which Terraform computes with filemd5().
+    :return: The fingerprinted key.
+    """
+    root, extension = os.path.splitext(key)
+    return f"{root}.{md5[:FINGERPRINT_LENGTH]}{extension}"
+
+
+def published_key(key: str, md5: str) -> str:
+    """
+    Determine the S3 key an asset is published under.
+    :param key: The path of the asset relative to the asset directory.
+    :param md5: The hex encoded MD5 digest of the uploaded file.
+    :return: A fingerprinted key if the asset's policy requires one, otherwise the key itself.
+    """
+    return fingerprint(key, md5) if policy(key).fingerprint else key
+
+
+def published_keys(key: str, md5: str) -> List[str]:
+    """
+    Determine every S3 key an asset is published under.
+    :param key: The path of the asset relative to the asset directory.
+    :param md5: The hex encoded MD5 digest of the uploaded file.
+    :return: The asset's published key, followed by its original key if it's fingerprinted and KEEP_LEGACY_KEYS is
+    set.
+    """
+    published = published_key(key, md5)
+    return [published, key] if published != key and KEEP_LEGACY_KEYS else [published]
+
+
+def cache_control(key: str) -> str:
+    """
+    Determine the Cache-Control header of a published object.
+    :param key: The S3 key of the object, fingerprinted or not.
+    :return: The Cache-Control header the object should be served with.  The original key of a fingerprinted asset
+    is short lived, since its contents change whenever the asset does.
+    """
+    rule = policy(key)
+    if rule.fingerprint and not FINGERPRINTED.search(key):
+        return SHORT_LIVED
+
+    return rule.cache_control
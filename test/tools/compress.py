@@ -0,0 +1,160 @@
+"""
+Prepare the text based assets in the jarombek-com-assets/asset directory for upload.  TrueType and OpenType fonts
+are converted to WOFF2 next to the originals, and every compressible asset is precompressed at the highest gzip
+level into the jarombek-com-assets/compressed directory, which Terraform and the sync tool upload from.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import os
+import sys
+from typing import List, NamedTuple, Optional
+
+import brotli
+from fontTools.ttLib import TTFont
+
+from tools.manifest import (
+    ASSET_DIRECTORY,
+    HASH_CACHE,
+    build_manifest,
+    scan,
+    write_compressed,
+)
+
+FONT_EXTENSIONS = (".otf", ".ttf")
+
+
+class CompressResult(NamedTuple):
+    key: str
+    size: int
+    gzip_size: int
+    brotli_size: int
+
+
+def woff2_path(path: str) -> str:
+    """
+    Location of the WOFF2 version of a font, such as 'fonts/dyslexie-bold.woff2' for 'fonts/dyslexie-bold.ttf'.
+    """
+    return f"{os.path.splitext(path)[0]}.woff2"
+
+
+def convert_to_woff2(path: str) -> bool:
+    """
+    Convert a TrueType or OpenType font to WOFF2, which compresses font tables with Brotli.  Fonts which were
+    already converted since they last changed are skipped.
+    :param path: Location of the font.
+    :return: True if a WOFF2 font was written.
+    """
+    destination = woff2_path(path)
+    if (
+        os.path.exists(destination)
+        and os.stat(destination).st_mtime_ns >= os.stat(path).st_mtime_ns
+    ):
+        return False
+
+    font = TTFont(path)
+    font.flavor = "woff2"
+    font.save(destination)
+    return True
+
+
+def convert_fonts(directory: str = ASSET_DIRECTORY) -> List[str]:
+    """
+    Convert every TrueType and OpenType font in the asset directory to WOFF2.
+    :param directory: The asset directory.
+    :return: Keys of the WOFF2 fonts which were written.
+    """
+    written = []
+    for key in sorted(scan(directory)):
+        path = os.path.join(directory, key)
+        if key.lower().endswith(FONT_EXTENSIONS) and convert_to_woff2(path):
+            written.append(woff2_path(key))
+
+    return written
+
+
+def compress(
+    directory: str = ASSET_DIRECTORY, cache_path: Optional[str] = HASH_CACHE
+) -> List[CompressResult]:
+    """
+    Precompress every compressible asset, measuring how much smaller each gets with gzip (which is what's
+    uploaded) and Brotli (for comparison).
+    :param directory: The asset directory.
+    :param cache_path: Location of the manifest's hash cache.
+    :return: The original and compressed sizes of each compressible asset.
+    """
+    manifest = build_manifest(directory, cache_path, save_cache=True)
+    write_compressed(directory, manifest)
+
+    results = []
+    for key, asset in manifest.items():
+        if asset.encoding is None:
+            continue
+
+        with open(os.path.join(directory, key), "rb") as file:
+            content = file.read()
+
+        results.append(
+            CompressResult(
+                key=key,
+                size=len(content),
+                gzip_size=asset.size,
+                brotli_size=len(brotli.compress(content, quality=11)),
+            )
+        )
+
+    return results
+
+
+def report(results: List[CompressResult]) -> str:
+    """
+    Summarize the bandwidth saved by precompressing assets.
+    :param results: The original and compressed sizes of each compressible asset.
+    :return: A human readable report.
+    """
+    lines = [f"{'Key':<50} {'Original':>10} {'Gzip':>10} {'Brotli':>10}"]
+    lines.extend(
+        f"{result.key:<50} {result.size:>10} {result.gzip_size:>10} {result.brotli_size:>10}"
+        for result in results
+    )
+
+    size = sum(result.size for result in results)
+    for label, compressed in (
+        ("Gzip", sum(result.gzip_size for result in results)),
+        ("Brotli", sum(result.brotli_size for result in results)),
+    ):
+        lines.append(
+            f"{label}: {size:,} -> {compressed:,} bytes "
+            f"({1 - compressed / size if size else 0:.1%} saved)"
+        )
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Convert fonts to WOFF2 and precompress text based assets."
+    )
+    parser.add_argument(
+        "--directory", default=ASSET_DIRECTORY, help="The local asset directory."
+    )
+    parser.add_argument(
+        "--skip-fonts", action="store_true", help="Don't convert fonts to WOFF2."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    if not args.skip_fonts:
+        for key in convert_fonts(args.directory):
+            print(f"Converted {key}")
+
+    print(report(compress(args.directory)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,415 @@
+"""
+Send an email to every subscriber in the jarombek-com-subscribers DynamoDB table.  Instead of one welcome email API
+request per subscriber, subscribers are streamed from the table and sent through a bounded pool of async workers,
+each of which sends batches of messages over a single SMTP session.  Temporary failures are retried with backoff, and
+every delivered address is checkpointed so an interrupted run resumes where it stopped.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import smtplib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Set
+
+from botocore.client import BaseClient
+
+from tools.subscribers import (
+    DEFAULT_UTILIZATION,
+    TABLE,
+    TokenBucket,
+    create_client,
+    scan_segment,
+    table_capacity,
+)
+
+SENDER = "andrew@jarombek.com"
+SUBJECT = "Welcome to jarombek.com"
+BODY = """Hi,
+
+Thanks for subscribing to jarombek.com!  You'll get an email whenever a new article is published.
+
+- Andrew
+"""
+
+DEFAULT_WORKERS = 8
+DEFAULT_BATCH_SIZE = 20
+MAX_ATTEMPTS = 5
+
+# Subscribers are read from the table this many at a time.
+READ_AHEAD = 100
+
+
+class Batch(NamedTuple):
+    sent: List[str]
+    failed: List[str]
+    pending: List[str]
+
+
+class FanoutResult(NamedTuple):
+    sent: int
+    skipped: int
+    failed: List[str]
+    retries: int
+    seconds: float
+
+    @property
+    def sends_per_second(self) -> float:
+        return self.sent / self.seconds if self.seconds > 0 else 0.0
+
+
+class Checkpoint:
+    def __init__(self, path: Optional[str]) -> None:
+        """
+        Record of the addresses which were already sent to, appended to a file with one address per line.
+        :param path: Location of the checkpoint file, or None to keep it in memory only.
+        """
+        self.path = path
+        self.sent: Set[str] = set()
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            with open(path) as file:
+                self.sent = {line.strip() for line in file if line.strip()}
+
+    def __contains__(self, address: str) -> bool:
+        return address in self.sent
+
+    def record(self, addresses: List[str]) -> None:
+        """
+        Durably record delivered addresses before moving on to the next batch.
+        """
+        if not addresses:
+            return
+
+        with self._lock:
+            self.sent.update(addresses)
+            if self.path:
+                with open(self.path, "a") as file:
+                    file.writelines(f"{address}\n" for address in addresses)
+                    file.flush()
+                    os.fsync(file.fileno())
+
+
+class SMTPSender:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str = SENDER,
+        subject: str = SUBJECT,
+        body: str = BODY,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = False,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Sends messages over a single SMTP session, which is opened on first use and reopened after a failure.
+        Not thread safe, so each worker uses its own sender.
+        """
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.subject = subject
+        self.body = body
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def message(self, recipient: str) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = recipient
+        message["Subject"] = self.subject
+        message.set_content(self.body)
+        return message
+
+    def connect(self) -> smtplib.SMTP:
+        if self._smtp is None:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            self._smtp = smtp
+
+        return self._smtp
+
+    def close(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+
+    def send_batch(self, recipients: List[str]) -> Batch:
+        """
+        Send one message per recipient over the current SMTP session.  Recipients which are temporarily rejected are
+        left pending.  If the session fails, sending stops and the session is reopened on the next attempt.
+        :param recipients: The addresses to send to.
+        :return: The addresses which were sent to, which were permanently rejected, and which weren't sent yet.
+        """
+        sent, failed, pending = [], [], []
+        for index, recipient in enumerate(recipients):
+            try:
+                self.connect().send_message(self.message(recipient))
+                sent.append(recipient)
+            except smtplib.SMTPRecipientsRefused as e:
+                code = e.recipients[recipient][0]
+                (pending if is_temporary(code) else failed).append(recipient)
+            except smtplib.SMTPResponseException as e:
+                if not is_temporary(e.smtp_code):
+                    failed.append(recipient)
+                    continue
+
+                self.close()
+                return Batch(sent, failed, pending + recipients[index:])
+            except (smtplib.SMTPServerDisconnected, OSError):
+                self._smtp = None
+                return Batch(sent, failed, pending + recipients[index:])
+
+        return Batch(sent, failed, pending)
+
+
+def is_temporary(code: int) -> bool:
+    """
+    SMTP 4xx responses are temporary failures which can be retried, while 5xx responses are permanent.
+    """
+    return 400 <= code < 500
+
+
+def backoff(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Seconds to wait before a retry, using exponential backoff with full jitter.
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def subscribers(
+    client: BaseClient,
+    table: str = TABLE,
+    read_capacity: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Stream the addresses of subscribed users from the subscribers table, one Scan page at a time.
+    :param client: The DynamoDB client.
+    :param table: The name of the table.
+    :param read_capacity: Read capacity units consumed per second, or None for no limit.
+    :return: A generator of email addresses.
+    """
+    bucket = TokenBucket(read_capacity)
+    for page in scan_segment(client, table, 0, 1, bucket):
+        for item in page["Items"]:
+            if item.get("subscribed", {}).get("BOOL", True):
+                yield item["email"]["S"]
+
+
+async def fan_out_async(
+    recipients: Iterable[str],
+    senders: Callable[[], SMTPSender],
+    checkpoint: Checkpoint,
+    workers: int,
+    batch_size: int,
+    max_attempts: int,
+    limit: Optional[int],
+) -> FanoutResult:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * batch_size * 2)
+    iterator = iter(recipients)
+    failed: List[str] = []
+    counts = {"sent": 0, "skipped": 0, "retries": 0}
+
+    with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+
+        async def produce() -> None:
+            queued = 0
+            while limit is None or queued < limit:
+                chunk = await loop.run_in_executor(
+                    executor, lambda: list(islice(iterator, READ_AHEAD))
+                )
+                if not chunk:
+                    break
+
+                for recipient in chunk:
+                    if recipient in checkpoint:
+                        counts["skipped"] += 1
+                    elif limit is None or queued < limit:
+                        await queue.put(recipient)
+                        queued += 1
+
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def consume() -> None:
+            sender = senders()
+            done = False
+            try:
+                while not done:
+                    # Wait for the first recipient of a batch, then take whatever else is already queued.
+                    pending = []
+                    while len(pending) < batch_size:
+                        if pending and queue.empty():
+                            break
+
+                        recipient = await queue.get()
+                        if recipient is None:
+                            done = True
+                            break
+                        pending.append(recipient)
+
+                    for attempt in range(max_attempts):
+                        if not pending:
+                            break
+                        if attempt > 0:
+                            counts["retries"] += 1
+                            await asyncio.sleep(backoff(attempt))
+
+                        result = await loop.run_in_executor(
+                            executor, sender.send_batch, pending
+                        )
+                        checkpoint.record(result.sent)
+                        counts["sent"] += len(result.sent)
+                        failed.extend(result.failed)
+                        pending = result.pending
+
+                    failed.extend(pending)
+            finally:
+                await loop.run_in_executor(executor, sender.close)
+
+        start = time.perf_counter()
+        await asyncio.gather(produce(), *(consume() for _ in range(workers)))
+        seconds = time.perf_counter() - start
+
+    return FanoutResult(
+        sent=counts["sent"],
+        skipped=counts["skipped"],
+        failed=failed,
+        retries=counts["retries"],
+        seconds=seconds,
+    )
+
+
+def fan_out(
+    recipients: Iterable[str],
+    senders: Callable[[], SMTPSender],
+    checkpoint: Optional[Checkpoint] = None,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_attempts: int = MAX_ATTEMPTS,
+    limit: Optional[int] = None,
+) -> FanoutResult:
+    """
+    Send an email to every recipient which isn't already in the checkpoint.
+    :param recipients: The addresses to send to, which are read lazily.
+    :param senders: Creates the SMTP sender used by each worker.
+    :param checkpoint: Addresses which were already sent to.  Defaults to an empty, in-memory checkpoint.
+    :param workers: The number of concurrent SMTP sessions.
+    :param batch_size: The maximum number of messages a worker sends per batch.
+    :param max_attempts: The number of times a batch is attempted before its remaining recipients fail.
+    :param limit: The maximum number of emails to send, so a run can be done in parts.
+    :return: The number of emails sent, the recipients skipped because of the checkpoint, and the failures.
+    """
+    return asyncio.run(
+        fan_out_async(
+            recipients,
+            senders,
+            checkpoint or Checkpoint(None),
+            workers,
+            batch_size,
+            max_attempts,
+            limit,
+        )
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Email every subscriber in the jarombek-com-subscribers table."
+    )
+    parser.add_argument("--smtp-host", required=True, help="The SMTP server.")
+    parser.add_argument("--smtp-port", type=int, default=587, help="The SMTP port.")
+    parser.add_argument(
+        "--starttls", action="store_true", help="Upgrade SMTP sessions to TLS."
+    )
+    parser.add_argument("--sender", default=SENDER, help="The From address.")
+    parser.add_argument("--subject", default=SUBJECT, help="The email subject.")
+    parser.add_argument(
+        "--body-file", help="Text file with the email body.  Defaults to a welcome."
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default="fanout-checkpoint.txt",
+        help="File recording the addresses already sent to.  Rerun with the same file to resume.",
+    )
+    parser.add_argument("--table", default=TABLE, help="The DynamoDB table.")
+    parser.add_argument("--endpoint-url", help="Endpoint of DynamoDB Local.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of concurrent SMTP sessions.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Messages sent per batch.",
+    )
+    parser.add_argument("--limit", type=int, help="Maximum number of emails to send.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    body = BODY
+    if args.body_file:
+        with open(args.body_file) as file:
+            body = file.read()
+
+    def senders() -> SMTPSender:
+        return SMTPSender(
+            args.smtp_host,
+            args.smtp_port,
+            sender=args.sender,
+            subject=args.subject,
+            body=body,
+            username=os.environ.get("SMTP_USERNAME"),
+            password=os.environ.get("SMTP_PASSWORD"),
+            starttls=args.starttls,
+        )
+
+    client = create_client(endpoint_url=args.endpoint_url)
+    read_capacity = table_capacity().read * DEFAULT_UTILIZATION
+    result = fan_out(
+        subscribers(client, args.table, read_capacity),
+        senders,
+        Checkpoint(args.checkpoint),
+        args.workers,
+        args.batch_size,
+        limit=args.limit,
+    )
+
+    print(
+        f"Sent {result.sent} emails in {result.seconds:.2f}s ({result.sends_per_second:.1f} sends/s), "
+        f"{result.skipped} already sent, {result.retries} retried batches, {len(result.failed)} failed"
+    )
+    for address in result.failed:
+        print(f"  Failed: {address}")
+
+    return 1 if result.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Latency histogram with HDR style log-linear buckets.  Values are recorded with a bounded relative error into a fixed
+number of buckets per power of two, so any number of samples can be recorded, merged, and queried for percentiles
+without keeping the samples themselves.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import math
+from typing import Dict, Iterator, Tuple
+
+
+class Histogram:
+    def __init__(self, precision_bits: int = 8) -> None:
+        """
+        Create an empty histogram of integer values, such as latencies in microseconds.
+        :param precision_bits: Values are bucketed by their highest precision_bits bits, so the relative error of a
+        recorded value is below 1 / 2^(precision_bits - 1).  The default of 8 bits keeps the error below 0.8%.
+        """
+        self.precision_bits = precision_bits
+        self.half = 1 << (precision_bits - 1)
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        shift = max(value.bit_length() - self.precision_bits, 0)
+        return shift * self.half + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        """
+        The largest value which is recorded in a bucket, so reported percentiles never understate latency.
+        """
+        shift = max(index // self.half - 1, 0)
+        return ((index - shift * self.half) << shift) + (1 << shift) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Record a value.
+        :param value: A non-negative integer, such as a latency in microseconds.
+        :param count: The number of times the value occurred.
+        """
+        value = max(int(value), 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+
+        self.min = value if self.count == 0 else min(self.min, value)
+        self.max = max(self.max, value)
+        self.count += count
+        self.total += value * count
+
+    @classmethod
+    def from_values(cls, values, precision_bits: int = 8) -> "Histogram":
+        """
+        Create a histogram from a numpy array of values, bucketing them all at once instead of one at a time.
+        :param values: A numpy array of non-negative integers, such as latencies in microseconds.
+        :param precision_bits: The precision of the histogram.
+        :return: A histogram with the same buckets as recording each value would produce.
+        """
+        import numpy
+
+        histogram = cls(precision_bits)
+        values = numpy.maximum(numpy.asarray(values, dtype=numpy.int64), 0)
+        if values.size == 0:
+            return histogram
+
+        # frexp's exponent is the bit length of each value, which is exact for integers below 2^53.
+        bit_lengths = numpy.frexp(values.astype(numpy.float64))[1].astype(numpy.int64)
+        shifts = numpy.maximum(bit_lengths - precision_bits, 0)
+        indices, counts = numpy.unique(
+            shifts * histogram.half + (values >> shifts), return_counts=True
+        )
+
+        histogram.counts = dict(zip(indices.tolist(), counts.tolist()))
+        histogram.count = int(values.size)
+        histogram.total = int(values.sum())
+        histogram.min = int(values.min())
+        histogram.max = int(values.max())
+        return histogram
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Add the values recorded by another histogram with the same precision.
+        """
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Histograms must have the same precision to be merged")
+        if other.count == 0:
+            return
+
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def buckets(self) -> Iterator[Tuple[int, int]]:
+        """
+        The recorded buckets in increasing order.
+        :return: A generator of (highest equivalent value, count) pairs.
+        """
+        for index in sorted(self.counts):
+            yield self._highest_equivalent(index), self.counts[index]
+
+    def percentile(self, percent: float) -> int:
+        """
+        The value at a percentile, within the histogram's precision.
+        :param percent: The percentile, between 0 and 100.
+        :return: The highest value equivalent to the percentile's bucket, capped at the largest recorded value, or
+        0 if the histogram is empty.
+        """
+        if self.count == 0:
+            return 0
+
+        # Rounded so floating point error doesn't push the rank past a whole number of values.
+        target = max(math.ceil(round(percent / 100 * self.count, 9)), 1)
+        seen = 0
+        for value, count in self.buckets():
+            seen += count
+            if seen >= target:
+                return min(value, self.max)
+
+        return self.max
+
+    def to_dict(self) -> dict:
+        """
+        Summarize the histogram as JSON serializable percentiles.
+        """
+        return {
+            "count": self.count,
+            "min": self.min,
+            "mean": round(self.mean, 1),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max,
+        }
@@ -0,0 +1,297 @@
+"""
+History of the infrastructure tests' durations, stored in SQLite.  Each test run is appended with the outcome and
+duration of every test, and the compare command flags tests whose latest duration regressed beyond the normal
+variation of their recent passing runs with the same number of workers.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import datetime
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+from typing import Iterable, List, NamedTuple, Optional
+
+from utils.results import PASSED, Record
+
+HISTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".test-history.db"
+)
+
+# A test is compared against its most recent passing runs, once there are enough of them to tell noise from a trend.
+BASELINE_RUNS = 10
+MIN_BASELINE_RUNS = 5
+
+# A test regressed when it's slower than its baseline median by more than THRESHOLD times the baseline's spread.
+THRESHOLD = 3.0
+
+# The spread is the median absolute deviation scaled to match a standard deviation, but never below these floors,
+# so tests with very steady or very short durations aren't flagged for scheduling noise.
+MAD_SCALE = 1.4826
+RELATIVE_NOISE = 0.05
+ABSOLUTE_NOISE = 0.01
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT NOT NULL,
+    commit_sha TEXT,
+    workers INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    test_id TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, test_id)
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (test_id, run_id);
+"""
+
+# Columns added to the runs table after the first histories were written, with their types.
+ADDED_COLUMNS = {"workers": "INTEGER"}
+
+
+class Regression(NamedTuple):
+    test_id: str
+    seconds: float
+    baseline: float
+    spread: float
+    samples: int
+
+    @property
+    def score(self) -> float:
+        """
+        How many spreads slower than its baseline the test ran.
+        """
+        return (self.seconds - self.baseline) / self.spread
+
+    @property
+    def slowdown(self) -> float:
+        return self.seconds / self.baseline if self.baseline > 0 else float("inf")
+
+
+def current_commit() -> Optional[str]:
+    """
+    The commit being tested, from GitHub Actions or the local git repository.
+    """
+    if os.environ.get("GITHUB_SHA"):
+        return os.environ["GITHUB_SHA"]
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def spread(durations: List[float]) -> float:
+    """
+    The robust spread of a test's baseline durations.
+    :param durations: Durations of the test's recent passing runs.
+    :return: The scaled median absolute deviation, with floors for steady and very short tests.
+    """
+    median = statistics.median(durations)
+    mad = statistics.median(abs(duration - median) for duration in durations)
+    return max(MAD_SCALE * mad, RELATIVE_NOISE * median, ABSOLUTE_NOISE)
+
+
+class History:
+    def __init__(self, path: str = HISTORY) -> None:
+        """
+        Open a history store, creating it if it doesn't exist.
+        :param path: The SQLite database file.
+        """
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.migrate()
+
+    def __enter__(self) -> "History":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def migrate(self) -> None:
+        """
+        Add columns which are missing from a history written before they existed.  Earlier runs are left without a
+        value, so they're only compared with each other.
+        """
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(runs)")}
+        with self.connection:
+            for column, kind in ADDED_COLUMNS.items():
+                if column not in columns:
+                    self.connection.execute(
+                        f"ALTER TABLE runs ADD COLUMN {column} {kind}"
+                    )
+
+    def append(
+        self,
+        records: Iterable[Record],
+        started: Optional[datetime.datetime] = None,
+        commit: Optional[str] = None,
+        workers: Optional[int] = None,
+    ) -> int:
+        """
+        Append a test run to the history.
+        :param records: The outcome and duration of every test in the run.
+        :param started: When the run started.  Defaults to now.
+        :param commit: The commit which was tested.
+        :param workers: The number of tests the run executed concurrently, which its durations depend on.
+        :return: The ID of the run.
+        """
+        started = started or datetime.datetime.now(datetime.timezone.utc)
+        with self.connection:
+            run_id = self.connection.execute(
+                "INSERT INTO runs (started, commit_sha, workers) VALUES (?, ?, ?)",
+                (started.isoformat(timespec="seconds"), commit, workers),
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results (run_id, test_id, outcome, seconds) VALUES (?, ?, ?, ?)",
+                (
+                    (run_id, record.test_id, record.outcome, record.seconds)
+                    for record in records
+                ),
+            )
+
+        return run_id
+
+    def latest_run(self) -> Optional[int]:
+        row = self.connection.execute("SELECT MAX(id) FROM runs").fetchone()
+        return row[0]
+
+    def workers(self, run_id: int) -> Optional[int]:
+        row = self.connection.execute(
+            "SELECT workers FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def baseline(
+        self, test_id: str, before: int, runs: int, workers: Optional[int] = None
+    ) -> List[float]:
+        """
+        Durations of a test's most recent passing runs.
+        :param test_id: The test.
+        :param before: Only runs before this run ID are included.
+        :param runs: The maximum number of runs.
+        :param workers: Only runs with this many workers are included, since tests run slower when more of them run
+        concurrently.
+        """
+        rows = self.connection.execute(
+            "SELECT seconds FROM results JOIN runs ON runs.id = results.run_id "
+            "WHERE test_id = ? AND run_id < ? AND outcome = ? AND workers IS ? "
+            "ORDER BY run_id DESC LIMIT ?",
+            (test_id, before, PASSED, workers, runs),
+        )
+        return [seconds for (seconds,) in rows]
+
+    def compare(
+        self,
+        run_id: Optional[int] = None,
+        baseline_runs: int = BASELINE_RUNS,
+        threshold: float = THRESHOLD,
+    ) -> List[Regression]:
+        """
+        Find the tests of a run which were slower than their recent baseline by more than the threshold.
+        :param run_id: The run to check.  Defaults to the latest run.
+        :param baseline_runs: The number of recent passing runs a test is compared against.
+        :param threshold: How many spreads slower than the baseline median a test must be to count as regressed.
+        :return: The regressed tests, most significant first.  Tests without enough passing runs with the same
+        number of workers are skipped.
+        """
+        run_id = run_id if run_id is not None else self.latest_run()
+        if run_id is None:
+            return []
+
+        workers = self.workers(run_id)
+
+        rows = self.connection.execute(
+            "SELECT test_id, seconds FROM results WHERE run_id = ? AND outcome = ?",
+            (run_id, PASSED),
+        ).fetchall()
+
+        regressions = []
+        for test_id, seconds in rows:
+            durations = self.baseline(test_id, run_id, baseline_runs, workers)
+            if len(durations) < MIN_BASELINE_RUNS:
+                continue
+
+            regression = Regression(
+                test_id,
+                seconds,
+                statistics.median(durations),
+                spread(durations),
+                len(durations),
+            )
+            if regression.score > threshold:
+                regressions.append(regression)
+
+        return sorted(regressions, key=lambda regression: -regression.score)
+
+
+def report(regressions: List[Regression]) -> str:
+    """
+    Format the regressed tests.
+    """
+    if not regressions:
+        return "No test durations regressed."
+
+    lines = [f"{len(regressions)} test durations regressed:"]
+    lines.extend(
+        f"  {regression.test_id}: {regression.seconds:.3f}s vs. a median of {regression.baseline:.3f}s over "
+        f"{regression.samples} runs ({regression.slowdown:.1f}x, {regression.score:.1f} spreads)"
+        for regression in regressions
+    )
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Flag tests whose duration regressed compared with their recent runs."
+    )
+    parser.add_argument(
+        "command", choices=["compare"], help="Compare the latest run to its baseline."
+    )
+    parser.add_argument(
+        "--history", default=HISTORY, help="The SQLite history database."
+    )
+    parser.add_argument(
+        "--run", type=int, help="The run to compare.  Defaults to the latest run."
+    )
+    parser.add_argument(
+        "--baseline",
+        type=int,
+        default=BASELINE_RUNS,
+        help="Number of recent passing runs each test is compared against.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="How many spreads slower than the baseline median a test must be to be flagged.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    with History(args.history) as history:
+        regressions = history.compare(args.run, args.baseline, args.threshold)
+
+    print(report(regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
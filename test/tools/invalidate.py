@@ -0,0 +1,308 @@
+"""
+Plan and submit CloudFront invalidations for changed objects in the asset.jarombek.com S3 bucket.  Changed keys are
+collapsed into directory wildcards only when a wildcard costs less than listing the keys, counting the unchanged
+objects a wildcard needlessly evicts from the edge cache.  Paths are submitted in batches within CloudFront's
+invalidation limits, waiting for each batch to complete.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import quote
+
+import boto3
+from botocore.client import BaseClient
+
+from tools.manifest import (
+    ASSET_DIRECTORY,
+    BUCKET,
+    HASH_CACHE,
+    build_manifest,
+    diff,
+    publish,
+)
+from utils.s3 import iter_objects
+
+# CloudFront allows 3,000 file paths and 15 wildcard paths in progress per distribution.  Batches are submitted one
+# at a time, so each batch can use the whole allowance.
+MAX_FILE_PATHS = 3000
+MAX_WILDCARD_PATHS = 15
+
+# Paths are billed per path, so a path costs 1.  Every unchanged object a wildcard evicts costs an extra origin
+# fetch and a slower response for the next visitor, weighed here as a fraction of a path.
+EVICTION_COST = 0.1
+
+# CloudFront usually completes an invalidation within a few minutes.
+POLL_INTERVAL = 20
+MAX_POLLS = 60
+
+
+class InvalidationPlan(NamedTuple):
+    paths: List[str]
+    evicted: int
+
+    @property
+    def wildcards(self) -> int:
+        return sum(1 for path in self.paths if path.endswith("*"))
+
+
+class Invalidation(NamedTuple):
+    id: str
+    paths: List[str]
+    seconds: float
+
+
+class Directory:
+    """
+    A directory of the bucket, with the number of objects and changed objects beneath it.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self.objects = 0
+        self.changed: List[str] = []
+        self.subdirectories: Dict[str, "Directory"] = {}
+        self.changed_below = 0
+
+    def add(self, key: str, changed: bool) -> None:
+        directory = self
+        for name in key[len(self.prefix) :].split("/")[:-1]:
+            directory.objects += 1
+            directory.changed_below += changed
+            directory = directory.subdirectories.setdefault(
+                name, Directory(f"{directory.prefix}{name}/")
+            )
+
+        directory.objects += 1
+        directory.changed_below += changed
+        if changed:
+            directory.changed.append(key)
+
+    def plan(self, eviction_cost: float) -> Tuple[float, List[str], int]:
+        """
+        Find the cheapest paths which invalidate every changed object beneath the directory.
+        :param eviction_cost: The cost of evicting an unchanged object, relative to the cost of a path.
+        :return: The cost, paths, and number of unchanged objects evicted.
+        """
+        cost = float(len(self.changed))
+        paths = [path(key) for key in sorted(self.changed)]
+        evicted = 0
+
+        for name in sorted(self.subdirectories):
+            subdirectory = self.subdirectories[name]
+            if subdirectory.changed_below:
+                sub_cost, sub_paths, sub_evicted = subdirectory.plan(eviction_cost)
+                cost += sub_cost
+                paths += sub_paths
+                evicted += sub_evicted
+
+        unchanged = self.objects - self.changed_below
+        wildcard_cost = 1 + eviction_cost * unchanged
+        if self.changed_below > 1 and wildcard_cost < cost:
+            return wildcard_cost, [f"{path(self.prefix)}*"], unchanged
+
+        return cost, paths, evicted
+
+
+def path(key: str) -> str:
+    """
+    The invalidation path of an S3 key.  CloudFront requires unsafe characters in paths to be URL encoded.
+    """
+    return "/" + quote(key, safe="/-_.~")
+
+
+def plan_paths(
+    changed: Iterable[str],
+    keys: Iterable[str],
+    eviction_cost: float = EVICTION_COST,
+) -> InvalidationPlan:
+    """
+    Compute the cheapest set of invalidation paths for a set of changed objects.
+    :param changed: Keys of the objects which changed, such as the stale keys of a manifest diff.
+    :param keys: Keys of every object served by the distribution, used to count what a wildcard would evict.
+    :param eviction_cost: The cost of needlessly evicting an unchanged object, relative to the cost of a path.
+    With the default, a directory wildcard replaces its changed keys once it saves a path for every 10 unchanged
+    objects it evicts.
+    :return: The paths to invalidate and the number of unchanged objects they evict.
+    """
+    changed_keys: Set[str] = set(changed)
+    root = Directory("")
+
+    for key in changed_keys | set(keys):
+        root.add(key, key in changed_keys)
+
+    if not changed_keys:
+        return InvalidationPlan(paths=[], evicted=0)
+
+    _, paths, evicted = root.plan(eviction_cost)
+    return InvalidationPlan(paths=paths, evicted=evicted)
+
+
+def batches(paths: List[str]) -> List[List[str]]:
+    """
+    Split invalidation paths into batches within CloudFront's limits on file and wildcard paths.
+    """
+    result: List[List[str]] = []
+    files = wildcards = 0
+
+    for item in paths:
+        wildcard = item.endswith("*")
+        full = wildcards == MAX_WILDCARD_PATHS if wildcard else files == MAX_FILE_PATHS
+        if not result or full:
+            result.append([])
+            files = wildcards = 0
+
+        result[-1].append(item)
+        wildcards += wildcard
+        files += not wildcard
+
+    return result
+
+
+def find_distribution(client: BaseClient, alias: str = BUCKET) -> str:
+    """
+    Find the ID of the CloudFront distribution serving a domain.
+    :param client: A CloudFront client.
+    :param alias: A CNAME of the distribution, such as 'asset.jarombek.com'.
+    :return: The distribution ID.
+    """
+    for page in client.get_paginator("list_distributions").paginate():
+        for distribution in page["DistributionList"].get("Items", []):
+            if alias in distribution["Aliases"].get("Items", []):
+                return distribution["Id"]
+
+    raise ValueError(f"No CloudFront distribution has the alias {alias}")
+
+
+def submit(
+    paths: List[str],
+    client: BaseClient,
+    distribution_id: str,
+    poll_interval: float = POLL_INTERVAL,
+    max_polls: int = MAX_POLLS,
+) -> List[Invalidation]:
+    """
+    Invalidate paths in batches, waiting for each batch to complete before submitting the next, so the batches
+    never exceed CloudFront's limits on invalidations in progress.
+    :param paths: The paths to invalidate.
+    :param client: A CloudFront client.
+    :param distribution_id: The ID of the distribution.
+    :param poll_interval: Seconds between checks of an invalidation's status.
+    :param max_polls: Number of checks before giving up on an invalidation.
+    :return: The submitted invalidations.
+    """
+    invalidations = []
+    waiter = client.get_waiter("invalidation_completed")
+
+    for batch in batches(paths):
+        start = time.perf_counter()
+        digest = hashlib.sha256("\n".join(batch).encode("utf-8")).hexdigest()[:16]
+        response = client.create_invalidation(
+            DistributionId=distribution_id,
+            InvalidationBatch={
+                "Paths": {"Quantity": len(batch), "Items": batch},
+                # Unique per submission, otherwise CloudFront treats a repeat of the same paths as the earlier one.
+                "CallerReference": f"{digest}-{time.time_ns()}",
+            },
+        )
+
+        invalidation_id = response["Invalidation"]["Id"]
+        waiter.wait(
+            DistributionId=distribution_id,
+            Id=invalidation_id,
+            WaiterConfig={"Delay": poll_interval, "MaxAttempts": max_polls},
+        )
+        invalidations.append(
+            Invalidation(invalidation_id, batch, time.perf_counter() - start)
+        )
+
+    return invalidations
+
+
+def report(plan: InvalidationPlan, changed: int) -> str:
+    """
+    Format an invalidation plan.
+    :param plan: The planned paths.
+    :param changed: The number of changed objects.
+    :return: A human readable report.
+    """
+    lines = [
+        f"{changed} changed objects, {len(plan.paths)} paths ({plan.wildcards} wildcards), "
+        f"{plan.evicted} unchanged objects evicted, {len(batches(plan.paths))} batches"
+    ]
+    lines.extend(f"  {item}" for item in plan.paths)
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Invalidate changed asset.jarombek.com objects in CloudFront."
+    )
+    parser.add_argument(
+        "keys",
+        nargs="*",
+        help="Keys of the changed objects.  Defaults to the stale objects in a diff of the asset directory and "
+        "the bucket, so run it before uploading.",
+    )
+    parser.add_argument(
+        "--bucket", default=BUCKET, help="The S3 bucket holding the assets."
+    )
+    parser.add_argument(
+        "--directory", default=ASSET_DIRECTORY, help="The local asset directory."
+    )
+    parser.add_argument(
+        "--distribution-id",
+        help="The CloudFront distribution.  Defaults to the distribution with the bucket's domain as an alias.",
+    )
+    parser.add_argument(
+        "--eviction-cost",
+        type=float,
+        default=EVICTION_COST,
+        help="Cost of needlessly evicting an unchanged object, relative to the cost of an invalidation path.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=POLL_INTERVAL,
+        help="Seconds between checks of an invalidation's status.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the planned paths without invalidating them.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    keys = [obj["Key"] for obj in iter_objects(args.bucket)]
+
+    changed = args.keys
+    if not changed:
+        manifest = publish(build_manifest(args.directory, HASH_CACHE))
+        changed = diff(manifest, iter_objects(args.bucket)).stale
+
+    plan = plan_paths(changed, keys, args.eviction_cost)
+    print(report(plan, len(set(changed))))
+
+    if args.dry_run or not plan.paths:
+        return 0
+
+    client = boto3.client("cloudfront")
+    distribution_id = args.distribution_id or find_distribution(client, args.bucket)
+    for invalidation in submit(plan.paths, client, distribution_id, args.poll_interval):
+        print(
+            f"Invalidation {invalidation.id} of {len(invalidation.paths)} paths completed in "
+            f"{invalidation.seconds:.0f}s"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
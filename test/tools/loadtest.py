@@ -0,0 +1,554 @@
+"""
+Open-loop load test of the jarombek.com web application.  A weighted mix of page routes (and optionally asset
+fetches) is sent at fixed arrival rates, whether or not earlier requests have completed, so a slow server can't slow
+the load down and hide its own latency.  Latencies are recorded in HDR style histograms for each target, and a
+capacity report recommends a replica count and CPU/memory requests for the web deployment in
+jarombek-com-kubernetes/modules/kubernetes/main.tf from the web application's results alone.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import aiohttp
+
+from tools.histogram import Histogram
+from tools.manifest import ASSET_DIRECTORY, HASH_CACHE, build_manifest, publish
+from tools.probe import BASE_URL as ASSET_URL
+
+WEB_URL = "http://localhost:8080"
+WEB = "web"
+ASSET = "asset"
+CHUNK_SIZE = 64 * 1024
+
+# Page routes of the web application and their share of page views.
+PAGES = {"/": 45, "/blog": 45, "/resume": 10}
+
+# Every page view loads a few images and fonts from asset.jarombek.com.  Assets are served by CloudFront, not the web
+# deployment, so they're only fetched when asked for.
+ASSETS_PER_PAGE = 2
+
+# A deployment should keep serving a peak with one replica down, so it never drops below two replicas.
+MIN_REPLICAS = 2
+
+# Replicas are sized to run at this fraction of the highest rate one instance sustained.
+TARGET_UTILIZATION = 0.7
+
+# Requested CPU and memory above what was observed, to absorb variance between nodes.
+RESOURCE_HEADROOM = 1.25
+
+
+class Route(NamedTuple):
+    target: str
+    path: str
+    weight: float
+
+
+class Stage(NamedTuple):
+    rate: float
+    duration: float
+
+
+class TargetResult(NamedTuple):
+    requests: int
+    errors: int
+    latency: Histogram
+    statuses: Dict[str, int]
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def to_dict(self, duration: float) -> dict:
+        return {
+            "requests": self.requests,
+            "achieved_rate": round(self.requests / duration, 2) if duration else 0.0,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 4),
+            "statuses": self.statuses,
+            "latency_us": self.latency.to_dict(),
+        }
+
+
+class StageResult(NamedTuple):
+    rate: float
+    duration: float
+    targets: Dict[str, TargetResult]
+    cpu_cores: Optional[float] = None
+    memory_bytes: Optional[int] = None
+
+    @property
+    def requests(self) -> int:
+        return sum(target.requests for target in self.targets.values())
+
+    @property
+    def web(self) -> TargetResult:
+        """
+        The requests served by the web application, which the deployment is sized from.
+        """
+        return self.targets.get(WEB) or TargetResult(0, 0, Histogram(), {})
+
+    @property
+    def achieved_rate(self) -> float:
+        """
+        Requests per second the web application served.  Asset fetches aren't counted, since CloudFront serves them.
+        """
+        return self.web.requests / self.duration if self.duration else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "rate": self.rate,
+            "duration": self.duration,
+            "requests": self.requests,
+            "targets": {
+                name: target.to_dict(self.duration)
+                for name, target in sorted(self.targets.items())
+            },
+            "cpu_cores": self.cpu_cores,
+            "memory_bytes": self.memory_bytes,
+        }
+
+
+class SLO(NamedTuple):
+    p99_ms: float = 500.0
+    max_error_rate: float = 0.01
+
+
+class Recommendation(NamedTuple):
+    sustainable_rate: Optional[float]
+    replicas: Optional[int]
+    cpu_request: Optional[str]
+    memory_request: Optional[str]
+    notes: List[str]
+
+
+def published_keys() -> List[str]:
+    """
+    Every key published from the asset directory.
+    """
+    return list(publish(build_manifest(ASSET_DIRECTORY, HASH_CACHE)))
+
+
+def default_mix(asset_keys: Optional[List[str]] = None) -> List[Route]:
+    """
+    The default request mix: page routes weighted by popularity, plus asset fetches in proportion to page views.
+    :param asset_keys: Keys of assets to fetch, such as published_keys().  Defaults to only page routes.
+    :return: Weighted routes.
+    """
+    routes = [Route(WEB, path, weight) for path, weight in PAGES.items()]
+    if asset_keys:
+        page_views = sum(PAGES.values())
+        weight = page_views * ASSETS_PER_PAGE / len(asset_keys)
+        routes.extend(Route(ASSET, f"/{key}", weight) for key in asset_keys)
+
+    return routes
+
+
+def load_mix(path: str) -> List[Route]:
+    """
+    Load a request mix from a JSON file, such as [{"target": "web", "path": "/blog", "weight": 10}].
+    """
+    with open(path) as file:
+        return [
+            Route(route.get("target", WEB), route["path"], route.get("weight", 1))
+            for route in json.load(file)
+        ]
+
+
+def arrivals(stage: Stage, poisson: bool, rng: random.Random) -> List[float]:
+    """
+    Offsets in seconds from the start of a stage at which requests are sent.
+    :param stage: The arrival rate and duration.
+    :param poisson: Use exponentially distributed gaps between requests, like independent users, instead of evenly
+    spaced requests.
+    """
+    if stage.rate <= 0:
+        return []
+    if not poisson:
+        return [i / stage.rate for i in range(int(stage.rate * stage.duration))]
+
+    times, now = [], rng.expovariate(stage.rate)
+    while now < stage.duration:
+        times.append(now)
+        now += rng.expovariate(stage.rate)
+
+    return times
+
+
+class ContainerStats:
+    def __init__(self, container: str, interval: float = 1.0) -> None:
+        """
+        Samples the CPU and memory usage of a local Docker container with 'docker stats' while a stage runs.
+        :param container: The name or ID of the container.
+        :param interval: Seconds between samples.
+        """
+        self.container = container
+        self.interval = interval
+        self.cpu: List[float] = []
+        self.memory: List[int] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        output = subprocess.run(
+            [
+                "docker",
+                "stats",
+                "--no-stream",
+                "--format",
+                "{{.CPUPerc}}|{{.MemUsage}}",
+                self.container,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        cpu, memory = output.split("|")
+        self.cpu.append(float(cpu.rstrip("%")) / 100)
+        self.memory.append(parse_bytes(memory.split("/")[0]))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "ContainerStats":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def parse_bytes(size: str) -> int:
+    """
+    Parse a size printed by Docker, such as '123.4MiB' or '1.2GB'.
+    """
+    match = re.fullmatch(r"\s*([\d.]+)\s*([kKMGT]?i?B)\s*", size)
+    if match is None:
+        raise ValueError(f"Unknown size: {size}")
+
+    number, unit = float(match.group(1)), match.group(2)
+    base = 1024 if "i" in unit else 1000
+    power = "BKMGT".index(unit[0].upper())
+    return int(number * base**power)
+
+
+async def send(session: aiohttp.ClientSession, url: str) -> Optional[int]:
+    """
+    Send a request and read the whole response.
+    :return: The response status, or None if the request failed.
+    """
+    try:
+        async with session.get(url) as response:
+            async for _ in response.content.iter_chunked(CHUNK_SIZE):
+                pass
+            return response.status
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+
+
+async def run_stage(
+    session: aiohttp.ClientSession,
+    stage: Stage,
+    routes: List[Route],
+    bases: Dict[str, str],
+    poisson: bool,
+    rng: random.Random,
+) -> StageResult:
+    """
+    Send requests at a stage's arrival rate.  Latency is measured from when each request was scheduled to be sent,
+    so requests delayed by an overloaded client or server are counted in full.  Each target is recorded separately.
+    """
+    targets = {route.target for route in routes}
+    latency = {target: Histogram() for target in targets}
+    statuses: Dict[str, Dict[str, int]] = {target: {} for target in targets}
+    errors = dict.fromkeys(targets, 0)
+    weights = [route.weight for route in routes]
+
+    async def request(route: Route, scheduled: float) -> None:
+        status = await send(session, f"{bases[route.target]}{route.path}")
+        latency[route.target].record(int((time.perf_counter() - scheduled) * 1_000_000))
+
+        label = str(status) if status is not None else "error"
+        counts = statuses[route.target]
+        counts[label] = counts.get(label, 0) + 1
+        if status is None or status >= 400:
+            errors[route.target] += 1
+
+    tasks = []
+    start = time.perf_counter()
+    for offset in arrivals(stage, poisson, rng):
+        scheduled = start + offset
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        route = rng.choices(routes, weights)[0]
+        tasks.append(asyncio.ensure_future(request(route, scheduled)))
+
+    await asyncio.gather(*tasks)
+    return StageResult(
+        rate=stage.rate,
+        duration=stage.duration,
+        targets={
+            target: TargetResult(
+                requests=sum(statuses[target].values()),
+                errors=errors[target],
+                latency=latency[target],
+                statuses=dict(sorted(statuses[target].items())),
+            )
+            for target in sorted(targets)
+        },
+    )
+
+
+async def load_test_async(
+    stages: List[Stage],
+    routes: List[Route],
+    bases: Dict[str, str],
+    poisson: bool,
+    timeout: float,
+    seed: Optional[int],
+    container: Optional[str],
+) -> List[StageResult]:
+    rng = random.Random(seed)
+    results = []
+
+    # Open-loop load can't wait for a free connection, so the pool isn't limited.
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)
+    ) as session:
+        for stage in stages:
+            if container is None:
+                result = await run_stage(session, stage, routes, bases, poisson, rng)
+            else:
+                with ContainerStats(container) as stats:
+                    result = await run_stage(
+                        session, stage, routes, bases, poisson, rng
+                    )
+
+                result = result._replace(
+                    cpu_cores=max(stats.cpu, default=None),
+                    memory_bytes=max(stats.memory, default=None),
+                )
+
+            results.append(result)
+
+    return results
+
+
+def load_test(
+    stages: List[Stage],
+    routes: List[Route],
+    web_url: str = WEB_URL,
+    asset_url: str = ASSET_URL,
+    poisson: bool = True,
+    timeout: float = 10.0,
+    seed: Optional[int] = None,
+    container: Optional[str] = None,
+) -> List[StageResult]:
+    """
+    Run each stage of an open-loop load test in order.
+    :param stages: Arrival rates in requests per second and how many seconds to hold them.
+    :param routes: The weighted request mix.
+    :param web_url: The web application, such as a local container of the web image.
+    :param asset_url: The URL assets are served from.  Only asset routes are sent there.
+    :param poisson: Use Poisson arrivals instead of evenly spaced requests.
+    :param timeout: Seconds before a request is counted as an error.
+    :param seed: Seed for the arrival times and request mix, so runs can be repeated.
+    :param container: Name of a local Docker container to sample CPU and memory usage from.
+    :return: The result of each stage.
+    """
+    bases = {WEB: web_url.rstrip("/"), ASSET: asset_url.rstrip("/")}
+    return asyncio.run(
+        load_test_async(stages, routes, bases, poisson, timeout, seed, container)
+    )
+
+
+def mebibytes(size: float) -> str:
+    return f"{math.ceil(size / 2**20 / 16) * 16}Mi"
+
+
+def millicores(cores: float) -> str:
+    return f"{max(math.ceil(cores * 1000 / 50) * 50, 50)}m"
+
+
+def recommend(results: List[StageResult], slo: SLO, peak_rate: float) -> Recommendation:
+    """
+    Size the web deployment from the results of a load test against a single instance.  Only requests to the web
+    application count, since asset fetches are served by CloudFront rather than the deployment.
+    :param results: Stage results from a load test against one instance of the web application.
+    :param slo: The p99 latency and error rate the web application must meet in a stage to be considered sustainable.
+    :param peak_rate: Requests per second the deployment must serve, such as a popular post's traffic spike.
+    :return: The highest sustainable rate of one instance, and the replicas and resource requests to serve the peak.
+    """
+    notes = []
+    passing = [
+        result
+        for result in results
+        if result.web.requests
+        and result.web.error_rate <= slo.max_error_rate
+        and result.web.latency.percentile(99) <= slo.p99_ms * 1000
+    ]
+
+    if not passing:
+        notes.append("No stage met the SLO; rerun with lower arrival rates.")
+        return Recommendation(None, None, None, None, notes)
+
+    best = max(passing, key=lambda result: result.rate)
+    if best.rate == max(result.rate for result in results):
+        notes.append(
+            "The highest stage met the SLO, so one instance may sustain more; rerun with higher rates."
+        )
+
+    per_replica = best.achieved_rate * TARGET_UTILIZATION
+    replicas = max(math.ceil(peak_rate / per_replica), MIN_REPLICAS)
+
+    cpu_request = memory_request = None
+    if best.cpu_cores is not None and best.memory_bytes is not None:
+        load = min(peak_rate / replicas / best.achieved_rate, 1.0)
+        cpu_request = millicores(best.cpu_cores * load * RESOURCE_HEADROOM)
+        memory_request = mebibytes(best.memory_bytes * RESOURCE_HEADROOM)
+    else:
+        notes.append(
+            "CPU and memory weren't sampled; pass --container to size resource requests."
+        )
+
+    return Recommendation(
+        sustainable_rate=round(best.achieved_rate, 2),
+        replicas=replicas,
+        cpu_request=cpu_request,
+        memory_request=memory_request,
+        notes=notes,
+    )
+
+
+def report(results: List[StageResult], slo: SLO, peak_rate: float) -> Dict[str, object]:
+    """
+    Build the JSON capacity report of a load test.
+    """
+    recommendation = recommend(results, slo, peak_rate)
+    return {
+        "slo": slo._asdict(),
+        "peak_rate": peak_rate,
+        "stages": [result.to_dict() for result in results],
+        "recommendation": recommendation._asdict(),
+    }
+
+
+def summary(results: List[StageResult], recommendation: Recommendation) -> str:
+    lines = [
+        f"{'Rate':>8} {'Target':<7} {'Sent':>7} {'Errors':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    ]
+    for result in results:
+        for name, target in result.targets.items():
+            lines.append(
+                f"{result.rate:>8.1f} {name:<7} {target.requests:>7} {target.error_rate:>8.1%} "
+                f"{target.latency.percentile(50) / 1000:>8.1f} {target.latency.percentile(95) / 1000:>8.1f} "
+                f"{target.latency.percentile(99) / 1000:>8.1f} {target.latency.max / 1000:>8.1f}"
+            )
+
+    if recommendation.replicas is not None:
+        lines.append(
+            f"One instance sustains {recommendation.sustainable_rate} requests/s.  Recommended: "
+            f"replicas = {recommendation.replicas}, cpu = {recommendation.cpu_request or 'unknown'}, "
+            f"memory = {recommendation.memory_request or 'unknown'}"
+        )
+
+    lines.extend(recommendation.notes)
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Open-loop load test and capacity report for the jarombek.com web application."
+    )
+    parser.add_argument(
+        "--web-url", default=WEB_URL, help="The web application under test."
+    )
+    parser.add_argument(
+        "--asset-url",
+        default=ASSET_URL,
+        help="The URL assets are served from with --assets.  Defaults to the production CloudFront distribution.",
+    )
+    parser.add_argument(
+        "--rates",
+        type=float,
+        nargs="+",
+        default=[5, 10, 20, 40, 80],
+        help="Arrival rates to step through, in requests per second.",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30, help="Seconds to hold each rate."
+    )
+    parser.add_argument(
+        "--mix", help="JSON file with the request mix.  Defaults to page routes."
+    )
+    parser.add_argument(
+        "--assets",
+        action="store_true",
+        help="Also fetch every published asset from --asset-url, about two per page view.  They aren't counted "
+        "towards the web deployment's capacity.",
+    )
+    parser.add_argument("--uniform", action="store_true", help="Space requests evenly.")
+    parser.add_argument("--seed", type=int, help="Seed for repeatable runs.")
+    parser.add_argument(
+        "--container", help="Local Docker container to sample CPU and memory from."
+    )
+    parser.add_argument(
+        "--peak-rate",
+        type=float,
+        default=50,
+        help="Requests per second the deployment must serve.",
+    )
+    parser.add_argument("--p99-ms", type=float, default=SLO().p99_ms)
+    parser.add_argument("--max-error-rate", type=float, default=SLO().max_error_rate)
+    parser.add_argument("--output", help="File to write the capacity report to.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.mix:
+        routes = load_mix(args.mix)
+    else:
+        routes = default_mix(published_keys() if args.assets else None)
+
+    results = load_test(
+        [Stage(rate, args.duration) for rate in args.rates],
+        routes,
+        args.web_url,
+        args.asset_url,
+        poisson=not args.uniform,
+        seed=args.seed,
+        container=args.container,
+    )
+
+    slo = SLO(p99_ms=args.p99_ms, max_error_rate=args.max_error_rate)
+    capacity = report(results, slo, args.peak_rate)
+    print(summary(results, recommend(results, slo, args.peak_rate)))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(capacity, file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,541 @@
+"""
+Build a manifest of the local jarombek-com-assets/asset directory and diff it against the objects in the
+asset.jarombek.com S3 bucket, reporting missing, stale, and orphaned objects.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from tools.cache_policy import (
+    MAPPING_KEY,
+    cache_control,
+    published_key,
+    published_keys,
+)
+from utils.s3 import iter_objects
+
+ASSET_DIRECTORY = os.path.normpath(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "jarombek-com-assets",
+        "asset",
+    )
+)
+HASH_CACHE = os.path.join(os.path.dirname(ASSET_DIRECTORY), ".asset-hash-cache.json")
+BUCKET = "asset.jarombek.com"
+
+# S3 rejects multipart upload parts smaller than 5 MiB (except the last part), so smaller files are single uploads.
+MULTIPART_CHUNKSIZE = 5 * 1024 * 1024
+
+# Content types used by the aws_s3_object resources in jarombek-com-assets/main.tf.
+CONTENT_TYPES = {
+    ".avif": "image/avif",
+    ".eot": "application/vnd.ms-fontobject",
+    ".gif": "image/gif",
+    ".jpeg": "image/jpeg",
+    ".jpg": "image/jpeg",
+    ".otf": "font/otf",
+    ".png": "image/png",
+    ".svg": "image/svg+xml",
+    ".ttf": "font/ttf",
+    ".webp": "image/webp",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+}
+
+# Text based assets are uploaded precompressed, so CloudFront serves them with a Content-Encoding header.  EOT, WOFF,
+# WOFF2, and image formats are binary formats which are already compressed.
+COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "font/otf",
+    "font/ttf",
+    "image/svg+xml",
+    "text/css",
+    "text/html",
+    "text/plain",
+}
+CONTENT_ENCODING = "gzip"
+
+
+class Asset(NamedTuple):
+    key: str
+    path: str
+    size: int
+    md5: str
+    content_type: str
+    encoding: Optional[str] = None
+    cache_control: Optional[str] = None
+
+
+class ManifestDiff(NamedTuple):
+    missing: List[str]
+    stale: List[str]
+    orphaned: List[str]
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.missing or self.stale or self.orphaned)
+
+
+def content_type(key: str) -> str:
+    """
+    Determine the content type an asset is served with.
+    :param key: The S3 key or filename of the asset.
+    :return: A MIME type, matching the one used in Terraform when the extension is known.
+    """
+    extension = os.path.splitext(key)[1].lower()
+    if extension in CONTENT_TYPES:
+        return CONTENT_TYPES[extension]
+
+    guessed, _ = mimetypes.guess_type(key)
+    return guessed or "application/octet-stream"
+
+
+def is_compressible(key: str) -> bool:
+    """
+    Determine if an asset is uploaded precompressed.
+    :param key: The S3 key or filename of the asset.
+    :return: True if the asset is text based or otherwise benefits from compression.
+    """
+    return content_type(key) in COMPRESSIBLE_TYPES
+
+
+def compressed_directory(directory: str) -> str:
+    """
+    Location of the precompressed copies of an asset directory's compressible files.
+    :param directory: The asset directory.
+    :return: A 'compressed' directory next to the asset directory.
+    """
+    return os.path.join(os.path.dirname(os.path.normpath(directory)), "compressed")
+
+
+def gzip_bytes(source: str) -> bytes:
+    """
+    Compress a file with gzip at the highest compression level.  The gzip header's timestamp and filename are
+    left empty, so compressing the same file always produces the same bytes (and the same S3 ETag).
+    :param source: Location of the file to compress.
+    :return: The compressed contents of the file.
+    """
+    with open(source, "rb") as file:
+        return gzip.compress(file.read(), compresslevel=9, mtime=0)
+
+
+def gzip_file(source: str, destination: str) -> bool:
+    """
+    Write the gzip compressed copy of a file.  The destination isn't rewritten if its contents are already correct.
+    :param source: Location of the file to compress.
+    :param destination: Location to write the compressed file to.
+    :return: True if the destination was written.
+    """
+    compressed = gzip_bytes(source)
+
+    if os.path.exists(destination):
+        with open(destination, "rb") as file:
+            if file.read() == compressed:
+                return False
+
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    with open(destination, "wb") as file:
+        file.write(compressed)
+
+    return True
+
+
+def digest(source: str, compress: bool = False) -> Tuple[str, int]:
+    """
+    Compute the digest and size of a file as it's uploaded to S3.  Runs in a worker process.  Compressed files are
+    hashed in memory, so nothing is written to disk.
+    :param source: Location of the file in the asset directory.
+    :param compress: Whether the file is uploaded gzip compressed.
+    :return: The MD5 digest and size of the uploaded file.
+    """
+    if compress:
+        compressed = gzip_bytes(source)
+        return hashlib.md5(compressed).hexdigest(), len(compressed)
+
+    return md5_file(source), os.path.getsize(source)
+
+
+def md5_file(path: str) -> str:
+    """
+    Compute the MD5 digest of a file.  The file is memory mapped, so large GIFs are hashed without copying their
+    contents into Python buffers.
+    :param path: Location of the file on disk.
+    :return: The hex encoded MD5 digest, which matches the S3 ETag of a single part upload.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return hashlib.md5().hexdigest()
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.md5(mapped).hexdigest()
+
+
+def multipart_etag(path: str, chunk_size: int = MULTIPART_CHUNKSIZE) -> str:
+    """
+    Compute the ETag S3 assigns to a file uploaded in multiple parts, which is the MD5 digest of the concatenated
+    MD5 digests of each part, followed by the number of parts.
+    :param path: Location of the file on disk.
+    :param chunk_size: The size of each uploaded part.
+    :return: The ETag of the multipart upload, without quotes.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return f"{hashlib.md5().hexdigest()}-1"
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                digests = [
+                    hashlib.md5(view[start : start + chunk_size]).digest()
+                    for start in range(0, size, chunk_size)
+                ]
+            finally:
+                view.release()
+
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def scan(directory: str) -> Dict[str, os.stat_result]:
+    """
+    Find every file in the asset directory.
+    :param directory: The asset directory.
+    :return: A dictionary of S3 keys (paths relative to the directory) to the stat results of their files.
+    """
+    files = {}
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            key = os.path.relpath(path, directory).replace(os.sep, "/")
+            files[key] = os.stat(path)
+
+    return files
+
+
+def load_hash_cache(path: Optional[str]) -> Dict[str, dict]:
+    """
+    Read the persistent hash cache.  A missing or corrupt cache is treated as empty.
+    :param path: Location of the hash cache file, or None to disable caching.
+    :return: A dictionary of S3 keys to their cached size, modification time, and MD5 digest.
+    """
+    if path is None or not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_hash_cache(path: Optional[str], cache: Dict[str, dict]) -> None:
+    """
+    Write the persistent hash cache.  The cache is written to a temporary file first, so an interrupted run
+    never leaves a truncated cache behind.
+    :param path: Location of the hash cache file, or None to disable caching.
+    :param cache: A dictionary of S3 keys to their size, modification time, and MD5 digest.
+    """
+    if path is None:
+        return
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(cache, file, sort_keys=True)
+
+    os.replace(temporary_path, path)
+
+
+def build_manifest(
+    directory: str = ASSET_DIRECTORY,
+    cache_path: Optional[str] = HASH_CACHE,
+    workers: Optional[int] = None,
+    precompress: bool = True,
+    save_cache: bool = False,
+) -> Dict[str, Asset]:
+    """
+    Build a manifest of the asset directory.  Files whose size and modification time match the hash cache aren't
+    rehashed.  The remaining files are hashed across a process pool.  Nothing is written to disk unless save_cache
+    is set, so read-only callers can build a manifest freely.
+    :param directory: The asset directory.
+    :param cache_path: Location of the persistent hash cache, or None to hash every file.
+    :param workers: Number of hashing processes.  Defaults to the number of CPUs.
+    :param precompress: Whether compressible files are described in their precompressed form, which is how they're
+    uploaded to S3.  Their copies in the compressed directory are written by write_compressed().
+    :param save_cache: Whether to update the hash cache with the files that were rehashed.
+    :return: A dictionary of S3 keys to assets.
+    """
+    files = scan(directory)
+    cache = load_hash_cache(cache_path)
+    output = compressed_directory(directory)
+    destinations = {
+        key: os.path.join(output, key) if precompress and is_compressible(key) else None
+        for key in files
+    }
+    digests: Dict[str, Tuple[str, int]] = {}
+    pending: List[str] = []
+
+    for key, stat in files.items():
+        cached = cache.get(key)
+        encoding = CONTENT_ENCODING if destinations[key] else None
+
+        if (
+            cached
+            and cached["size"] == stat.st_size
+            and cached["mtime_ns"] == stat.st_mtime_ns
+            and cached.get("encoding") == encoding
+        ):
+            digests[key] = (cached["md5"], cached.get("encoded_size", stat.st_size))
+        else:
+            pending.append(key)
+
+    sources = [os.path.join(directory, key) for key in pending]
+    compress = [destinations[key] is not None for key in pending]
+
+    if len(pending) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            hashed = executor.map(digest, sources, compress, chunksize=8)
+            digests.update(zip(pending, hashed))
+    else:
+        digests.update(
+            (key, digest(source, compressed))
+            for key, source, compressed in zip(pending, sources, compress)
+        )
+
+    if save_cache and (pending or len(cache) != len(files)):
+        save_hash_cache(
+            cache_path,
+            {
+                key: {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "md5": digests[key][0],
+                    "encoded_size": digests[key][1],
+                    "encoding": CONTENT_ENCODING if destinations[key] else None,
+                }
+                for key, stat in files.items()
+            },
+        )
+
+    return {
+        key: Asset(
+            key=key,
+            path=destinations[key] or os.path.join(directory, key),
+            size=digests[key][1],
+            md5=digests[key][0],
+            content_type=content_type(key),
+            encoding=CONTENT_ENCODING if destinations[key] else None,
+        )
+        for key in sorted(files)
+    }
+
+
+def write_compressed(directory: str, manifest: Dict[str, Asset]) -> List[str]:
+    """
+    Write the precompressed copies of compressible assets, which are uploaded in place of the originals.  Copies
+    which already have the digest in the manifest aren't recompressed.
+    :param directory: The asset directory.
+    :param manifest: A dictionary of asset paths to assets, as created by build_manifest().
+    :return: Keys of the assets whose compressed copies were written.
+    """
+    written = []
+    for key, asset in manifest.items():
+        if asset.encoding is None:
+            continue
+
+        if os.path.exists(asset.path) and md5_file(asset.path) == asset.md5:
+            continue
+
+        if gzip_file(os.path.join(directory, key), asset.path):
+            written.append(key)
+
+    return written
+
+
+def key_mapping(manifest: Dict[str, Asset]) -> Dict[str, str]:
+    """
+    Map every asset to the S3 key it's published under.  This mapping is uploaded as asset-manifest.json, so the
+    website can find the fingerprinted key of an asset from its path in the asset directory.
+    :param manifest: A dictionary of asset paths to assets, as created by build_manifest().
+    :return: A dictionary of asset paths to S3 keys, excluding the mapping file itself.
+    """
+    return {
+        key: published_key(key, asset.md5)
+        for key, asset in manifest.items()
+        if key != MAPPING_KEY
+    }
+
+
+def save_key_mapping(directory: str, mapping: Dict[str, str]) -> bool:
+    """
+    Write the key mapping to asset-manifest.json in the asset directory.  The file is only rewritten if the
+    mapping changed, so it doesn't churn the hash cache or the uploaded object.
+    :param directory: The asset directory.
+    :param mapping: A dictionary of asset paths to S3 keys.
+    :return: True if the file was written.
+    """
+    path = os.path.join(directory, MAPPING_KEY)
+    content = json.dumps({"version": 1, "assets": mapping}, indent=2, sort_keys=True)
+
+    if os.path.exists(path):
+        with open(path) as file:
+            if file.read() == f"{content}\n":
+                return False
+
+    with open(path, "w") as file:
+        file.write(f"{content}\n")
+
+    return True
+
+
+def publish(manifest: Dict[str, Asset]) -> Dict[str, Asset]:
+    """
+    Describe the assets as they're published to S3, with fingerprinted keys and Cache-Control headers.  Fingerprinted
+    assets are also published under their original keys while KEEP_LEGACY_KEYS is set.
+    :param manifest: A dictionary of asset paths to assets, as created by build_manifest().
+    :return: A dictionary of S3 keys to assets.
+    """
+    published = {}
+    for key, asset in manifest.items():
+        for remote_key in published_keys(key, asset.md5):
+            published[remote_key] = asset._replace(
+                key=remote_key, cache_control=cache_control(remote_key)
+            )
+
+    return published
+
+
+def etag_matches(asset: Asset, obj: dict) -> bool:
+    """
+    Determine if an object in S3 has the same contents as a local asset.
+    :param asset: The local asset.
+    :param obj: An object summary from list_objects_v2.
+    :return: True if the object is up to date with the asset.
+    """
+    if obj.get("Size") != asset.size:
+        return False
+
+    etag = obj.get("ETag", "").strip('"')
+
+    # Multipart upload ETags aren't a digest of the whole object.  They can only be reproduced locally if the
+    # object was uploaded with the same part size the sync tool uses.
+    if "-" in etag:
+        return etag == multipart_etag(asset.path)
+
+    return etag == asset.md5
+
+
+def diff(manifest: Dict[str, Asset], objects: Iterable[dict]) -> ManifestDiff:
+    """
+    Compare the asset manifest against the objects in the S3 bucket.
+    :param manifest: A dictionary of S3 keys to local assets.
+    :param objects: Object summaries from list_objects_v2.  Can be a lazy stream.
+    :return: Keys missing from the bucket, keys whose objects differ from the local file, and keys in the bucket
+    which don't exist locally.
+    """
+    seen = set()
+    stale = []
+    orphaned = []
+
+    for obj in objects:
+        key = obj["Key"]
+        asset = manifest.get(key)
+
+        if asset is None:
+            orphaned.append(key)
+        else:
+            seen.add(key)
+            if not etag_matches(asset, obj):
+                stale.append(key)
+
+    missing = [key for key in manifest if key not in seen]
+    return ManifestDiff(
+        missing=sorted(missing), stale=sorted(stale), orphaned=sorted(orphaned)
+    )
+
+
+def report(result: ManifestDiff) -> str:
+    """
+    Format the differences between the asset directory and the S3 bucket.
+    :param result: The differences found by diff().
+    :return: A human readable report.
+    """
+    lines = []
+    for label, keys in (
+        ("Missing from bucket", result.missing),
+        ("Stale in bucket", result.stale),
+        ("Orphaned in bucket", result.orphaned),
+    ):
+        lines.append(f"{label}: {len(keys)}")
+        lines.extend(f"  {key}" for key in keys)
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Diff the local asset directory against the asset.jarombek.com S3 bucket."
+    )
+    parser.add_argument(
+        "--bucket", default=BUCKET, help="The S3 bucket holding the assets."
+    )
+    parser.add_argument(
+        "--directory", default=ASSET_DIRECTORY, help="The local asset directory."
+    )
+    parser.add_argument(
+        "--cache", default=HASH_CACHE, help="Location of the persistent hash cache."
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Rehash every file.")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of hashing processes."
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Output the differences as JSON."
+    )
+    parser.add_argument(
+        "--write-mapping",
+        action="store_true",
+        help=f"Regenerate {MAPPING_KEY} in the asset directory instead of diffing against the bucket.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    manifest = build_manifest(
+        args.directory,
+        None if args.no_cache else args.cache,
+        args.workers,
+        save_cache=True,
+    )
+
+    if args.write_mapping:
+        written = save_key_mapping(args.directory, key_mapping(manifest))
+        print(f"{MAPPING_KEY} {'updated' if written else 'unchanged'}")
+        return 0
+
+    result = diff(publish(manifest), iter_objects(args.bucket))
+
+    if args.json:
+        print(json.dumps(result._asdict(), indent=2))
+    else:
+        print(report(result))
+
+    return 0 if result.in_sync else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
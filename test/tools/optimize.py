@@ -0,0 +1,315 @@
+"""
+Optimize the images in the jarombek-com-assets/asset directory before they're uploaded.  PNG files are losslessly
+recompressed, JPEG files are losslessly optimized with jpegtran (when it's installed), and WebP and AVIF variants
+are generated next to each image, named by appending the format to the original filename (a.png.webp).  Originals
+are rewritten in place, and tools.terraform publishes the variants as S3 objects like any other asset.  Animated GIFs
+get animated variants.  Results are cached by source digest, so unchanged files are never reprocessed.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
+from PIL import Image, features
+
+from tools.manifest import (
+    ASSET_DIRECTORY,
+    HASH_CACHE,
+    build_manifest,
+    load_hash_cache,
+    md5_file,
+    save_hash_cache,
+)
+
+OPTIMIZE_CACHE = os.path.join(
+    os.path.dirname(ASSET_DIRECTORY), ".asset-optimize-cache.json"
+)
+SOURCE_EXTENSIONS = (".gif", ".jpeg", ".jpg", ".png")
+
+# Pillow only bundles AVIF support in newer releases, so AVIF variants are skipped when it isn't available.
+AVIF_SUPPORTED = "avif" in features.modules and features.check_module("avif")
+
+VARIANT_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 85, "method": 6},
+    "avif": {"format": "AVIF", "quality": 70, "speed": 6},
+}
+
+
+class OptimizeResult(NamedTuple):
+    key: str
+    original_size: int
+    optimized_size: int
+    variants: Dict[str, int]
+    md5: str
+
+
+def variant_formats() -> List[str]:
+    """
+    The modern image formats which variants are generated in.
+    """
+    return ["webp", "avif"] if AVIF_SUPPORTED else ["webp"]
+
+
+def variant_path(path: str, extension: str) -> str:
+    """
+    Location of an image variant.  The variant extension is appended to the original filename, so 'a.png' and
+    'a.jpg' never share a variant.
+    :param path: Location of the original image.
+    :param extension: The variant format, such as 'webp'.
+    :return: Location of the variant, such as 'a.png.webp'.
+    """
+    return f"{path}.{extension}"
+
+
+def replace_if_smaller(path: str, temporary_path: str) -> None:
+    """
+    Swap a file for an optimized copy, keeping the original if the copy isn't smaller.
+    """
+    if os.path.getsize(temporary_path) < os.path.getsize(path):
+        os.replace(temporary_path, path)
+    else:
+        os.remove(temporary_path)
+
+
+def recompress(path: str) -> None:
+    """
+    Losslessly recompress an image in place.
+    :param path: Location of the image.
+    """
+    temporary_path = f"{path}.tmp"
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".png":
+        with Image.open(path) as image:
+            image.save(
+                temporary_path,
+                "PNG",
+                optimize=True,
+                icc_profile=image.info.get("icc_profile"),
+            )
+        replace_if_smaller(path, temporary_path)
+    elif extension in (".jpeg", ".jpg") and shutil.which("jpegtran"):
+        # Pillow can't rewrite a JPEG without decoding and re-encoding it, so jpegtran optimizes the Huffman
+        # tables losslessly instead.
+        subprocess.run(
+            ["jpegtran", "-optimize", "-copy", "icc", "-outfile", temporary_path, path],
+            check=True,
+        )
+        replace_if_smaller(path, temporary_path)
+
+
+def write_variant(path: str, extension: str) -> Optional[int]:
+    """
+    Write a variant of an image in a modern format.  Variants which aren't smaller than the original are deleted.
+    :param path: Location of the original image.
+    :param extension: The variant format, such as 'webp'.
+    :return: The size of the variant, or None if it wasn't worth keeping.
+    """
+    options = dict(VARIANT_OPTIONS[extension])
+    image_format = options.pop("format")
+    destination = variant_path(path, extension)
+
+    with Image.open(path) as image:
+        if getattr(image, "is_animated", False):
+            options["save_all"] = True
+
+        image.save(destination, image_format, **options)
+
+    size = os.path.getsize(destination)
+    if size >= os.path.getsize(path):
+        os.remove(destination)
+        return None
+
+    return size
+
+
+def optimize_file(key: str, path: str) -> OptimizeResult:
+    """
+    Recompress an image and generate its variants.  Runs in a worker process.
+    :param key: The S3 key of the image.
+    :param path: Location of the image.
+    :return: The sizes of the image before and after optimization and the sizes of its variants.
+    """
+    original_size = os.path.getsize(path)
+    recompress(path)
+
+    variants = {}
+    for extension in variant_formats():
+        size = write_variant(path, extension)
+        if size is not None:
+            variants[extension] = size
+
+    return OptimizeResult(
+        key=key,
+        original_size=original_size,
+        optimized_size=os.path.getsize(path),
+        variants=variants,
+        md5=md5_file(path),
+    )
+
+
+def is_cached(entry: Optional[dict], path: str) -> bool:
+    """
+    Determine if an image was already optimized and all of its variants still exist.
+    """
+    if entry is None or entry.get("formats") != variant_formats():
+        return False
+
+    return all(
+        os.path.exists(variant_path(path, extension)) for extension in entry["variants"]
+    )
+
+
+def optimize(
+    directory: str = ASSET_DIRECTORY,
+    cache_path: Optional[str] = OPTIMIZE_CACHE,
+    hash_cache_path: Optional[str] = HASH_CACHE,
+    workers: Optional[int] = None,
+    dry_run: bool = False,
+) -> List[OptimizeResult]:
+    """
+    Optimize every image in the asset directory which wasn't optimized in a previous run.
+    :param directory: The asset directory.  Images are optimized in place.
+    :param cache_path: Location of the cache of optimized images, keyed by the digest of the optimized file.
+    :param hash_cache_path: Location of the manifest's hash cache.
+    :param workers: Number of worker processes.  Defaults to the number of CPUs.
+    :param dry_run: Optimize copies of the images in a temporary directory, leaving the asset directory and the cache
+    untouched.
+    :return: Results for every image, including those served from the cache.
+    """
+    manifest = build_manifest(directory, hash_cache_path, workers, precompress=False)
+    cache = load_hash_cache(cache_path)
+    results = []
+    pending = []
+
+    for key, asset in manifest.items():
+        if not key.lower().endswith(SOURCE_EXTENSIONS):
+            continue
+
+        entry = cache.get(asset.md5)
+        if is_cached(entry, asset.path):
+            results.append(
+                OptimizeResult(
+                    key=key,
+                    original_size=entry["original_size"],
+                    optimized_size=asset.size,
+                    variants=entry["variants"],
+                    md5=asset.md5,
+                )
+            )
+        else:
+            pending.append(asset)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        paths = [asset.path for asset in pending]
+        if dry_run:
+            paths = [
+                shutil.copy(
+                    path, os.path.join(scratch, f"{i}{os.path.splitext(path)[1]}")
+                )
+                for i, path in enumerate(paths)
+            ]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            processed = list(
+                executor.map(optimize_file, [asset.key for asset in pending], paths)
+            )
+
+    if dry_run:
+        return sorted(results + processed, key=lambda result: result.key)
+
+    for result in processed:
+        cache[result.md5] = {
+            "key": result.key,
+            "original_size": result.original_size,
+            "variants": result.variants,
+            "formats": variant_formats(),
+        }
+
+    if processed:
+        save_hash_cache(cache_path, cache)
+
+    return sorted(results + processed, key=lambda result: result.key)
+
+
+def report(results: List[OptimizeResult]) -> str:
+    """
+    Summarize how many bytes the optimized images and their variants save.
+    :param results: Results for every image.
+    :return: A human readable report, with the images saving the most bytes first.
+    """
+    original = sum(result.original_size for result in results)
+    optimized = sum(result.optimized_size for result in results)
+    best = sum(
+        min([result.optimized_size, *result.variants.values()]) for result in results
+    )
+    lines = [
+        f"{'Key':<60} {'Original':>10} {'Optimized':>10} "
+        + " ".join(f"{extension.upper():>10}" for extension in variant_formats())
+    ]
+
+    for result in sorted(
+        results, key=lambda result: result.optimized_size - result.original_size
+    ):
+        lines.append(
+            f"{result.key:<60} {result.original_size:>10} {result.optimized_size:>10} "
+            + " ".join(
+                f"{result.variants.get(extension, '-'):>10}"
+                for extension in variant_formats()
+            )
+        )
+
+    lines.append("")
+    lines.append(f"Images: {len(results)}")
+    lines.append(
+        f"Lossless recompression: {original:,} -> {optimized:,} bytes "
+        f"({1 - optimized / original if original else 0:.1%} saved)"
+    )
+    lines.append(
+        f"Smallest format per image: {original:,} -> {best:,} bytes "
+        f"({1 - best / original if original else 0:.1%} saved)"
+    )
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recompress images in place and generate WebP/AVIF variants next to them in the asset directory."
+    )
+    parser.add_argument(
+        "--directory", default=ASSET_DIRECTORY, help="The local asset directory."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of worker processes."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the savings without rewriting images or writing variants.",
+    )
+    parser.add_argument("--output", help="File to write the results to as JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = optimize(args.directory, workers=args.workers, dry_run=args.dry_run)
+    print(report(results))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump([result._asdict() for result in results], file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Probe every object in the asset manifest through the asset.jarombek.com CloudFront distribution.  Objects are
+requested concurrently over a bounded pool of keep-alive connections, recording the status, size, time to first byte,
+and total time of each response, and the latency percentiles are checked against thresholds.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import asyncio
+import math
+import sys
+import time
+from typing import Iterable, List, NamedTuple, Optional
+
+import aiohttp
+
+from tools.manifest import ASSET_DIRECTORY, HASH_CACHE, build_manifest, publish
+
+BASE_URL = "https://asset.jarombek.com"
+DEFAULT_CONCURRENCY = 32
+CHUNK_SIZE = 64 * 1024
+
+
+class ProbeResult(NamedTuple):
+    key: str
+    status: Optional[int]
+    bytes: int
+    ttfb: float
+    total: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status == 200
+
+
+class Thresholds(NamedTuple):
+    max_error_rate: float = 0.0
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+
+class ProbeReport(NamedTuple):
+    results: List[ProbeResult]
+    seconds: float
+
+    @property
+    def errors(self) -> List[ProbeResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def error_rate(self) -> float:
+        return len(self.errors) / len(self.results) if self.results else 0.0
+
+    @property
+    def bytes(self) -> int:
+        return sum(result.bytes for result in self.results)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Bytes received per second of wall-clock time.
+        """
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def percentile(self, percent: float, field: str = "total") -> float:
+        """
+        Latency percentile of the successful responses.
+        :param percent: The percentile, such as 95.
+        :param field: Either 'total' for the full response time or 'ttfb' for the time to first byte.
+        :return: The latency in seconds, or 0 if no responses succeeded.
+        """
+        return percentile(
+            [getattr(result, field) for result in self.results if result.ok], percent
+        )
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Compute a percentile with the nearest-rank method, so the result is always an observed value.
+    :param values: The observed values.
+    :param percent: The percentile, between 0 and 100.
+    :return: The smallest value which is greater than or equal to percent% of the values, or 0 if there are none.
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def fetch(session: aiohttp.ClientSession, base_url: str, key: str) -> ProbeResult:
+    """
+    Request a single object, streaming its body so large GIFs aren't held in memory.
+    """
+    start = time.perf_counter()
+    ttfb = 0.0
+    size = 0
+
+    try:
+        async with session.get(f"{base_url}/{key}") as response:
+            ttfb = time.perf_counter() - start
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                size += len(chunk)
+
+            return ProbeResult(
+                key=key,
+                status=response.status,
+                bytes=size,
+                ttfb=ttfb,
+                total=time.perf_counter() - start,
+                error=None if response.status == 200 else response.reason,
+            )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return ProbeResult(
+            key=key,
+            status=None,
+            bytes=size,
+            ttfb=ttfb,
+            total=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
+async def probe_async(
+    base_url: str, keys: Iterable[str], concurrency: int, timeout: float
+) -> ProbeReport:
+    """
+    Request every key with a fixed number of workers sharing one connection pool.  A worker only starts timing a
+    request once it picks the key up, so queued keys don't count against latency.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for key in keys:
+        queue.put_nowait(key)
+
+    results: List[ProbeResult] = []
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=30)
+
+    # Responses aren't decompressed, so byte counts reflect what's sent over the network.
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        auto_decompress=False,
+        headers={"Accept-Encoding": "gzip"},
+    ) as session:
+
+        async def worker() -> None:
+            while not queue.empty():
+                key = queue.get_nowait()
+                results.append(await fetch(session, base_url, key))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        seconds = time.perf_counter() - start
+
+    return ProbeReport(results=sorted(results), seconds=seconds)
+
+
+def probe(
+    base_url: str = BASE_URL,
+    keys: Optional[Iterable[str]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = 30.0,
+) -> ProbeReport:
+    """
+    Request objects concurrently and measure how they're served.
+    :param base_url: The URL objects are served from, such as 'https://asset.jarombek.com'.
+    :param keys: The keys to request.  Defaults to every published key in the asset manifest.
+    :param concurrency: The maximum number of concurrent requests and open connections.
+    :param timeout: Seconds before a single request is considered failed.
+    :return: The result of every request and the wall-clock time of the probe.
+    """
+    if keys is None:
+        keys = publish(build_manifest(ASSET_DIRECTORY, HASH_CACHE)).keys()
+
+    return asyncio.run(probe_async(base_url.rstrip("/"), keys, concurrency, timeout))
+
+
+def violations(report: ProbeReport, thresholds: Thresholds) -> List[str]:
+    """
+    Check a probe report against thresholds.
+    :param report: The probe report.
+    :param thresholds: The maximum error rate and latency percentiles, in seconds.  Percentiles which are None
+    aren't checked.
+    :return: A description of each exceeded threshold, or an empty list.
+    """
+    problems = []
+    if report.error_rate > thresholds.max_error_rate:
+        problems.append(
+            f"Error rate {report.error_rate:.1%} exceeds {thresholds.max_error_rate:.1%}: "
+            + ", ".join(f"{result.key} ({result.error})" for result in report.errors)
+        )
+
+    for percent, limit in (
+        (50, thresholds.p50),
+        (95, thresholds.p95),
+        (99, thresholds.p99),
+    ):
+        if limit is not None and report.percentile(percent) > limit:
+            problems.append(
+                f"p{percent} latency {report.percentile(percent) * 1000:.0f} ms exceeds {limit * 1000:.0f} ms"
+            )
+
+    return problems
+
+
+def summary(report: ProbeReport) -> str:
+    """
+    Summarize a probe report.
+    :param report: The probe report.
+    :return: A human readable summary of latency percentiles, throughput, and errors.
+    """
+    lines = [
+        f"{len(report.results)} objects, {len(report.errors)} errors "
+        f"({report.error_rate:.1%}) in {report.seconds:.2f}s",
+        f"Throughput: {report.throughput / 1e6:.2f} MB/s, "
+        f"{len(report.results) / report.seconds if report.seconds else 0:.1f} requests/s",
+    ]
+
+    for field, label in (("ttfb", "TTFB"), ("total", "Total")):
+        lines.append(
+            f"{label:<6} p50 {report.percentile(50, field) * 1000:>7.1f} ms  "
+            f"p95 {report.percentile(95, field) * 1000:>7.1f} ms  "
+            f"p99 {report.percentile(99, field) * 1000:>7.1f} ms"
+        )
+
+    lines.extend(f"  {result.key}: {result.error}" for result in report.errors)
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Probe every asset served by asset.jarombek.com."
+    )
+    parser.add_argument(
+        "--base-url", default=BASE_URL, help="The URL assets are served from."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum number of concurrent requests.",
+    )
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=0.0,
+        help="Largest fraction of requests allowed to fail.",
+    )
+    parser.add_argument("--p50-ms", type=float, help="Largest allowed p50 latency.")
+    parser.add_argument("--p95-ms", type=float, help="Largest allowed p95 latency.")
+    parser.add_argument("--p99-ms", type=float, help="Largest allowed p99 latency.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    report = probe(args.base_url, concurrency=args.concurrency)
+    thresholds = Thresholds(
+        max_error_rate=args.max_error_rate,
+        p50=args.p50_ms / 1000 if args.p50_ms else None,
+        p95=args.p95_ms / 1000 if args.p95_ms else None,
+        p99=args.p99_ms / 1000 if args.p99_ms else None,
+    )
+
+    print(summary(report))
+    problems = violations(report, thresholds)
+    for problem in problems:
+        print(problem)
+
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
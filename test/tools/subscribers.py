@@ -0,0 +1,438 @@
+"""
+Bulk export and import of the jarombek-com-subscribers DynamoDB table.  Exports run a parallel segmented Scan and
+stream items to newline delimited JSON.  Imports stream newline delimited JSON into BatchWriteItem requests, retrying
+unprocessed items.  Both are rate limited with a token bucket so they stay inside the table's provisioned capacity.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, IO, Iterable, Iterator, List, NamedTuple, Optional
+
+import boto3
+from botocore.client import BaseClient
+from botocore.config import Config
+
+TABLE = "jarombek-com-subscribers"
+HASH_KEY = "email"
+TERRAFORM_FILE = os.path.normpath(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "dynamodb", "main.tf"
+    )
+)
+
+DEFAULT_WORKERS = 4
+
+# Fraction of the provisioned capacity used by default, leaving headroom for the application.
+DEFAULT_UTILIZATION = 0.8
+
+# BatchWriteItem accepts at most 25 put requests.
+BATCH_SIZE = 25
+
+# Items returned per Scan page.  Subscriber items are small, so a page consumes a few read capacity units.
+PAGE_SIZE = 100
+
+MAX_BATCH_ATTEMPTS = 8
+
+Item = Dict[str, dict]
+
+
+class Capacity(NamedTuple):
+    read: int
+    write: int
+
+
+class TransferResult(NamedTuple):
+    items: int
+    capacity_units: float
+    retries: int
+    seconds: float
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds > 0 else 0.0
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: Optional[float],
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Create a thread safe token bucket which limits the capacity units consumed per second.  Consumption is
+        often only known after a request completes, so the bucket can go into debt, and later requests wait
+        until it's paid off.
+        :param rate: Tokens added per second, or None for no limit.
+        :param burst: The maximum number of tokens the bucket holds.  Defaults to one second of tokens.
+        :param clock: Monotonic clock, in seconds.
+        :param sleep: Function which waits for a number of seconds.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.burst or 0.0
+        self.waited = 0.0
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Wait until tokens are available and take them.
+        :param tokens: The estimated capacity units of the next request.  Requests larger than the burst size
+        wait for a full bucket.
+        """
+        if self.rate is None:
+            return
+
+        # Tokens are reserved before waiting, so concurrent callers queue up behind each other instead of racing
+        # for the same refill.
+        with self._lock:
+            self._refill()
+            wait = max(min(tokens, self.burst) - self.tokens, 0.0) / self.rate
+            self.tokens -= tokens
+            self.waited += wait
+
+        if wait > 0:
+            self.sleep(wait)
+
+    def consume(self, tokens: float) -> None:
+        """
+        Take tokens without waiting, such as the difference between a request's estimated and actual consumption.
+        :param tokens: Capacity units to take.  Negative values refund tokens.
+        """
+        if self.rate is None:
+            return
+
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.burst, self.tokens - tokens)
+
+
+def table_capacity(terraform_file: str = TERRAFORM_FILE) -> Capacity:
+    """
+    Read the provisioned capacity of the subscribers table from its Terraform configuration.
+    :param terraform_file: Path to dynamodb/main.tf.
+    :return: The read and write capacity units of the table.
+    """
+    with open(terraform_file) as file:
+        terraform = file.read()
+
+    read = re.search(r"^\s*read_capacity\s*=\s*(\d+)", terraform, re.MULTILINE)
+    write = re.search(r"^\s*write_capacity\s*=\s*(\d+)", terraform, re.MULTILINE)
+    return Capacity(read=int(read.group(1)), write=int(write.group(1)))
+
+
+def create_client(
+    workers: int = DEFAULT_WORKERS, endpoint_url: Optional[str] = None
+) -> BaseClient:
+    """
+    Create the DynamoDB client shared by every worker.
+    :param workers: The number of concurrent requests.
+    :param endpoint_url: Endpoint of DynamoDB Local.  Defaults to AWS.
+    :return: A boto3 DynamoDB client.
+    """
+    return boto3.client(
+        "dynamodb",
+        endpoint_url=endpoint_url,
+        config=Config(max_pool_connections=workers, retries={"mode": "standard"}),
+    )
+
+
+def write_units(item: Item) -> int:
+    """
+    Estimate the write capacity units of putting an item, which cost one unit per started KB.  The JSON encoding of
+    an item is slightly larger than DynamoDB's size calculation, so this errs on the side of caution.
+    """
+    return max(math.ceil(len(json.dumps(item)) / 1024), 1)
+
+
+def consumed_units(response: dict) -> Optional[float]:
+    """
+    Total capacity units a request consumed, if DynamoDB returned them.
+    """
+    consumed = response.get("ConsumedCapacity")
+    if consumed is None:
+        return None
+    if isinstance(consumed, dict):
+        consumed = [consumed]
+
+    return sum(capacity.get("CapacityUnits", 0.0) for capacity in consumed)
+
+
+def scan_segment(
+    client: BaseClient,
+    table: str,
+    segment: int,
+    total_segments: int,
+    bucket: TokenBucket,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[dict]:
+    """
+    Scan one segment of a table, page by page.  Each page acquires the capacity of the previous page from the token
+    bucket, and the difference from its actual consumption is settled once it returns.
+    :return: A generator of Scan responses.
+    """
+    kwargs = {
+        "TableName": table,
+        "Segment": segment,
+        "TotalSegments": total_segments,
+        "Limit": page_size,
+        "ReturnConsumedCapacity": "TOTAL",
+    }
+    estimate = 1.0
+
+    while True:
+        bucket.acquire(estimate)
+        response = client.scan(**kwargs)
+
+        actual = consumed_units(response)
+        if actual is not None:
+            bucket.consume(actual - estimate)
+            estimate = max(actual, 0.5)
+
+        yield response
+
+        if "LastEvaluatedKey" not in response:
+            return
+
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def export_table(
+    output: IO[str],
+    client: Optional[BaseClient] = None,
+    table: str = TABLE,
+    workers: int = DEFAULT_WORKERS,
+    read_capacity: Optional[float] = None,
+) -> TransferResult:
+    """
+    Export every item in a table with a parallel segmented Scan, one segment per worker.  Items are written to the
+    output as newline delimited DynamoDB JSON (the format of aws_dynamodb_table_item) as each page arrives.
+    :param output: A text stream to write the items to.
+    :param client: The DynamoDB client to use.  Defaults to a new client.
+    :param table: The name of the table.
+    :param workers: The number of segments scanned concurrently.
+    :param read_capacity: Read capacity units consumed per second across all workers, or None for no limit.
+    :return: The number of items exported and the capacity they consumed.
+    """
+    client = client or create_client(workers)
+    bucket = TokenBucket(read_capacity)
+    lock = threading.Lock()
+
+    def export_segment(segment: int) -> TransferResult:
+        items = 0
+        units = 0.0
+        for page in scan_segment(client, table, segment, workers, bucket):
+            lines = "".join(f"{json.dumps(item)}\n" for item in page["Items"])
+            with lock:
+                output.write(lines)
+
+            items += len(page["Items"])
+            units += consumed_units(page) or 0.0
+
+        return TransferResult(items=items, capacity_units=units, retries=0, seconds=0)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        segments = [executor.submit(export_segment, i) for i in range(workers)]
+        results = [future.result() for future in as_completed(segments)]
+
+    return TransferResult(
+        items=sum(result.items for result in results),
+        capacity_units=sum(result.capacity_units for result in results),
+        retries=0,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def read_items(lines: Iterable[str]) -> Iterator[Item]:
+    """
+    Parse newline delimited DynamoDB JSON, skipping blank lines.
+    """
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def batches(items: Iterable[Item], size: int = BATCH_SIZE) -> Iterator[List[Item]]:
+    """
+    Group items into BatchWriteItem sized batches.  BatchWriteItem rejects a batch which puts the same key twice,
+    so a repeated email replaces the earlier item in its batch.
+    """
+    batch: Dict[str, Item] = {}
+    for item in items:
+        batch[json.dumps(item[HASH_KEY], sort_keys=True)] = item
+        if len(batch) == size:
+            yield list(batch.values())
+            batch = {}
+
+    if batch:
+        yield list(batch.values())
+
+
+def write_batch(
+    client: BaseClient,
+    table: str,
+    batch: List[Item],
+    bucket: TokenBucket,
+    max_attempts: int = MAX_BATCH_ATTEMPTS,
+    sleep: Callable[[float], None] = time.sleep,
+) -> TransferResult:
+    """
+    Put a batch of items, resending unprocessed items with exponential backoff and full jitter.
+    :return: The capacity units consumed by the batch and the number of times it was resent.
+    """
+    requests = [{"PutRequest": {"Item": item}} for item in batch]
+    units = 0.0
+
+    for attempt in range(max_attempts):
+        if attempt > 0:
+            sleep(random.uniform(0, min(0.05 * 2**attempt, 5.0)))
+
+        estimate = sum(
+            write_units(request["PutRequest"]["Item"]) for request in requests
+        )
+        bucket.acquire(estimate)
+        response = client.batch_write_item(
+            RequestItems={table: requests}, ReturnConsumedCapacity="TOTAL"
+        )
+
+        actual = consumed_units(response)
+        if actual is not None:
+            bucket.consume(actual - estimate)
+        units += actual if actual is not None else estimate
+
+        requests = response.get("UnprocessedItems", {}).get(table, [])
+        if not requests:
+            return TransferResult(
+                items=len(batch), capacity_units=units, retries=attempt, seconds=0
+            )
+
+    raise RuntimeError(
+        f"{len(requests)} items were still unprocessed after {max_attempts} attempts"
+    )
+
+
+def import_items(
+    items: Iterable[Item],
+    client: Optional[BaseClient] = None,
+    table: str = TABLE,
+    workers: int = DEFAULT_WORKERS,
+    write_capacity: Optional[float] = None,
+) -> TransferResult:
+    """
+    Put items into a table with concurrent BatchWriteItem requests.  Only a few batches per worker are read ahead,
+    so large files are streamed rather than loaded into memory.
+    :param items: The items to put, in DynamoDB JSON.
+    :param client: The DynamoDB client to use.  Defaults to a new client.
+    :param table: The name of the table.
+    :param workers: The maximum number of concurrent BatchWriteItem requests.
+    :param write_capacity: Write capacity units consumed per second across all workers, or None for no limit.
+    :return: The number of items imported, the capacity they consumed, and the number of resent batches.
+    """
+    client = client or create_client(workers)
+    bucket = TokenBucket(write_capacity)
+    in_flight = threading.BoundedSemaphore(workers * 2)
+    results: List[TransferResult] = []
+
+    def write(batch: List[Item]) -> TransferResult:
+        try:
+            return write_batch(client, table, batch, bucket)
+        finally:
+            in_flight.release()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for batch in batches(items):
+            in_flight.acquire()
+            futures.append(executor.submit(write, batch))
+
+        results = [future.result() for future in futures]
+
+    return TransferResult(
+        items=sum(result.items for result in results),
+        capacity_units=sum(result.capacity_units for result in results),
+        retries=sum(result.retries for result in results),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export or import the jarombek-com-subscribers DynamoDB table."
+    )
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument(
+        "file", help="Newline delimited JSON file to export to or import from."
+    )
+    parser.add_argument("--table", default=TABLE, help="The DynamoDB table.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of Scan segments or concurrent BatchWriteItem requests.",
+    )
+    parser.add_argument(
+        "--utilization",
+        type=float,
+        default=DEFAULT_UTILIZATION,
+        help="Fraction of the provisioned capacity in dynamodb/main.tf to consume.  Use 0 for no limit.",
+    )
+    parser.add_argument("--endpoint-url", help="Endpoint of DynamoDB Local.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    client = create_client(args.workers, args.endpoint_url)
+    capacity = table_capacity()
+    limit = args.utilization or None
+
+    if args.command == "export":
+        with open(args.file, "w") as file:
+            result = export_table(
+                file,
+                client,
+                args.table,
+                args.workers,
+                read_capacity=limit and capacity.read * limit,
+            )
+    else:
+        with open(args.file) as file:
+            result = import_items(
+                read_items(file),
+                client,
+                args.table,
+                args.workers,
+                write_capacity=limit and capacity.write * limit,
+            )
+
+    print(
+        f"{args.command.capitalize()}ed {result.items} items in {result.seconds:.2f}s "
+        f"({result.items_per_second:.1f} items/s), {result.capacity_units:.1f} capacity units, "
+        f"{result.retries} retried batches"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Upload changed files from the jarombek-com-assets/asset directory to the asset.jarombek.com S3 bucket.  Files whose
+S3 ETag already matches their local digest are skipped, and the remaining files are uploaded concurrently through a
+single connection pooled S3 client, using multipart uploads for large files.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.client import BaseClient
+from botocore.config import Config
+
+from tools.manifest import (
+    ASSET_DIRECTORY,
+    BUCKET,
+    HASH_CACHE,
+    MULTIPART_CHUNKSIZE,
+    Asset,
+    ManifestDiff,
+    build_manifest,
+    diff,
+    publish,
+    write_compressed,
+)
+from tools.invalidate import find_distribution, plan_paths, report, submit
+from utils.s3 import iter_objects
+
+DEFAULT_WORKERS = 16
+
+
+class SyncResult(NamedTuple):
+    uploaded: List[str]
+    replaced: List[str]
+    skipped: int
+    bytes_uploaded: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        Upload throughput in bytes per second.
+        """
+        return self.bytes_uploaded / self.seconds if self.seconds > 0 else 0.0
+
+
+def create_client(
+    workers: int = DEFAULT_WORKERS, endpoint_url: Optional[str] = None
+) -> BaseClient:
+    """
+    Create the S3 client shared by every upload.  The connection pool is sized to the number of workers, so
+    concurrent uploads reuse connections instead of waiting on them.
+    :param workers: The number of concurrent uploads.
+    :param endpoint_url: Endpoint of a local S3 stand-in such as MinIO.  Defaults to AWS.
+    :return: A boto3 S3 client.
+    """
+    return boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        config=Config(max_pool_connections=workers, retries={"mode": "standard"}),
+    )
+
+
+def plan(manifest: Dict[str, Asset], changes: ManifestDiff) -> List[Asset]:
+    """
+    Determine which assets need to be uploaded.
+    :param manifest: A dictionary of S3 keys to local assets.
+    :param changes: The differences between the manifest and the objects in the bucket.
+    :return: Assets which are missing from the bucket or differ from the uploaded object, largest first so big
+    files don't end up trailing at the end of the run.
+    """
+    keys = changes.missing + changes.stale
+    return sorted((manifest[key] for key in keys), key=lambda asset: -asset.size)
+
+
+def extra_args(asset: Asset) -> Dict[str, str]:
+    """
+    The object metadata an asset is uploaded with.
+    :param asset: The asset to upload.
+    :return: Extra arguments for the S3 upload, with a Content-Encoding header for precompressed assets.
+    """
+    args = {"ContentType": asset.content_type}
+    if asset.encoding:
+        args["ContentEncoding"] = asset.encoding
+    if asset.cache_control:
+        args["CacheControl"] = asset.cache_control
+
+    return args
+
+
+def upload(
+    assets: List[Asset],
+    bucket: str,
+    client: BaseClient,
+    workers: int = DEFAULT_WORKERS,
+) -> None:
+    """
+    Upload assets concurrently with a bounded pool of transfer threads.
+    :param assets: The assets to upload.
+    :param bucket: The S3 bucket to upload to.
+    :param client: The shared S3 client.
+    :param workers: The maximum number of concurrent requests, including multipart upload parts.
+    """
+    config = TransferConfig(
+        multipart_threshold=MULTIPART_CHUNKSIZE,
+        multipart_chunksize=MULTIPART_CHUNKSIZE,
+        max_concurrency=workers,
+        use_threads=workers > 1,
+    )
+
+    with create_transfer_manager(client, config) as manager:
+        futures = [
+            manager.upload(
+                asset.path,
+                bucket,
+                asset.key,
+                extra_args=extra_args(asset),
+            )
+            for asset in assets
+        ]
+
+        for future in futures:
+            future.result()
+
+
+def sync(
+    directory: str = ASSET_DIRECTORY,
+    bucket: str = BUCKET,
+    client: Optional[BaseClient] = None,
+    workers: int = DEFAULT_WORKERS,
+    cache_path: Optional[str] = HASH_CACHE,
+    dry_run: bool = False,
+) -> SyncResult:
+    """
+    Upload every file in the asset directory which isn't already up to date in the S3 bucket.
+    :param directory: The local asset directory.
+    :param bucket: The S3 bucket to upload to.
+    :param client: The S3 client to use.  Defaults to a new connection pooled client.
+    :param workers: The maximum number of concurrent requests.
+    :param cache_path: Location of the persistent hash cache, or None to hash every file.
+    :param dry_run: Determine which files would be uploaded without uploading them or writing anything to disk.
+    :return: The keys uploaded, the uploaded keys which replaced an existing object, the number of files skipped,
+    and the upload throughput.
+    """
+    client = client or create_client(workers)
+    built = build_manifest(directory, cache_path, save_cache=not dry_run)
+    manifest = publish(built)
+    changes = diff(manifest, iter_objects(bucket, client=client))
+    assets = plan(manifest, changes)
+
+    start = time.perf_counter()
+    if not dry_run:
+        write_compressed(directory, built)
+        upload(assets, bucket, client, workers)
+    seconds = time.perf_counter() - start
+
+    return SyncResult(
+        uploaded=[asset.key for asset in assets],
+        replaced=changes.stale,
+        skipped=len(manifest) - len(assets),
+        bytes_uploaded=sum(asset.size for asset in assets),
+        seconds=seconds,
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Upload changed assets to the asset.jarombek.com S3 bucket."
+    )
+    parser.add_argument(
+        "--bucket", default=BUCKET, help="The S3 bucket holding the assets."
+    )
+    parser.add_argument(
+        "--directory", default=ASSET_DIRECTORY, help="The local asset directory."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Maximum number of concurrent uploads.",
+    )
+    parser.add_argument(
+        "--endpoint-url", help="Endpoint of a local S3 stand-in such as MinIO."
+    )
+    parser.add_argument(
+        "--invalidate",
+        action="store_true",
+        help="Invalidate the replaced objects in CloudFront after uploading them.",
+    )
+    parser.add_argument(
+        "--distribution-id",
+        help="The CloudFront distribution to invalidate.  Defaults to the distribution with the bucket's domain "
+        "as an alias.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the files which would be uploaded without uploading them.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    client = create_client(args.workers, args.endpoint_url)
+    result = sync(
+        args.directory, args.bucket, client, args.workers, dry_run=args.dry_run
+    )
+
+    for key in result.uploaded:
+        print(f"{'Would upload' if args.dry_run else 'Uploaded'} {key}")
+
+    print(
+        f"{len(result.uploaded)} uploaded ({result.bytes_uploaded / 1e6:.1f} MB), "
+        f"{result.skipped} unchanged, {result.throughput / 1e6:.1f} MB/s"
+    )
+
+    if args.invalidate and result.replaced:
+        keys = [obj["Key"] for obj in iter_objects(args.bucket, client=client)]
+        invalidation_plan = plan_paths(result.replaced, keys)
+        print(report(invalidation_plan, len(result.replaced)))
+
+        if not args.dry_run:
+            cloudfront = boto3.client("cloudfront")
+            distribution_id = args.distribution_id or find_distribution(
+                cloudfront, args.bucket
+            )
+            submit(invalidation_plan.paths, cloudfront, distribution_id)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Generate the objects.json file which jarombek-com-assets/main.tf uploads to the asset.jarombek.com S3 bucket with a
+single for_each resource.  Each object's key, source, content type, and digest are precomputed here (reusing the
+manifest's hash cache), so Terraform doesn't call filemd5() on every file in the asset directory during a plan.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+from tools.cache_policy import FINGERPRINTED
+from tools.manifest import (
+    ASSET_DIRECTORY,
+    HASH_CACHE,
+    Asset,
+    build_manifest,
+    key_mapping,
+    publish,
+    save_key_mapping,
+    write_compressed,
+)
+
+OBJECTS_FILE = os.path.join(os.path.dirname(ASSET_DIRECTORY), "objects.json")
+
+# The hand-written aws_s3_object resources in main.tf before they were generated, which moved.tf is created from.
+HANDWRITTEN_FILE = os.path.join(os.path.dirname(ASSET_DIRECTORY), "handwritten.json")
+RESOURCE = "aws_s3_object.asset"
+
+HANDWRITTEN_RESOURCE = re.compile(
+    r'resource "aws_s3_object" "([^"]+)" \{\n(.*?)\n\}', re.DOTALL
+)
+HANDWRITTEN_KEY = re.compile(r'^\s*key\s*=\s*.*?"([^"]+)"', re.MULTILINE)
+
+
+class KeyComparison(NamedTuple):
+    added: List[str]
+    removed: List[str]
+
+    @property
+    def identical(self) -> bool:
+        return not (self.added or self.removed)
+
+
+def objects(directory: str, manifest: Dict[str, Asset]) -> Dict[str, dict]:
+    """
+    Describe every S3 object Terraform creates.  Objects are keyed by their S3 key, which is the asset's path in the
+    asset directory unless it's a fingerprinted copy.  A fingerprinted copy's key changes with its contents, so
+    Terraform deletes the old copy when it uploads the new one.
+    :param directory: The asset directory.
+    :param manifest: A dictionary of asset paths to assets, as created by build_manifest().
+    :return: A dictionary of S3 keys to the arguments of their aws_s3_object resource.
+    """
+    root = os.path.dirname(os.path.normpath(directory))
+
+    return {
+        key: {
+            "key": key,
+            "source": os.path.relpath(asset.path, root).replace(os.sep, "/"),
+            "etag": asset.md5,
+            "content_type": asset.content_type,
+            "content_encoding": asset.encoding,
+            "cache_control": asset.cache_control,
+        }
+        for key, asset in sorted(publish(manifest).items())
+    }
+
+
+def save_objects(path: str, generated: Dict[str, dict]) -> bool:
+    """
+    Write the generated objects to a JSON file.  The file is only rewritten if an object changed.
+    :param path: Location of the objects file.
+    :param generated: A dictionary of S3 keys to the arguments of their aws_s3_object resource.
+    :return: True if the file was written.
+    """
+    content = f"{json.dumps(generated, indent=2, sort_keys=True)}\n"
+
+    if os.path.exists(path):
+        with open(path) as file:
+            if file.read() == content:
+                return False
+
+    with open(path, "w") as file:
+        file.write(content)
+
+    return True
+
+
+def generate(
+    directory: str = ASSET_DIRECTORY,
+    output: str = OBJECTS_FILE,
+    cache_path: Optional[str] = HASH_CACHE,
+) -> Dict[str, dict]:
+    """
+    Regenerate the objects file and the asset-manifest.json key mapping from the asset directory, along with the
+    compressed copies Terraform uploads.  The mapping is written first, since it's uploaded as an object itself.
+    :param directory: The asset directory.
+    :param output: Location of the objects file.
+    :param cache_path: Location of the manifest's hash cache, or None to hash every file.
+    :return: A dictionary of S3 keys to the arguments of their aws_s3_object resource.
+    """
+    manifest = build_manifest(directory, cache_path, save_cache=True)
+    if save_key_mapping(directory, key_mapping(manifest)):
+        manifest = build_manifest(directory, cache_path, save_cache=True)
+
+    write_compressed(directory, manifest)
+    generated = objects(directory, manifest)
+    save_objects(output, generated)
+    return generated
+
+
+def handwritten_keys(terraform: str) -> Dict[str, str]:
+    """
+    Find the hand-written aws_s3_object resources in Terraform code.
+    :param terraform: Terraform code with one aws_s3_object resource per file.
+    :return: A dictionary of resource names to the asset path each one uploads.  Keys looked up in the
+    asset-manifest.json mapping (local.asset_keys["..."]) resolve to the asset path.
+    """
+    return {
+        name: HANDWRITTEN_KEY.search(body).group(1)
+        for name, body in HANDWRITTEN_RESOURCE.findall(terraform)
+    }
+
+
+def load_handwritten(path: str) -> Dict[str, str]:
+    """
+    Load hand-written aws_s3_object resources.
+    :param path: A Terraform file, or a JSON file of resource names to asset paths such as HANDWRITTEN_FILE.
+    :return: A dictionary of resource names to the asset path each one uploads.
+    """
+    with open(path) as file:
+        if path.endswith(".json"):
+            return json.load(file)
+
+        return handwritten_keys(file.read())
+
+
+def compare(generated: Dict[str, dict], handwritten: Dict[str, str]) -> KeyComparison:
+    """
+    Compare the generated objects to hand-written aws_s3_object resources.
+    :param generated: A dictionary of S3 keys to the arguments of their aws_s3_object resource.
+    :param handwritten: A dictionary of resource names to asset paths, as found by handwritten_keys().
+    :return: Asset paths which are only generated, and asset paths which are only hand-written.  Fingerprinted
+    copies are new objects without a hand-written resource, so they aren't compared.
+    """
+    keys = set(handwritten.values())
+    paths = {key for key in generated if not FINGERPRINTED.search(key)}
+    return KeyComparison(added=sorted(paths - keys), removed=sorted(keys - paths))
+
+
+def moved_blocks(generated: Dict[str, dict], handwritten: Dict[str, str]) -> str:
+    """
+    Create moved blocks which hand the hand-written resources' state over to the generated for_each resource, so
+    migrating doesn't delete and reupload every object.
+    :param generated: A dictionary of S3 keys to the arguments of their aws_s3_object resource.
+    :param handwritten: A dictionary of resource names to asset paths, as found by handwritten_keys().
+    :return: Terraform code with a moved block for each hand-written resource which is still generated under the
+    same S3 key.  State is never moved to an object with a different key, since Terraform would then delete the
+    existing object which published links point at.
+    """
+    return "\n".join(
+        f"moved {{\n"
+        f"  from = aws_s3_object.{name}\n"
+        f'  to   = {RESOURCE}["{key}"]\n'
+        f"}}\n"
+        for name, key in sorted(handwritten.items(), key=lambda item: item[1])
+        if key in generated and generated[key]["key"] == key
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate the S3 objects uploaded by jarombek-com-assets/main.tf."
+    )
+    parser.add_argument(
+        "--directory", default=ASSET_DIRECTORY, help="The local asset directory."
+    )
+    parser.add_argument(
+        "--output", default=OBJECTS_FILE, help="Location of the objects file."
+    )
+    parser.add_argument(
+        "--check",
+        metavar="HANDWRITTEN_FILE",
+        help="Compare the generated key set to the hand-written aws_s3_object resources in a Terraform or JSON file.",
+    )
+    parser.add_argument(
+        "--moved",
+        metavar="HANDWRITTEN_FILE",
+        help="Print moved blocks for the hand-written aws_s3_object resources in a Terraform or JSON file.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    generated = generate(args.directory, args.output)
+
+    if not (args.check or args.moved):
+        print(f"Generated {len(generated)} objects in {args.output}")
+        return 0
+
+    handwritten = load_handwritten(args.check or args.moved)
+
+    if args.moved:
+        print(moved_blocks(generated, handwritten), end="")
+        return 0
+
+    result = compare(generated, handwritten)
+    print(f"{len(generated)} generated, {len(handwritten)} hand-written")
+    for label, keys in (
+        ("Only generated", result.added),
+        ("Only hand-written", result.removed),
+    ):
+        print(f"{label}: {len(keys)}")
+        for key in keys:
+            print(f"  {key}")
+
+    return 0 if result.identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
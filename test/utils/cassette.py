@@ -0,0 +1,242 @@
+"""
+Record and replay boto3 API calls, so the test suites can run offline against a cassette of recorded responses.
+Responses are captured and served through botocore's event hooks, so no network requests are made in replay mode.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import base64
+import datetime
+import functools
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from botocore.response import StreamingBody
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Set by the runner while a cassette is replayed, since only boto3 API calls are served from the cassette.
+OFFLINE = threading.Event()
+
+
+class CassetteMissError(Exception):
+    """
+    Raised in replay mode when an API call was never recorded in the cassette.
+    """
+
+
+def encode(value: Any) -> Any:
+    """
+    Convert a parsed boto3 response into a value which can be serialized as JSON.  Types which JSON can't represent
+    are wrapped in a single key dictionary describing their type.
+    :param value: A boto3 response or a value nested within it.
+    :return: A JSON serializable version of the value.
+    """
+    if isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def decode(value: Any) -> Any:
+    """
+    Convert a value created by encode() back into the types boto3 returns.
+    :param value: A JSON deserialized value from a cassette.
+    :return: The value as it appeared in the original boto3 response.
+    """
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__datetime__" in value:
+        return datetime.datetime.fromisoformat(value["__datetime__"])
+    if "__bytes__" in value:
+        return base64.b64decode(value["__bytes__"])
+    if "__stream__" in value:
+        data = base64.b64decode(value["__stream__"])
+        return StreamingBody(io.BytesIO(data), len(data))
+    return {key: decode(item) for key, item in value.items()}
+
+
+def request_key(service: str, operation: str, params: dict) -> str:
+    """
+    Build the deterministic cassette key for an API call.  Parameters are serialized with sorted keys, so the same
+    call always maps to the same key regardless of argument order.
+    :param service: The name of the AWS service, such as 'acm'.
+    :param operation: The API operation name, such as 'ListCertificates'.
+    :param params: The parameters passed to the API operation.
+    :return: A key of the form 'service.Operation:digest'.
+    """
+    canonical = json.dumps(encode(params), sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+    return f"{service}.{operation}:{digest}"
+
+
+def requires_internet(test: Callable) -> Callable:
+    """
+    Skip a test which makes requests outside of boto3, such as to a website, when the run is offline.
+    :param test: The test method.
+    :return: The test method, which skips itself while OFFLINE is set.
+    """
+
+    @functools.wraps(test)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        if OFFLINE.is_set():
+            self.skipTest("Requests outside of boto3 aren't replayed from cassettes.")
+        return test(self, *args, **kwargs)
+
+    return wrapper
+
+
+class Cassette:
+    def __init__(self, path: str, mode: str) -> None:
+        """
+        Create a cassette which either records API responses to a file or replays them from it.
+        :param path: The cassette file.  Cassettes ending with '.gz' are gzip compressed.
+        :param mode: Either 'record' or 'replay'.
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.interactions: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        if mode == REPLAY:
+            self.load()
+
+    def load(self) -> None:
+        """
+        Read the recorded interactions from the cassette file.
+        """
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(self.path, "rt", encoding="utf-8") as file:
+            self.interactions = json.load(file)["interactions"]
+
+    def save(self) -> None:
+        """
+        Write the recorded interactions to the cassette file.  Keys are sorted and the gzip timestamp and filename
+        are fixed, so recording the same responses twice produces identical files.
+        """
+        with self._lock:
+            content = json.dumps(
+                {"version": 1, "interactions": self.interactions},
+                sort_keys=True,
+                separators=(",", ":"),
+            ).encode("utf-8")
+
+        if self.path.endswith(".gz"):
+            with open(self.path, "wb") as file:
+                with gzip.GzipFile(
+                    filename="", fileobj=file, mode="wb", mtime=0
+                ) as gzip_file:
+                    gzip_file.write(content)
+        else:
+            with open(self.path, "wb") as file:
+                file.write(content)
+
+    def install(self, session: Optional[boto3.session.Session] = None) -> None:
+        """
+        Register the cassette's event handlers with a boto3 session.  Clients must be created from the session
+        after the cassette is installed.
+        :param session: The session to hook into.  Defaults to boto3's default session, which is used by
+        boto3.client() and the aws_test_functions module.
+        """
+        if session is None:
+            if boto3.DEFAULT_SESSION is None:
+                boto3.setup_default_session()
+            session = boto3.DEFAULT_SESSION
+
+        events = session.events
+        events.register("before-parameter-build", self._tag_request)
+
+        if self.mode == RECORD:
+            events.register("needs-retry", self._capture)
+            events.register("after-call", self._record)
+        else:
+            events.register("before-call", self._replay)
+
+    def _tag_request(self, params: dict, model, context: dict, **kwargs) -> None:
+        """
+        Store the cassette key of an API call in its request context, while the parameters are still in the same
+        form they were passed to the client method.
+        """
+        service = model.service_model.service_name
+        context["cassette_key"] = request_key(service, model.name, params)
+
+    def _capture(self, response, request_dict: dict, **kwargs) -> None:
+        """
+        Encode the parsed response of each attempt at an API call sent over the network, before service specific
+        after-call handlers (such as the one decoding IAM policy documents) change it, since they run again on
+        replayed responses.
+        """
+        if response is not None:
+            request_dict["context"]["cassette_response"] = self._encode(*response)
+
+    def _record(self, http_response, parsed: dict, context: dict, **kwargs) -> None:
+        """
+        Save the response of the final attempt at an API call to the cassette.  Responses which never went over the
+        network, such as stubbed ones, are saved as the client returns them.
+        """
+        key = context.get("cassette_key")
+        if key is None:
+            return
+
+        interaction = context.get("cassette_response")
+        if interaction is None:
+            interaction = self._encode(http_response, parsed)
+
+        with self._lock:
+            self.interactions.setdefault(key, interaction)
+
+    @staticmethod
+    def _encode(http_response, parsed: dict) -> dict:
+        """
+        Encode a response as a cassette interaction.
+        """
+        response = {k: v for k, v in parsed.items() if k != "ResponseMetadata"}
+
+        for name, value in response.items():
+            if isinstance(value, StreamingBody):
+                # Streaming bodies can only be read once, so hand the caller a fresh copy of the data.
+                data = value.read()
+                parsed[name] = StreamingBody(io.BytesIO(data), len(data))
+                response[name] = {"__stream__": base64.b64encode(data).decode("ascii")}
+
+        return {"status": http_response.status_code, "response": encode(response)}
+
+    def _replay(self, model, context: dict, **kwargs) -> Tuple[AWSResponse, dict]:
+        """
+        Serve a recorded response in place of sending an API call over the network.
+        """
+        key = context.get("cassette_key")
+        interaction = self.interactions.get(key)
+
+        if interaction is None:
+            raise CassetteMissError(
+                f"No response for {model.service_model.service_name}.{model.name} (key {key}) was recorded "
+                f"in cassette {os.path.abspath(self.path)}.  Re-record the cassette with 'runner.py --record'."
+            )
+
+        status = interaction["status"]
+        parsed = decode(interaction["response"])
+        parsed["ResponseMetadata"] = {
+            "HTTPStatusCode": status,
+            "HTTPHeaders": {},
+            "RetryAttempts": 0,
+        }
+        return AWSResponse(f"cassette://{key}", status, {}, None), parsed
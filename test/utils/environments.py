@@ -0,0 +1,120 @@
+"""
+Environment parametrized test classes.  Suites which test both the production and development websites subclass
+EnvironmentTestCase and read the environment from self.env, so the runner can test every environment in one process.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import re
+import unittest
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utils.parallel import TimedTextTestResult, iter_tests
+
+ENVIRONMENTS = ("prod", "dev")
+
+DEFAULT_ENVIRONMENT = "prod"
+
+# Test IDs of environment variants end their class name with the environment, such as 'TestACM[dev]'.
+VARIANT_PATTERN = re.compile(r"\[(\w+)\]")
+
+
+class EnvironmentTestCase(unittest.TestCase):
+    """
+    Test case for infrastructure which exists once per environment.  Run directly, the tests run against production.
+    """
+
+    env = DEFAULT_ENVIRONMENT
+
+    @classmethod
+    def for_environment(cls, env: str) -> type:
+        """
+        Create a variant of the test class which runs against an environment.
+        :param env: The environment, either 'prod' or 'dev'.
+        :return: A subclass whose env attribute is the environment.  Each variant has its own class fixtures.
+        """
+        if env not in ENVIRONMENTS:
+            raise ValueError(f"Unknown environment: {env}")
+
+        return type(cls)(
+            f"{cls.__name__}[{env}]",
+            (cls,),
+            {
+                "env": env,
+                "__module__": cls.__module__,
+                "__qualname__": f"{cls.__qualname__}[{env}]",
+            },
+        )
+
+
+def with_environments(
+    suite: unittest.TestSuite, environments: Sequence[str]
+) -> unittest.TestSuite:
+    """
+    Replace every environment parametrized test in a suite with one test per environment.
+    :param suite: A test suite, typically created by TestLoader.discover().
+    :param environments: The environments to test.
+    :return: A flat test suite with the tests which aren't parametrized first, followed by the tests of each
+    environment in turn.
+    """
+    variants: Dict[Tuple[type, str], type] = {}
+    shared: List[unittest.TestCase] = []
+    per_environment: Dict[str, List[unittest.TestCase]] = {
+        env: [] for env in environments
+    }
+
+    for test in iter_tests(suite):
+        if not isinstance(test, EnvironmentTestCase):
+            shared.append(test)
+            continue
+
+        for env in environments:
+            key = (type(test), env)
+            if key not in variants:
+                variants[key] = type(test).for_environment(env)
+
+            per_environment[env].append(variants[key](test._testMethodName))
+
+    return unittest.TestSuite(
+        shared + [test for env in environments for test in per_environment[env]]
+    )
+
+
+def environment_of(description: str) -> Optional[str]:
+    """
+    Find the environment a test ran against from its ID or error description.
+    :param description: A test ID, or the description of a class fixture error.
+    :return: The environment, or None if the test isn't parametrized.
+    """
+    match = VARIANT_PATTERN.search(description)
+    return match.group(1) if match else None
+
+
+def environment_summary(
+    result: TimedTextTestResult, environments: Sequence[str]
+) -> str:
+    """
+    Summarize the outcome of each environment's tests.
+    :param result: The merged result of a test run.
+    :param environments: The environments which were tested.
+    :return: One line per environment with its test, failure, error, and skip counts.
+    """
+    counts = {env: [0, 0, 0, 0] for env in environments}
+    outcomes = [
+        ([test_id for test_id, _ in result.durations], 0),
+        ([str(test) for test, _ in result.failures], 1),
+        ([str(test) for test, _ in result.errors], 2),
+        ([str(test) for test, _ in result.skipped], 3),
+    ]
+
+    for descriptions, column in outcomes:
+        for description in descriptions:
+            env = environment_of(description)
+            if env in counts:
+                counts[env][column] += 1
+
+    width = max(len(env) for env in environments)
+    return "\n".join(
+        f"{env + ':':<{width + 1}} {tests} tests, {failures} failures, {errors} errors, {skipped} skipped"
+        for env, (tests, failures, errors, skipped) in counts.items()
+    )
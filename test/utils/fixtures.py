@@ -0,0 +1,126 @@
+"""
+Session scoped AWS fixtures shared by all the test suites.  Holds one boto3 client per service and memoizes
+read-only API responses, so a full test run makes each distinct API call only once.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import copy
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.client import BaseClient
+
+READ_ONLY_PREFIXES = ("describe_", "get_", "head_", "list_")
+
+CacheKey = Tuple[str, str, str]
+
+
+class AWS:
+    _clients: Dict[str, BaseClient] = {}
+    _responses: Dict[CacheKey, dict] = {}
+    _key_locks: Dict[CacheKey, threading.Lock] = {}
+    _lock = threading.Lock()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def client(cls, service: str) -> BaseClient:
+        """
+        Get the shared boto3 client for an AWS service, creating it on first use.
+        :param service: The name of the AWS service, such as 'acm' or 'route53'.
+        :return: A boto3 client for the service.
+        """
+        with cls._lock:
+            if service not in cls._clients:
+                # boto3's default session isn't thread safe, so clients are only created under the lock.
+                cls._clients[service] = boto3.client(service)
+
+            return cls._clients[service]
+
+    @classmethod
+    def call(cls, service: str, operation: str, **params: Any) -> dict:
+        """
+        Make a read-only AWS API call, returning a memoized response if the same call was made before.
+        :param service: The name of the AWS service, such as 'acm' or 'route53'.
+        :param operation: The boto3 client method name, such as 'list_certificates'.
+        :param params: Keyword arguments passed to the client method.
+        :return: A copy of the API response, so tests can't alter the cached version.
+        """
+        if not operation.startswith(READ_ONLY_PREFIXES):
+            raise ValueError(
+                f"Only read-only API calls can be memoized, {service}.{operation} is not allowed."
+            )
+
+        key = (service, operation, json.dumps(params, sort_keys=True, default=str))
+
+        with cls._lock:
+            key_lock = cls._key_locks.setdefault(key, threading.Lock())
+
+        # Concurrent callers for the same key wait on each other instead of making duplicate API calls.
+        with key_lock:
+            with cls._lock:
+                response = cls._responses.get(key)
+                if response is not None:
+                    cls.hits += 1
+
+            if response is None:
+                response = getattr(cls.client(service), operation)(**params)
+
+                with cls._lock:
+                    cls._responses[key] = response
+                    cls.misses += 1
+
+        return copy.deepcopy(response)
+
+    @classmethod
+    def invalidate(
+        cls, service: Optional[str] = None, operation: Optional[str] = None
+    ) -> int:
+        """
+        Remove memoized responses, forcing the next matching call to go back to AWS.  Use this after a test
+        changes the state of an AWS resource.
+        :param service: Only remove responses for this service.  Removes responses for all services if omitted.
+        :param operation: Only remove responses for this operation.  Removes responses for all operations if omitted.
+        :return: The number of responses removed.
+        """
+        with cls._lock:
+            keys = [
+                key
+                for key in cls._responses
+                if (service is None or key[0] == service)
+                and (operation is None or key[1] == operation)
+            ]
+
+            for key in keys:
+                del cls._responses[key]
+
+            return len(keys)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Discard all the shared clients, memoized responses, and cache statistics.
+        """
+        with cls._lock:
+            cls._clients.clear()
+            cls._responses.clear()
+            cls._key_locks.clear()
+            cls.hits = 0
+            cls.misses = 0
+
+    @classmethod
+    def stats(cls) -> str:
+        """
+        Summarize how effective the response cache was.
+        :return: A single line describing the cache hits and misses.
+        """
+        with cls._lock:
+            total = cls.hits + cls.misses
+            ratio = cls.hits / total if total else 0.0
+            return (
+                f"AWS response cache: {cls.hits} hits, {cls.misses} misses "
+                f"({ratio:.0%} hit ratio, {len(cls._clients)} clients)"
+            )
@@ -0,0 +1,86 @@
+"""
+Local HTTP stand-in for the asset.jarombek.com CloudFront distribution, so HTTP clients can be tested offline.  It
+serves a directory over HTTP/1.1 keep-alive connections from a background thread, with an optional simulated latency.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import functools
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.stand_in.connection_opened()
+
+    def send_head(self):
+        self.server.stand_in.request_received(self.path)
+        delay = self.server.stand_in.latency_for(self.path)
+        if delay:
+            time.sleep(delay)
+
+        return super().send_head()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class LocalHTTPServer:
+    def __init__(
+        self,
+        directory: str,
+        latency_ms: float = 0.0,
+        slow_paths: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Create a local HTTP server for a directory.  Use it as a context manager to start and stop it.
+        :param directory: The directory to serve.
+        :param latency_ms: Milliseconds to wait before answering every request.
+        :param slow_paths: Milliseconds to wait before answering requests for specific paths, such as
+        {'/jarombek.png': 500}, overriding latency_ms.
+        """
+        self.directory = directory
+        self.latency_ms = latency_ms
+        self.slow_paths = slow_paths or {}
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def request_received(self, path: str) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def latency_for(self, path: str) -> float:
+        return self.slow_paths.get(path, self.latency_ms) / 1000
+
+    def __enter__(self) -> "LocalHTTPServer":
+        handler = functools.partial(_Handler, directory=self.directory)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
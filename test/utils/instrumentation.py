@@ -0,0 +1,251 @@
+"""
+Instrument boto3 API calls made by the test suites, recording the count, latency, retries, and throttling of each
+(service, operation, test) combination.  Calls are measured through botocore's event hooks, so nothing is registered
+(and nothing is measured) unless instrumentation is installed.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import boto3
+
+OUTSIDE_TEST = "<outside test>"
+
+# Error codes AWS services use when a request is rate limited.
+THROTTLING_CODES = {
+    "BandwidthLimitExceeded",
+    "EC2ThrottledException",
+    "PriorRequestNotComplete",
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "SlowDown",
+    "ThrottledException",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+}
+
+CallKey = Tuple[str, str, str]
+
+_current = threading.local()
+
+
+def set_current_test(test_id: Optional[str]) -> None:
+    """
+    Attribute API calls made by the current thread to a test.  Called by the test runner when a test starts and stops.
+    :param test_id: The ID of the running test, or None once it stops.
+    """
+    _current.test_id = test_id
+
+
+def current_test() -> str:
+    return getattr(_current, "test_id", None) or OUTSIDE_TEST
+
+
+def is_throttled(response: Optional[dict]) -> bool:
+    """
+    Determine if a parsed API response is a throttling error.
+    """
+    return bool(response) and response.get("Error", {}).get("Code") in THROTTLING_CODES
+
+
+class CallStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.retries = 0
+        self.throttles = 0
+        self.errors = 0
+
+    def add(self, seconds: float, retries: int, throttles: int, error: bool) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.retries += retries
+        self.throttles += throttles
+        self.errors += int(error)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "seconds": round(self.seconds, 6),
+            "mean_seconds": round(self.seconds / self.count, 6) if self.count else 0.0,
+            "max_seconds": round(self.max_seconds, 6),
+            "retries": self.retries,
+            "throttles": self.throttles,
+            "errors": self.errors,
+        }
+
+
+class Instrumentation:
+    def __init__(self) -> None:
+        """
+        Create an empty set of API call statistics.
+        """
+        self.stats: Dict[CallKey, CallStats] = {}
+        self._lock = threading.Lock()
+
+    def install(self, session: Optional[boto3.session.Session] = None) -> None:
+        """
+        Register the instrumentation's event handlers with a boto3 session.  Clients must be created from the session
+        after the instrumentation is installed.
+        :param session: The session to hook into.  Defaults to boto3's default session, which is used by
+        boto3.client() and the aws_test_functions module.
+        """
+        if session is None:
+            if boto3.DEFAULT_SESSION is None:
+                boto3.setup_default_session()
+            session = boto3.DEFAULT_SESSION
+
+        events = session.events
+        events.register("before-parameter-build", self._start)
+        events.register("needs-retry", self._attempt)
+        events.register("after-call", self._finish)
+        events.register("after-call-error", self._fail)
+
+    def _start(self, model, context: dict, **kwargs) -> None:
+        """
+        Start timing an API call, before its parameters are validated and serialized.
+        """
+        context["instrumentation"] = {
+            "service": model.service_model.service_name,
+            "operation": model.name,
+            "start": time.perf_counter(),
+            "test": current_test(),
+            "throttles": 0,
+        }
+
+    def _attempt(self, request_dict: dict, response, **kwargs) -> None:
+        """
+        Count throttled attempts.  botocore asks whether every attempt needs a retry, including the last one.
+        """
+        call = request_dict.get("context", {}).get("instrumentation")
+        if call is not None and response is not None and is_throttled(response[1]):
+            call["throttles"] += 1
+
+    def _finish(self, parsed: dict, context: dict, **kwargs) -> None:
+        """
+        Record an API call which received a response, successful or not.
+        """
+        call = context.get("instrumentation")
+        if call is None:
+            return
+
+        throttles = call["throttles"]
+        if throttles == 0 and is_throttled(parsed):
+            # Responses which never reached the retry handler (such as stubbed or replayed ones) are counted here.
+            throttles = 1
+
+        self.record(
+            call["service"],
+            call["operation"],
+            call["test"],
+            time.perf_counter() - call["start"],
+            retries=parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0),
+            throttles=throttles,
+            error="Error" in parsed,
+        )
+
+    def _fail(self, exception: Exception, context: dict, **kwargs) -> None:
+        """
+        Record an API call which failed without a response, such as a connection error.
+        """
+        call = context.get("instrumentation")
+        if call is None:
+            return
+
+        self.record(
+            call["service"],
+            call["operation"],
+            call["test"],
+            time.perf_counter() - call["start"],
+            retries=0,
+            throttles=call["throttles"],
+            error=True,
+        )
+
+    def record(
+        self,
+        service: str,
+        operation: str,
+        test: str,
+        seconds: float,
+        retries: int = 0,
+        throttles: int = 0,
+        error: bool = False,
+    ) -> None:
+        """
+        Add a completed API call to the statistics.
+        """
+        with self._lock:
+            stats = self.stats.setdefault((service, operation, test), CallStats())
+            stats.add(seconds, retries, throttles, error)
+
+    def report(self) -> dict:
+        """
+        Summarize the recorded API calls.
+        :return: A JSON serializable report with one entry per (service, operation, test), slowest first, and
+        totals per (service, operation).
+        """
+        with self._lock:
+            calls = sorted(self.stats.items(), key=lambda item: -item[1].seconds)
+            totals: Dict[str, CallStats] = {}
+            for (service, operation, _), stats in calls:
+                total = totals.setdefault(f"{service}.{operation}", CallStats())
+                total.count += stats.count
+                total.seconds += stats.seconds
+                total.max_seconds = max(total.max_seconds, stats.max_seconds)
+                total.retries += stats.retries
+                total.throttles += stats.throttles
+                total.errors += stats.errors
+
+            return {
+                "calls": [
+                    {
+                        "service": service,
+                        "operation": operation,
+                        "test": test,
+                        **stats.to_dict(),
+                    }
+                    for (service, operation, test), stats in calls
+                ],
+                "operations": {
+                    name: stats.to_dict()
+                    for name, stats in sorted(
+                        totals.items(), key=lambda item: -item[1].seconds
+                    )
+                },
+            }
+
+    def save(self, path: str) -> None:
+        """
+        Write the report to a JSON file.
+        :param path: Location of the report.
+        """
+        with open(path, "w") as file:
+            json.dump(self.report(), file, indent=2)
+
+    def table(self, limit: int = 20) -> str:
+        """
+        Format the slowest API calls as a table.
+        :param limit: The maximum number of rows.
+        :return: A table of (service, operation, test) combinations sorted by total time spent.
+        """
+        calls: List[dict] = self.report()["calls"][:limit]
+        lines = [
+            f"{'Seconds':>9} {'Calls':>6} {'Max':>8} {'Retries':>8} {'Throttles':>10}  Operation / Test",
+        ]
+        lines.extend(
+            f"{call['seconds']:>9.3f} {call['count']:>6} {call['max_seconds']:>8.3f} "
+            f"{call['retries']:>8} {call['throttles']:>10}  "
+            f"{call['service']}.{call['operation']} / {call['test']}"
+            for call in calls
+        )
+        return "\n".join(lines)
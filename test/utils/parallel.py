@@ -0,0 +1,171 @@
+"""
+Test runner and result classes which execute the AWS test suites concurrently.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import io
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Tuple
+from unittest.runner import _WritelnDecorator
+
+from utils.instrumentation import set_current_test
+
+
+class TimedTextTestResult(unittest.TextTestResult):
+    """
+    Text test result which also records how long each individual test took to run.
+    """
+
+    def __init__(self, stream, descriptions, verbosity) -> None:
+        super().__init__(stream, descriptions, verbosity)
+        self.durations: List[Tuple[str, float]] = []
+        self._start_times: Dict[str, float] = {}
+
+    def startTest(self, test: unittest.TestCase) -> None:
+        self._start_times[test.id()] = time.perf_counter()
+        set_current_test(test.id())
+        super().startTest(test)
+
+    def stopTest(self, test: unittest.TestCase) -> None:
+        super().stopTest(test)
+        set_current_test(None)
+        start = self._start_times.pop(test.id(), None)
+        if start is not None:
+            self.durations.append((test.id(), time.perf_counter() - start))
+
+    @property
+    def summed_time(self) -> float:
+        """
+        The total time spent inside test bodies, regardless of how many ran at once.
+        """
+        return sum(duration for _, duration in self.durations)
+
+    def merge(self, other: "TimedTextTestResult") -> None:
+        """
+        Fold the outcome of a test result produced by a worker into this result.
+        :param other: A test result which ran a subset of the test suite.
+        """
+        self.testsRun += other.testsRun
+        self.errors.extend(other.errors)
+        self.failures.extend(other.failures)
+        self.skipped.extend(other.skipped)
+        self.expectedFailures.extend(other.expectedFailures)
+        self.unexpectedSuccesses.extend(other.unexpectedSuccesses)
+        self.durations.extend(other.durations)
+        self.shouldStop = self.shouldStop or other.shouldStop
+
+
+def iter_tests(suite: unittest.TestSuite) -> Iterator[unittest.TestCase]:
+    """
+    Flatten a (possibly nested) test suite into its individual test cases.
+    :param suite: A test suite, typically created by TestLoader.discover().
+    :return: A generator of test cases in the order they were discovered.
+    """
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
+def split_suite(
+    suite: unittest.TestSuite, granularity: str = "class"
+) -> List[unittest.TestSuite]:
+    """
+    Split a test suite into independent units of work which can run concurrently.
+    :param suite: The test suite to split.
+    :param granularity: 'class' to keep all the tests in a test class together (so class
+    level fixtures run once), or 'test' to run every test on its own.
+    :return: A list of test suites, one for each unit of work.
+    """
+    if granularity == "test":
+        return [unittest.TestSuite([test]) for test in iter_tests(suite)]
+
+    if granularity != "class":
+        raise ValueError(f"Unknown test granularity: {granularity}")
+
+    units: Dict[type, List[unittest.TestCase]] = {}
+    for test in iter_tests(suite):
+        units.setdefault(type(test), []).append(test)
+
+    return [unittest.TestSuite(tests) for tests in units.values()]
+
+
+class ParallelTextTestRunner(unittest.TextTestRunner):
+    """
+    Text test runner which fans test classes (or individual tests) out across a thread
+    pool.  Each unit of work writes to its own buffer, which is copied to the runner's
+    stream once the unit completes, so the log output of a test class stays together.
+    All the worker results are merged into a single TestResult.
+    """
+
+    resultclass = TimedTextTestResult
+
+    def __init__(
+        self, stream=None, workers: int = 1, granularity: str = "class", **kwargs
+    ):
+        super().__init__(stream, **kwargs)
+        self.workers = workers
+        self.granularity = granularity
+        self._output_lock = threading.Lock()
+
+    def run(self, test) -> TimedTextTestResult:
+        start = time.perf_counter()
+
+        if self.workers > 1:
+            result = super().run(lambda res: self._run_parallel(test, res))
+        else:
+            result = super().run(test)
+
+        wall_time = time.perf_counter() - start
+        summed_time = result.summed_time
+        speedup = summed_time / wall_time if wall_time > 0 else 1.0
+
+        self.stream.writeln(
+            f"Wall-clock time: {wall_time:.3f}s, summed test time: {summed_time:.3f}s "
+            f"({speedup:.2f}x speedup with {self.workers} worker(s))"
+        )
+        self.stream.flush()
+        return result
+
+    def _run_parallel(
+        self, test: unittest.TestSuite, result: TimedTextTestResult
+    ) -> None:
+        """
+        Run the units of a test suite on a thread pool, merging their results.
+        :param test: The full test suite.
+        :param result: The test result which every worker result is merged into.
+        """
+        units = split_suite(test, self.granularity)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self._run_unit, unit) for unit in units]
+
+            for future in as_completed(futures):
+                unit_result, output = future.result()
+
+                with self._output_lock:
+                    self.stream.write(output)
+                    self.stream.flush()
+                    result.merge(unit_result)
+
+    def _run_unit(self, unit: unittest.TestSuite) -> Tuple[TimedTextTestResult, str]:
+        """
+        Run a single unit of work with its own buffered test result.
+        :param unit: A test suite containing one test class or one test.
+        :return: The test result for the unit and the text it logged.
+        """
+        buffer = io.StringIO()
+        unit_result = self.resultclass(
+            _WritelnDecorator(buffer), self.descriptions, self.verbosity
+        )
+        unit_result.failfast = self.failfast
+        unit_result.buffer = self.buffer
+        unit_result.tb_locals = self.tb_locals
+
+        unit(unit_result)
+        return unit_result, buffer.getvalue()
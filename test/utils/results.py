@@ -0,0 +1,144 @@
+"""
+Structured per-test results of a test run, written as JUnit XML for CI tooling and as JSON with the duration of
+every test.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import json
+import re
+import unittest
+import xml.etree.ElementTree as ElementTree
+from typing import Dict, List, NamedTuple, Optional
+
+from utils.parallel import TimedTextTestResult
+
+PASSED = "passed"
+FAILED = "failed"
+ERRORED = "errored"
+SKIPPED = "skipped"
+
+# Errors in class and module fixtures are described like 'setUpClass (testACM.TestACM)'.
+FIXTURE_ERROR = re.compile(r"^(\w+) \((.+)\)$")
+
+
+class Record(NamedTuple):
+    test_id: str
+    outcome: str
+    seconds: float
+    message: Optional[str] = None
+
+    @property
+    def classname(self) -> str:
+        return self.test_id.rsplit(".", 1)[0]
+
+    @property
+    def name(self) -> str:
+        return self.test_id.rsplit(".", 1)[-1]
+
+
+def record_id(test: unittest.TestCase) -> str:
+    """
+    The ID a test is recorded under.  Subtests are folded into the test which ran them, and fixture errors are
+    named after the fixture, such as 'testACM.TestACM.setUpClass'.
+    """
+    name = getattr(test, "test_case", test).id()
+    fixture = FIXTURE_ERROR.match(name)
+    return f"{fixture.group(2)}.{fixture.group(1)}" if fixture else name
+
+
+def collect(result: TimedTextTestResult) -> List[Record]:
+    """
+    Collect the outcome and duration of every test in a test run.
+    :param result: The merged result of a test run.
+    :return: One record per test, in the order the tests finished.  A test with a failed subtest is failed, and
+    class fixture errors are recorded as errored tests named after the fixture.
+    """
+    outcomes: Dict[str, tuple] = {}
+    for outcome, tests in (
+        (SKIPPED, result.skipped),
+        (FAILED, result.failures),
+        (FAILED, result.unexpectedSuccesses),
+        (ERRORED, result.errors),
+    ):
+        for item in tests:
+            test, message = item if isinstance(item, tuple) else (item, None)
+            if outcome == FAILED and message is None:
+                message = "Unexpected success"
+            outcomes[record_id(test)] = (outcome, message)
+
+    durations = dict(result.durations)
+    recorded = []
+    for name, seconds in durations.items():
+        outcome, message = outcomes.get(name, (PASSED, None))
+        recorded.append(Record(name, outcome, seconds, message))
+
+    # Errors in class and module fixtures aren't reported as a test which started and stopped.
+    recorded.extend(
+        Record(name, outcome, 0.0, message)
+        for name, (outcome, message) in outcomes.items()
+        if name not in durations
+    )
+    return recorded
+
+
+def write_json(records: List[Record], path: str, **metadata) -> None:
+    """
+    Write test records to a JSON file.
+    :param records: The records of a test run.
+    :param path: The file to write.
+    :param metadata: Details of the run stored alongside the tests, such as the commit.
+    """
+    with open(path, "w") as file:
+        json.dump(
+            {**metadata, "tests": [record._asdict() for record in records]},
+            file,
+            indent=2,
+        )
+
+
+def write_junit(records: List[Record], path: str, name: str = "aws") -> None:
+    """
+    Write test records to a JUnit XML file, with a test suite for each test class.
+    :param records: The records of a test run.
+    :param path: The file to write.
+    :param name: The name of the run.
+    """
+    classes: Dict[str, List[Record]] = {}
+    for record in records:
+        classes.setdefault(record.classname, []).append(record)
+
+    root = ElementTree.Element("testsuites", name=name)
+    for classname, class_records in classes.items():
+        suite = ElementTree.SubElement(
+            root,
+            "testsuite",
+            name=classname,
+            tests=str(len(class_records)),
+            failures=str(sum(r.outcome == FAILED for r in class_records)),
+            errors=str(sum(r.outcome == ERRORED for r in class_records)),
+            skipped=str(sum(r.outcome == SKIPPED for r in class_records)),
+            time=f"{sum(r.seconds for r in class_records):.3f}",
+        )
+
+        for record in class_records:
+            case = ElementTree.SubElement(
+                suite,
+                "testcase",
+                classname=classname,
+                name=record.name,
+                time=f"{record.seconds:.3f}",
+            )
+            tag = {FAILED: "failure", ERRORED: "error", SKIPPED: "skipped"}.get(
+                record.outcome
+            )
+            if tag:
+                detail = ElementTree.SubElement(
+                    case, tag, message=(record.message or "").strip().split("\n")[-1]
+                )
+                if tag != "skipped":
+                    detail.text = record.message
+
+    root.set("tests", str(len(records)))
+    root.set("time", f"{sum(record.seconds for record in records):.3f}")
+    ElementTree.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
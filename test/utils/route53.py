@@ -0,0 +1,196 @@
+"""
+In-memory snapshot of a Route53 hosted zone.  The zone's record sets are listed once and indexed by name and type,
+so record assertions don't each make a Route53 API call (which are rate limited per account).
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from botocore.client import BaseClient
+
+from utils.fixtures import AWS
+
+RecordKey = Tuple[str, str]
+
+TERRAFORM_RECORD = re.compile(
+    r'resource "aws_route53_record" "[^"]+" \{\n(.*?)\n\}', re.DOTALL
+)
+
+
+class ExpectedRecord(NamedTuple):
+    name: str
+    type: str
+    values: Optional[List[str]] = None
+    ttl: Optional[int] = None
+    alias: Optional[str] = None
+
+
+def normalize(name: str) -> str:
+    """
+    Normalize a DNS name the way Route53 returns it, fully qualified and in lowercase.  Route53 escapes the
+    wildcard character as '\\052', which is converted back to '*'.
+    :param name: A DNS name, such as 'asset.jarombek.com' or '*.jarombek.com.'.
+    :return: The normalized DNS name, such as 'asset.jarombek.com.'.
+    """
+    name = name.replace("\\052", "*").lower()
+    return name if name.endswith(".") else f"{name}."
+
+
+class ZoneSnapshot:
+    def __init__(self, zone_name: str, record_sets: Iterable[dict]) -> None:
+        """
+        Index the record sets of a hosted zone.
+        :param zone_name: The name of the hosted zone, such as 'jarombek.com.'.
+        :param record_sets: Record sets from list_resource_record_sets.
+        """
+        self.zone_name = normalize(zone_name)
+        self.index: Dict[RecordKey, List[dict]] = {}
+
+        for record_set in record_sets:
+            key = (normalize(record_set["Name"]), record_set["Type"])
+            self.index.setdefault(key, []).append(record_set)
+
+    @classmethod
+    def load(
+        cls, zone_name: str, client: Optional[BaseClient] = None
+    ) -> "ZoneSnapshot":
+        """
+        List every record set in a public hosted zone, following pagination.
+        :param zone_name: The name of the hosted zone, such as 'jarombek.com.'.
+        :param client: The Route53 client to use.  Defaults to the shared client.
+        :return: A snapshot of the hosted zone.
+        """
+        client = client or AWS.client("route53")
+        zones = client.list_hosted_zones_by_name(DNSName=normalize(zone_name)).get(
+            "HostedZones"
+        )
+        zone = next(
+            zone
+            for zone in zones
+            if zone["Name"] == normalize(zone_name)
+            and not zone.get("Config", {}).get("PrivateZone")
+        )
+
+        paginator = client.get_paginator("list_resource_record_sets")
+        pages = paginator.paginate(HostedZoneId=zone["Id"])
+        return cls(
+            zone_name,
+            (record_set for page in pages for record_set in page["ResourceRecordSets"]),
+        )
+
+    def __len__(self) -> int:
+        return sum(len(record_sets) for record_sets in self.index.values())
+
+    def __contains__(self, key: RecordKey) -> bool:
+        name, record_type = key
+        return (normalize(name), record_type) in self.index
+
+    def get(self, name: str, record_type: str) -> Optional[dict]:
+        """
+        Find a record set in the snapshot.
+        :param name: The DNS name of the record, with or without a trailing dot.
+        :param record_type: The type of the record, such as 'A' or 'MX'.
+        :return: The record set, or None if it doesn't exist.  If several record sets share a name and type
+        (such as weighted records), the first one is returned.
+        """
+        record_sets = self.index.get((normalize(name), record_type))
+        return record_sets[0] if record_sets else None
+
+    def values(self, name: str, record_type: str) -> List[str]:
+        """
+        Get the values of a record set, such as the mail servers of an MX record.
+        :param name: The DNS name of the record, with or without a trailing dot.
+        :param record_type: The type of the record, such as 'A' or 'MX'.
+        :return: The record set's values, or an empty list if it doesn't exist or is an alias.
+        """
+        record_set = self.get(name, record_type) or {}
+        return [record["Value"] for record in record_set.get("ResourceRecords", [])]
+
+    def mismatches(self, expected: Iterable[ExpectedRecord]) -> List[str]:
+        """
+        Check a whole set of expected records against the snapshot in a single pass.
+        :param expected: The records which should exist.  Values are compared regardless of order, and a TTL or
+        alias target of None isn't checked.
+        :return: A description of every expected record which is missing or differs, or an empty list.
+        """
+        problems = []
+        for record in expected:
+            label = f"{normalize(record.name)} {record.type}"
+            record_set = self.get(record.name, record.type)
+
+            if record_set is None:
+                problems.append(f"{label}: missing")
+                continue
+
+            if record.values is not None:
+                actual = sorted(self.values(record.name, record.type))
+                if actual != sorted(record.values):
+                    problems.append(
+                        f"{label}: values {actual} != {sorted(record.values)}"
+                    )
+
+            if record.ttl is not None and record_set.get("TTL") != record.ttl:
+                problems.append(f"{label}: TTL {record_set.get('TTL')} != {record.ttl}")
+
+            if record.alias is not None:
+                target = record_set.get("AliasTarget", {}).get("DNSName")
+                if target is None or normalize(target) != normalize(record.alias):
+                    problems.append(f"{label}: alias {target} != {record.alias}")
+
+        return problems
+
+
+_snapshots: Dict[str, ZoneSnapshot] = {}
+_lock = threading.Lock()
+
+
+def snapshot(zone_name: str) -> ZoneSnapshot:
+    """
+    Get the session scoped snapshot of a hosted zone, listing its records on first use.
+    :param zone_name: The name of the hosted zone, such as 'jarombek.com.'.
+    :return: A snapshot shared by every test in the session.
+    """
+    with _lock:
+        name = normalize(zone_name)
+        if name not in _snapshots:
+            _snapshots[name] = ZoneSnapshot.load(name)
+
+        return _snapshots[name]
+
+
+def terraform_records(terraform: str) -> List[ExpectedRecord]:
+    """
+    Find the aws_route53_record resources with literal names and values in Terraform code, such as the MX record in
+    route53/main.tf, so they can be checked against a snapshot.
+    :param terraform: Terraform code.
+    :return: The records declared by the Terraform code.  Records whose name or type aren't string literals are
+    skipped.
+    """
+    records = []
+    for body in TERRAFORM_RECORD.findall(terraform):
+        name = re.search(r'^\s*name\s*=\s*"([^"$]+)"\s*$', body, re.MULTILINE)
+        record_type = re.search(r'^\s*type\s*=\s*"([^"$]+)"\s*$', body, re.MULTILINE)
+        if name is None or record_type is None:
+            continue
+
+        ttl = re.search(r"^\s*ttl\s*=\s*(\d+)\s*$", body, re.MULTILINE)
+        values = re.search(
+            r"^\s*records\s*=\s*\[(.*?)\]", body, re.MULTILINE | re.DOTALL
+        )
+
+        literals = re.findall(r'"([^"]*)"', values.group(1)) if values else []
+        interpolated = values is None or "${" in values.group(1)
+
+        records.append(
+            ExpectedRecord(
+                name=name.group(1),
+                type=record_type.group(1),
+                values=None if interpolated else literals,
+                ttl=int(ttl.group(1)) if ttl else None,
+            )
+        )
+
+    return records
@@ -0,0 +1,69 @@
+"""
+Streaming helpers for listing the objects in an S3 bucket.  Objects are fetched lazily one page at a time with the
+list_objects_v2 paginator, so callers which only need the first few keys never download the whole listing.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+from typing import Iterator, Optional
+
+from botocore.client import BaseClient
+
+from utils.fixtures import AWS
+
+
+def iter_objects(
+    bucket: str,
+    prefix: str = "",
+    page_size: int = 1000,
+    client: Optional[BaseClient] = None,
+) -> Iterator[dict]:
+    """
+    Lazily iterate over the objects in an S3 bucket.  The next page of results is only requested once the
+    objects in the previous page have been consumed.
+    :param bucket: The name of the S3 bucket.
+    :param prefix: Only list objects with keys starting with this prefix, such as 'posts/'.
+    :param page_size: The maximum number of objects requested per API call (at most 1000).
+    :param client: The S3 client to use.  Defaults to the shared S3 client.
+    :return: A generator of object summaries, as returned in the 'Contents' of list_objects_v2.
+    """
+    client = client or AWS.client("s3")
+    paginator = client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": page_size}
+    )
+
+    for page in pages:
+        yield from page.get("Contents", [])
+
+
+def iter_keys(
+    bucket: str,
+    prefix: str = "",
+    page_size: int = 1000,
+    client: Optional[BaseClient] = None,
+) -> Iterator[str]:
+    """
+    Lazily iterate over the object keys in an S3 bucket.
+    :param bucket: The name of the S3 bucket.
+    :param prefix: Only list keys starting with this prefix, such as 'fonts/'.
+    :param page_size: The maximum number of keys requested per API call (at most 1000).
+    :param client: The S3 client to use.  Defaults to the shared S3 client.
+    :return: A generator of object keys in lexicographical order.
+    """
+    for obj in iter_objects(bucket, prefix, page_size, client):
+        yield obj["Key"]
+
+
+def any_keys(
+    bucket: str, prefix: str = "", client: Optional[BaseClient] = None
+) -> bool:
+    """
+    Determine if an S3 bucket contains at least one object, using a single one key API call regardless of how
+    large the bucket is.
+    :param bucket: The name of the S3 bucket.
+    :param prefix: Only consider keys starting with this prefix, such as 'logos/'.
+    :param client: The S3 client to use.  Defaults to the shared S3 client.
+    :return: True if a matching key exists, False otherwise.
+    """
+    return next(iter_keys(bucket, prefix, page_size=1, client=client), None) is not None
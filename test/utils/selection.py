@@ -0,0 +1,173 @@
+"""
+Change-aware selection of test suites.  The Terraform modules each suite covers are declared in COVERAGE, and changes
+to the Python test code select every suite which imports the changed module, so a push only runs the suites for
+the infrastructure and tooling it touched.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import ast
+import os
+import subprocess
+from typing import Dict, Iterable, List, Optional, Set
+
+TEST_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPOSITORY = os.path.dirname(TEST_DIRECTORY)
+SUITES_DIRECTORY = os.path.join(TEST_DIRECTORY, "suites")
+
+# moto patches botocore for the whole process rather than one thread, so suites which use it are kept apart from the
+# live suites and run serially in a separate run.
+MOTO_SUITES_DIRECTORY = os.path.join(TEST_DIRECTORY, "moto_suites")
+
+# The test suites covering each Terraform module directory, in either suites directory.  Every suite must appear here
+# or in HARNESS_SUITES.
+COVERAGE: Dict[str, List[str]] = {
+    "acm": ["testACM", "testJarombekCom"],
+    "dynamodb": ["testFanout", "testSubscribers"],
+    "jarombek-com-assets": [
+        "testAccessLogs",
+        "testAssetCompress",
+        "testAssetManifest",
+        "testAssetOptimize",
+        "testAssetProbe",
+        "testAssetSync",
+        "testCachePolicy",
+        "testInvalidate",
+        "testJarombekComAssets",
+        "testS3Listing",
+        "testTerraformObjects",
+    ],
+    "jarombek-com-fn": ["testFanout", "testIAM"],
+    "jarombek-com-kubernetes": ["testJarombekCom", "testLoadTest"],
+    "jarombek-com-kubernetes-ingress": ["testJarombekCom"],
+    "route53": ["testJarombekCom", "testRoute53", "testRoute53Snapshot"],
+}
+
+# Suites for the test harness itself, which are only selected when the code they import changes.
+HARNESS_SUITES = {
+    "testCassette",
+    "testEnvironments",
+    "testHistory",
+    "testInstrumentation",
+    "testSelection",
+}
+
+# Changes to these files can affect any suite.
+RUN_ALL = {
+    ".github/workflows/aws_tests.yml",
+    "test/Pipfile",
+    "test/Pipfile.lock",
+    "test/runner.py",
+}
+
+# Documentation never affects a test run.
+IGNORED_EXTENSIONS = (".md",)
+
+# Packages of the test directory whose modules are imported by suites.
+PACKAGES = ("tools", "utils")
+
+
+def suite_names(directory: str = SUITES_DIRECTORY) -> List[str]:
+    """
+    The module names of the test suites, such as 'testACM'.
+    """
+    return sorted(
+        name[:-3]
+        for name in os.listdir(directory)
+        if name.startswith("test") and name.endswith(".py")
+    )
+
+
+def local_imports(path: str) -> Set[str]:
+    """
+    Find the modules of the test directory's packages which a Python file imports.
+    :param path: Path to the Python file.
+    :return: Paths of the imported modules relative to the repository, such as 'test/tools/manifest.py'.
+    """
+    with open(path) as file:
+        tree = ast.parse(file.read(), path)
+
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            modules.add(node.module)
+
+    return {
+        f"test/{module.replace('.', '/')}.py"
+        for module in modules
+        if module.split(".")[0] in PACKAGES
+        and os.path.exists(
+            os.path.join(TEST_DIRECTORY, f"{module.replace('.', '/')}.py")
+        )
+    }
+
+
+def dependencies(path: str, seen: Optional[Set[str]] = None) -> Set[str]:
+    """
+    Every module of the test directory's packages which a Python file imports, directly or transitively.
+    :param path: Path to the Python file relative to the repository, such as 'test/suites/testACM.py'.
+    """
+    seen = set() if seen is None else seen
+    for module in local_imports(os.path.join(REPOSITORY, path)):
+        if module not in seen:
+            seen.add(module)
+            dependencies(module, seen)
+
+    return seen
+
+
+def affected_suites(
+    changed: Iterable[str], directory: str = SUITES_DIRECTORY
+) -> Optional[Set[str]]:
+    """
+    Determine which test suites a set of changed files affects.
+    :param changed: Paths of the changed files relative to the repository.
+    :param directory: The suites directory to select from.
+    :return: The names of the affected suites in the directory, or None if every suite should run.
+    """
+    relative = os.path.relpath(directory, REPOSITORY).replace(os.sep, "/")
+    suites = suite_names(directory)
+    imports = {suite: dependencies(f"{relative}/{suite}.py") for suite in suites}
+    harness = dependencies("test/runner.py")
+    selected: Set[str] = set()
+
+    for path in changed:
+        if path.endswith(IGNORED_EXTENSIONS):
+            continue
+        if path in RUN_ALL or path in harness:
+            return None
+
+        module = path.split("/")[0]
+        if module in COVERAGE:
+            selected.update(suite for suite in COVERAGE[module] if suite in suites)
+        elif path.startswith(f"{relative}/"):
+            name = os.path.splitext(os.path.basename(path))[0]
+            selected.update([name] if name in suites else [])
+        else:
+            selected.update(suite for suite in suites if path in imports[suite])
+
+    return selected
+
+
+def changed_files(ref: str, repository: str = REPOSITORY) -> Optional[List[str]]:
+    """
+    List the files changed since a git revision, such as the commit a push or pull request is based on.
+    :param ref: The base git revision.
+    :param repository: The git repository.
+    :return: Paths relative to the repository, or None if the revision can't be compared, such as the all zero
+    revision GitHub uses for the first push of a branch.
+    """
+    try:
+        output = subprocess.run(
+            ["git", "diff", "--name-only", f"{ref}...HEAD"],
+            cwd=repository,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+    return [line for line in output.splitlines() if line]
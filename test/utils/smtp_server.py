@@ -0,0 +1,171 @@
+"""
+Local SMTP sink which stands in for the email provider in offline tests.  It accepts messages over SMTP from a
+background thread and keeps them in memory instead of delivering them.  Recipients can be configured to be rejected
+permanently or temporarily, and every message can be delayed to simulate a slow provider.
+Author: Andrew Jarombek
+Date: 10/18/2026
+"""
+
+import email
+import socketserver
+import threading
+import time
+from email.message import Message
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+
+class ReceivedMessage(NamedTuple):
+    sender: str
+    recipients: List[str]
+    message: Message
+
+
+def _address(argument: str) -> str:
+    """
+    Extract the address from a MAIL FROM or RCPT TO argument, such as 'TO:<andrew@jarombek.com>'.
+    """
+    address = argument.split(":", 1)[1].strip()
+    return address.split()[0].strip("<>") if address else ""
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        sink: LocalSMTPServer = self.server.sink
+        sink.connection_opened()
+        self.reply("220 localhost SMTP sink")
+
+        sender: Optional[str] = None
+        recipients: List[str] = []
+
+        for raw in self.rfile:
+            line = raw.decode().rstrip("\r\n")
+            command, _, argument = line.partition(" ")
+            command = command.upper()
+
+            if command in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif command == "MAIL":
+                sender, recipients = _address(argument), []
+                self.reply("250 OK")
+            elif command == "RCPT":
+                recipient = _address(argument)
+                response = sink.recipient_response(recipient)
+                if response.startswith("250"):
+                    recipients.append(recipient)
+                self.reply(response)
+            elif command == "DATA":
+                if not recipients:
+                    self.reply("503 No valid recipients")
+                    continue
+
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = self.read_data()
+                sink.message_received(ReceivedMessage(sender, recipients, data))
+                sender, recipients = None, []
+                self.reply("250 OK")
+            elif command == "RSET":
+                sender, recipients = None, []
+                self.reply("250 OK")
+            elif command == "NOOP":
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+    def read_data(self) -> Message:
+        lines = []
+        for raw in self.rfile:
+            if raw in (b".\r\n", b".\n"):
+                break
+
+            # Undo the dot stuffing of lines which start with a period.
+            lines.append(raw[1:] if raw.startswith(b"..") else raw)
+
+        return email.message_from_bytes(b"".join(lines))
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class LocalSMTPServer:
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        rejected: Iterable[str] = (),
+        deferred: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Create a local SMTP sink.  Use it as a context manager to start and stop it.
+        :param latency_ms: Milliseconds to wait before accepting each message.
+        :param rejected: Recipients which are permanently rejected with a 550 response.
+        :param deferred: The number of times each recipient is temporarily rejected with a 451 response before it's
+        accepted, such as {'andrew@jarombek.com': 2}.
+        """
+        self.latency_ms = latency_ms
+        self.rejected = set(rejected)
+        self.deferred = dict(deferred or {})
+        self.messages: List[ReceivedMessage] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def recipient_response(self, recipient: str) -> str:
+        with self._lock:
+            if recipient in self.rejected:
+                return "550 No such user"
+            if self.deferred.get(recipient, 0) > 0:
+                self.deferred[recipient] -= 1
+                return "451 Try again later"
+
+        return "250 OK"
+
+    def message_received(self, message: ReceivedMessage) -> None:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        with self._lock:
+            self.messages.append(message)
+
+    def recipients(self) -> List[str]:
+        """
+        Every recipient of every accepted message, in the order they were accepted.
+        """
+        with self._lock:
+            return [
+                recipient
+                for message in self.messages
+                for recipient in message.recipients
+            ]
+
+    def __enter__(self) -> "LocalSMTPServer":
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.sink = self
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()